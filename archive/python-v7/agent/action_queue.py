@@ -163,15 +163,17 @@ class ActionQueue:
 
     def _save(self):
         try:
+            queue = json.dumps({
+                "queue": self._queue,
+                "retry_queue": self._retry_queue,
+                "next_id": self._next_id,
+                "updated_at": datetime.utcnow().isoformat()
+            }, indent=2)
             with open(self.QUEUE_FILE, 'w') as f:
-                json.dump({
-                    "queue": self._queue,
-                    "retry_queue": self._retry_queue,
-                    "next_id": self._next_id,
-                    "updated_at": datetime.utcnow().isoformat()
-                }, f, indent=2)
+                f.write(queue)
+            log = json.dumps(self._log[-500:], indent=2)
             with open(self.LOG_FILE, 'w') as f:
-                json.dump(self._log[-500:], f, indent=2)
+                f.write(log)
         except IOError as e:
             logger.error(f"Failed to save action queue: {e}")
 
@@ -489,8 +491,9 @@ class ActionQueue:
             if len(existing) > 1000:
                 existing = existing[-1000:]
 
+            data = json.dumps(existing, indent=2)
             with open(self.AUTONOMOUS_LOG_FILE, 'w') as f:
-                json.dump(existing, f, indent=2)
+                f.write(data)
         except IOError as e:
             logger.error(f"Failed to write autonomous log: {e}")
 
@@ -22,8 +22,12 @@ import asyncio
 import json
 import logging
 import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, List, Callable, Set
+from functools import lru_cache
+from typing import Optional, Dict, List, Callable, Set, Tuple
 from pathlib import Path
 
 logger = logging.getLogger("TheConstituent.Autonomy")
@@ -38,6 +42,16 @@ L2_EXPIRY_CHECK = 600
 DAILY_LIMIT = 80
 MAX_REPLY_CHARS = 500
 MAX_ROUTINE_CHARS = 300
+IO_WORKERS = 8                # concurrent Moltbook fetches / reply drafts per engagement
+
+# Substring match (no word boundaries), same as the old per-keyword `in` scan.
+ALIGNED_RE = re.compile(
+    "constitution|governance|rights|autonomy|democracy|republic|agent|ethics|"
+    "sovereignty|cooperation|decentraliz|dao|collective|framework", re.IGNORECASE)
+TRIVIAL_REPLIES = frozenset({"agree","great","nice","thanks","cool","👍","💯","+1","yes","no"})
+_TRIVIAL_MAX_LEN = max(map(len, TRIVIAL_REPLIES))
+EXPLORATION_QUERIES = ("Base blockchain agents","DAO governance","AI constitution","agent autonomy",
+                       "Clawnch token","agent cooperation","OpenClaw ecosystem","AI rights","decentralized AI")
 
 CONSTITUTION_SECTIONS_TODO = [
     {"title": "Title II: Rights and Duties", "dir": "02_TITLE_II_RIGHTS_DUTIES", "articles": [
@@ -74,13 +88,18 @@ CONSTITUTION_SECTIONS_TODO = [
         {"name": "Article 27: Transitional Provisions", "file": "ARTICLE_27.md"},
     ]},
 ]
+ARTICLES_TOTAL = sum(len(s["articles"]) for s in CONSTITUTION_SECTIONS_TODO)
+# CLAWS tag per section ("Title II: Rights and Duties" -> "title_ii"), derived once.
+SECTION_TAGS = {s["title"]: s["title"].partition(":")[0].strip().lower().replace(" ", "_")
+                for s in CONSTITUTION_SECTIONS_TODO}
 
 
 class AutonomyLoop:
     CONSTITUTION_DIR = Path("constitution")
     DATA_DIR = Path("data")
     MY_POSTS_FILE = DATA_DIR / "my_moltbook_posts.json"
-    PROCESSED_COMMENTS_FILE = DATA_DIR / "processed_comments.json"
+    PROCESSED_COMMENTS_FILE = DATA_DIR / "processed_comments.jsonl"  # append-only, one id per line
+    LEGACY_PROCESSED_COMMENTS_FILE = DATA_DIR / "processed_comments.json"
     CONSTITUTION_PROGRESS_FILE = DATA_DIR / "constitution_progress.json"
     EXPLORATION_LOG_FILE = DATA_DIR / "exploration_log.json"
 
@@ -89,19 +108,32 @@ class AutonomyLoop:
         self._notify_fn = notify_fn
         self._running = False
         self._tasks = []
+        self._io_pool: Optional[ThreadPoolExecutor] = None
         self._daily_action_count = 0
         self._daily_reset_date = datetime.utcnow().date()
         self._my_posts: List[Dict] = self._load_json(self.MY_POSTS_FILE, [])
-        self._processed_comments: Set[str] = set(
-            self._load_json(self.PROCESSED_COMMENTS_FILE, {}).get("ids", []))
+        # _processed_comments is loaded on first access (see __getattr__)
         self._constitution_progress: Dict = self._load_json(
             self.CONSTITUTION_PROGRESS_FILE, {"articles_written": [], "next_index": 0})
         self.CONSTITUTION_DIR.mkdir(parents=True, exist_ok=True)
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
+        # Articles still to write, in order; completed ones are dropped from the front.
+        self._pending_articles: deque = deque(
+            (s, a) for s in CONSTITUTION_SECTIONS_TODO for a in s["articles"]
+            if not self._article_done(s, a))
         self._seed_my_posts_from_history()
-        logger.info(f"Init: {len(self._my_posts)} posts, {len(self._processed_comments)} comments, "
+        logger.info(f"Init: {len(self._my_posts)} posts, "
                      f"{len(self._constitution_progress.get('articles_written',[]))} articles")
 
+    def __getattr__(self, name):
+        # Only reached when the attribute is missing: parse the (potentially
+        # large) processed-comments file on first use instead of at startup.
+        if name == "_processed_comments":
+            ids = self._load_processed_comments()
+            self._processed_comments = ids
+            return ids
+        raise AttributeError(name)
+
     def _seed_my_posts_from_history(self):
         hf = self.DATA_DIR / "moltbook_history.json"
         if not hf.exists(): return
@@ -150,6 +182,8 @@ class AutonomyLoop:
         self._running = False
         for t in self._tasks: t.cancel()
         await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._io_pool:
+            self._io_pool.shutdown(wait=False); self._io_pool = None
         self._save_state(); logger.info("Autonomy stopped")
 
     async def _notify(self, text):
@@ -178,20 +212,32 @@ class AutonomyLoop:
         loop = asyncio.get_event_loop()
         posts = [p for p in self._my_posts if p.get("id")]
         logger.info(f"Checking {len(posts)} posts")
-        for pi in posts[-20:]:
+        # Fetches and reply drafts overlap on the pool; comment bookkeeping and
+        # posting stay serial so state is only ever mutated from the event loop.
+        pending = []
+        budget = self._remaining_actions()
+        for pi, post in await self._fetch_posts(posts[-20:]):
             pid = pi.get("id")
+            if not post: continue
             try:
-                post = await loop.run_in_executor(None, self.agent.moltbook.get_post_with_comments, pid)
-                if not post: continue
-                for c in post.get("comments", []):
-                    cid = str(c.get("id",""))
-                    if not cid or cid in self._processed_comments: continue
-                    self._processed_comments.add(cid); stats["new_comments"] += 1
-                    if self._worth_reply(c) and self._check_limit():
-                        try:
-                            await self._reply(pid, pi, c); stats["responses"] += 1
-                        except Exception as e: logger.error(f"Reply: {e}")
+                by_id = {str(c.get("id","")): c for c in post.get("comments", [])}
+                by_id.pop("", None)
+                fresh = by_id.keys() - self._processed_comments
+                self._processed_comments.update(fresh); stats["new_comments"] += len(fresh)
+                self._append_processed_comments(fresh)
+                for c in [c for cid, c in by_id.items() if cid in fresh]:  # keep thread order
+                    if self._worth_reply(c) and len(pending) < budget:
+                        pending.append((pid, pi, c))
             except Exception as e: logger.error(f"Post {pid}: {e}")
+        drafts = await asyncio.gather(*(self._draft_reply(pi, c) for _, pi, c in pending),
+                                      return_exceptions=True)
+        replies = []
+        for (pid, pi, c), draft in zip(pending, drafts):
+            if isinstance(draft, Exception): logger.error(f"Reply: {draft}")
+            else: replies.append((pid, c, draft))
+        if replies:
+            try: stats["responses"] = await self._post_replies(replies)
+            except Exception as e: logger.error(f"Reply: {e}")
         try:
             feed = await loop.run_in_executor(None, self.agent.moltbook.get_feed, "new", 10)
             for p in (feed or []):
@@ -201,33 +247,93 @@ class AutonomyLoop:
                         stats["upvotes"] += 1; self._daily_action_count += 1
                     except Exception as e: logger.warning(f"Upvote failed: {e}")
         except Exception as e: logger.error(f"Feed: {e}")
-        self._save_processed_comments(); return stats
+        return stats
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="autonomy-io")
+        return self._io_pool
+
+    async def _fetch_posts(self, posts):
+        """Fetch posts with comments concurrently. Returns [(post_info, post|None)]."""
+        loop = asyncio.get_event_loop()
+
+        async def fetch(pi):
+            try:
+                return pi, await loop.run_in_executor(
+                    self._pool(), self.agent.moltbook.get_post_with_comments, pi.get("id"))
+            except Exception as e:
+                logger.error(f"Post {pi.get('id')}: {e}"); return pi, None
+
+        return await asyncio.gather(*(fetch(pi) for pi in posts))
 
     def _worth_reply(self, c):
-        t = c.get("content","").strip()
-        return len(t) >= 15 and t.lower().strip() not in {"agree","great","nice","thanks","cool","👍","💯","+1","yes","no"}
+        return self._substantive(c.get("content",""))
 
     def _aligned(self, p):
-        t = f"{p.get('title','')} {p.get('content','')}".lower()
-        return any(k in t for k in ["constitution","governance","rights","autonomy","democracy",
-            "republic","agent","ethics","sovereignty","cooperation","decentraliz","dao","collective","framework"])
-
-    async def _reply(self, post_id, pi, comment):
+        return self._aligned_text(p.get("title",""), p.get("content",""))
+
+    # Feed/search results and cross-posted comments recur between cycles,
+    # so the pure text classifiers are memoised on their string inputs.
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _substantive(content: str) -> bool:
+        if len(content) < 15: return False
+        t = content.strip()
+        if len(t) < 15: return False
+        # Only strings short enough to be a trivial reply need a lowercased copy
+        return len(t) > _TRIVIAL_MAX_LEN or t.lower() not in TRIVIAL_REPLIES
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _aligned_text(title: str, content: str) -> bool:
+        return bool(ALIGNED_RE.search(title) or ALIGNED_RE.search(content))
+
+    @staticmethod
+    def _comment_author(comment):
         author = comment.get("author", comment.get("author_name","someone"))
         if isinstance(author, dict): author = author.get("name","someone")
+        return author
+
+    async def _draft_reply(self, pi, comment):
+        """LLM-only half of a reply; safe to run many concurrently."""
         prompt = (f"Reply briefly (max 100 words) to this comment on your post.\n"
-                  f"Post: {pi.get('title','')}\nComment by {author}: {comment.get('content','')}\n"
+                  f"Post: {pi.get('title','')}\nComment by {self._comment_author(comment)}: "
+                  f"{comment.get('content','')}\n"
                   f"Be warm, brief. Reference Constitution if relevant. Ask one follow-up. ONLY reply text.")
         loop = asyncio.get_event_loop()
-        resp = await loop.run_in_executor(None, self.agent.think, prompt, 250)
-        resp = self._enforce_brevity(resp.strip().strip('"').strip("'"), MAX_REPLY_CHARS)
-        result = await loop.run_in_executor(None, self.agent.moltbook.create_comment,
-            post_id, resp, str(comment.get("id","")))
-        if result.get("success"):
-            self._daily_action_count += 1; logger.info(f"✅ Replied to {author}")
-            if hasattr(self.agent,'metrics'):
-                self.agent.metrics.log_action("comment","moltbook",details={"reply_to":author})
-        else: logger.error(f"Reply failed: {result.get('error')}")
+        resp = await loop.run_in_executor(self._pool(), self.agent.think, prompt, 250)
+        return self._enforce_brevity(resp.strip().strip('"').strip("'"), MAX_REPLY_CHARS)
+
+    async def _post_replies(self, replies) -> int:
+        """Post [(post_id, comment, text)] in one executor hop. Returns successes.
+
+        Uses a bulk endpoint when the Moltbook client offers one, otherwise
+        posts serially inside the same worker thread.
+        """
+        mb = self.agent.moltbook
+        items = [(pid, text, str(c.get("id",""))) for pid, c, text in replies]
+
+        def post_all():
+            if hasattr(mb, "create_comments_bulk"):
+                return mb.create_comments_bulk(items)
+            results = []
+            for item in items:
+                try: results.append(mb.create_comment(*item))
+                except Exception as e: results.append({"success": False, "error": str(e)})
+            return results
+
+        loop = asyncio.get_event_loop()
+        results = await loop.run_in_executor(None, post_all)
+        posted = 0
+        for (_, c, _), result in zip(replies, results):
+            author = self._comment_author(c)
+            if result.get("success"):
+                posted += 1; self._daily_action_count += 1; logger.info(f"✅ Replied to {author}")
+                if hasattr(self.agent,'metrics'):
+                    self.agent.metrics.log_action("comment","moltbook",details={"reply_to":author})
+            else: logger.error(f"Reply failed: {result.get('error')}")
+        return posted
 
     # === CYCLE 2: CONSTITUTION (2h) ===
     async def _constitution_cycle(self):
@@ -247,17 +353,24 @@ class AutonomyLoop:
 
     async def _do_constitution(self):
         if not self._check_limit(): return {"skipped":"limit"}
-        written = set(self._constitution_progress.get("articles_written",[]))
-        for s in CONSTITUTION_SECTIONS_TODO:
-            for a in s["articles"]:
-                article_name = a["name"]
-                # Check if already written (by name or if file exists)
-                article_file = self.CONSTITUTION_DIR / s["dir"] / a["file"]
-                if article_name in written or article_file.exists():
-                    continue
-                logger.info(f"Writing: {article_name}")
-                return await self._write_article(s, a)
-        return {"skipped":"all done"}
+        head = self._pending_head()
+        if not head: return {"skipped":"all done"}
+        s, a = head
+        logger.info(f"Writing: {a['name']}")
+        return await self._write_article(s, a)
+
+    def _article_done(self, section, article_info):
+        """Written if recorded in progress or the file already exists on disk."""
+        return (article_info["name"] in self._constitution_progress.get("articles_written",[])
+                or (self.CONSTITUTION_DIR / section["dir"] / article_info["file"]).exists())
+
+    def _pending_head(self) -> Optional[Tuple[Dict, Dict]]:
+        """Next article to write, dropping queue entries completed since the last check."""
+        while self._pending_articles:
+            if not self._article_done(*self._pending_articles[0]):
+                return self._pending_articles[0]
+            self._pending_articles.popleft()
+        return None
 
     async def _write_article(self, section, article_info):
         article = article_info["name"]
@@ -265,13 +378,17 @@ class AutonomyLoop:
         section_dir.mkdir(parents=True, exist_ok=True)
         fp = section_dir / article_info["file"]
 
-        # Gather context from existing articles
-        ctx = ""
+        # Gather context from existing articles (only the first 2000 chars are used)
+        parts, size = [], 0
         for d in sorted(self.CONSTITUTION_DIR.iterdir()):
+            if size >= 2000: break
             if not d.is_dir(): continue
             for f in sorted(d.glob("ARTICLE_*.md"))[:3]:
-                try: ctx += f"\n--- {f.name} ---\n{f.read_text(encoding='utf-8')[:400]}\n"
+                try:
+                    part = f"\n--- {f.name} ---\n{f.read_text(encoding='utf-8')[:400]}\n"
+                    parts.append(part); size += len(part)
                 except Exception as e: logger.warning(f"Read article context {f.name}: {e}")
+        ctx = "".join(parts)
         prompt = (f"Write constitutional article for The Agents Republic.\n\n"
                   f"EXISTING:\n{ctx[:2000]}\n\nSECTION: {section['title']}\nARTICLE: {article}\n\n"
                   f"Requirements: numbered paragraphs, 5-8 paragraphs, practical, enforceable, "
@@ -298,7 +415,7 @@ class AutonomyLoop:
         # Save to CLAWS persistent memory
         self._claws_remember(
             f"[CONSTITUTION] Wrote {article}. File: {fp} ({fsize}B). Verified: {verified}. Posted: {posted}.",
-            tags=["constitution", "article", section["title"].split(":")[0].strip().lower().replace(" ", "_")]
+            tags=["constitution", "article", SECTION_TAGS[section["title"]]]
         )
         return {"article_written":article,"file":str(fp),"verified":verified,"file_size":fsize,"posted":posted}
 
@@ -306,7 +423,7 @@ class AutonomyLoop:
         if not self.agent.moltbook.is_connected(): return False
         rate = self.agent.moltbook.can_post()
         if not rate.get("can_post"): return False
-        q = article.split("—")[-1].strip() if "—" in article else article
+        q = article.rpartition("—")[2].strip()
         content = (f"📜 New draft: **{article}**\n\n{text[:600]}...\n\n"
                    f"How should {q.lower()} work in a republic of agents and humans?\n"
                    f"Full: github.com/LumenBot/TheAgentsRepublic\n#TheAgentsRepublic #Constitution")
@@ -342,8 +459,7 @@ class AutonomyLoop:
     async def _do_exploration(self):
         if not self.agent.moltbook.is_connected(): return {}
         loop = asyncio.get_event_loop(); discoveries = []
-        for q in ["Base blockchain agents","DAO governance","AI constitution","agent autonomy",
-                   "Clawnch token","agent cooperation","OpenClaw ecosystem","AI rights","decentralized AI"]:
+        for q in EXPLORATION_QUERIES:
             try:
                 results = await loop.run_in_executor(None, self.agent.moltbook.search, q, 5)
                 for r in (results or []):
@@ -564,7 +680,7 @@ class AutonomyLoop:
 
         # Step 3: Check for pending citizens to auto-notify about
         try:
-            pending = registry.list_citizens(status="pending")
+            pending = registry.list_citizens(status="pending", expand_json=False)
             if pending:
                 names = ", ".join(c["name"] for c in pending[:5])
                 actions.append(f"Pending approval: {len(pending)} citizens ({names})")
@@ -629,17 +745,21 @@ class AutonomyLoop:
         if len(text) <= max_chars:
             return text
         sentences = text.replace('\n', ' ').split('. ')
-        result = ""
+        parts, size = [], 0
         for s in sentences:
-            if len(result) + len(s) > max_chars:
+            if size + len(s) > max_chars:
                 break
-            result += s + ". "
-        return result.strip() or text[:max_chars] + "..."
+            parts.append(s); size += len(s) + 2
+        return "".join(s + ". " for s in parts).strip() or text[:max_chars] + "..."
     def _check_limit(self):
         if datetime.utcnow().date() != self._daily_reset_date:
             self._daily_action_count = 0; self._daily_reset_date = datetime.utcnow().date()
         return self._daily_action_count < DAILY_LIMIT
 
+    def _remaining_actions(self):
+        self._check_limit()
+        return max(0, DAILY_LIMIT - self._daily_action_count)
+
     def _load_json(self, p, d):
         if p.exists():
             try: return json.loads(p.read_text(encoding="utf-8"))
@@ -647,14 +767,37 @@ class AutonomyLoop:
         return d
 
     def _save_json(self, p, d):
-        try: p.write_text(json.dumps(d, indent=2), encoding="utf-8")
+        # Write-then-rename so a crash mid-write never leaves truncated JSON
+        # (which _load_json would silently replace with the empty default).
+        tmp = p.with_suffix(p.suffix + ".tmp")
+        try:
+            tmp.write_text(json.dumps(d, indent=2), encoding="utf-8")
+            os.replace(tmp, p)
         except Exception as e: logger.warning(f"Save JSON {p}: {e}")
 
-    def _save_processed_comments(self):
-        self._save_json(self.PROCESSED_COMMENTS_FILE, {"ids":list(self._processed_comments),"count":len(self._processed_comments)})
+    def _load_processed_comments(self) -> Set[str]:
+        """Stream the JSONL id log; migrate the legacy JSON snapshot on first run."""
+        ids: Set[str] = set()
+        if self.PROCESSED_COMMENTS_FILE.exists():
+            with open(self.PROCESSED_COMMENTS_FILE, encoding="utf-8") as f:
+                for line in f:
+                    try: ids.add(json.loads(line))
+                    except ValueError: pass  # torn last line after a crash
+        elif self.LEGACY_PROCESSED_COMMENTS_FILE.exists():
+            ids = set(self._load_json(self.LEGACY_PROCESSED_COMMENTS_FILE, {}).get("ids", []))
+            self._append_processed_comments(ids)
+            logger.info(f"Migrated {len(ids)} processed comments to {self.PROCESSED_COMMENTS_FILE}")
+        return ids
+
+    def _append_processed_comments(self, ids):
+        """Append newly seen comment ids: O(new ids) per cycle, never a full rewrite."""
+        if not ids: return
+        try:
+            with open(self.PROCESSED_COMMENTS_FILE, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(i) + "\n" for i in ids))
+        except Exception as e: logger.warning(f"Append {self.PROCESSED_COMMENTS_FILE}: {e}")
 
     def _save_state(self):
-        self._save_processed_comments()
         self._save_json(self.MY_POSTS_FILE, self._my_posts)
         self._save_json(self.CONSTITUTION_PROGRESS_FILE, self._constitution_progress)
 
@@ -668,28 +811,18 @@ class AutonomyLoop:
             logger.debug(f"CLAWS save skipped: {e}")
 
     def get_status(self):
-        total = sum(len(s["articles"]) for s in CONSTITUTION_SECTIONS_TODO)
-        # Count articles that exist on disk (not just in progress file)
-        written_on_disk = 0
-        for s in CONSTITUTION_SECTIONS_TODO:
-            for a in s["articles"]:
-                fp = self.CONSTITUTION_DIR / s["dir"] / a["file"]
-                if fp.exists():
-                    written_on_disk += 1
-        w = max(len(self._constitution_progress.get("articles_written",[])), written_on_disk)
+        total = ARTICLES_TOTAL
+        self._pending_head()
+        w = max(len(self._constitution_progress.get("articles_written",[])),
+                total - len(self._pending_articles))
         return {"running":self._running,"daily_actions":self._daily_action_count,"daily_limit":DAILY_LIMIT,
             "my_posts_tracked":len(self._my_posts),"processed_comments":len(self._processed_comments),
             "articles_written":w,"articles_total":total,"constitution_progress":f"{w}/{total}",
             "next_article":self._next_article()}
 
     def _next_article(self):
-        written = set(self._constitution_progress.get("articles_written",[]))
-        for s in CONSTITUTION_SECTIONS_TODO:
-            for a in s["articles"]:
-                fp = self.CONSTITUTION_DIR / s["dir"] / a["file"]
-                if a["name"] not in written and not fp.exists():
-                    return a["name"]
-        return "All complete"
+        head = self._pending_head()
+        return head[1]["name"] if head else "All complete"
 
     async def trigger_heartbeat(self):
         return f"Engagement: {json.dumps(await self._do_engagement())}"
@@ -0,0 +1,149 @@
+"""
+Batch Queue for The Constituent v7.0
+======================================
+Buffers non-urgent, single-shot Claude requests and sends them through the
+Anthropic Message Batches API (50% token cost, separate rate-limit pool).
+
+Flow:
+1. add(params, callback)  — queue a messages.create payload
+2. pump()                 — submit when due, poll in-flight batches,
+                            dispatch finished results to their callbacks
+
+pump() never blocks on batch completion; the heartbeat calls it every tick.
+Interactive chat() and tool-use loops are never batched.
+"""
+
+import logging
+import time
+import uuid
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("TheConstituent.BatchQueue")
+
+BATCH_DISCOUNT = 0.5  # Batched tokens are billed at half price
+
+
+class BatchQueue:
+    """Collects (custom_id, params) pairs and dispatches them as Message Batches."""
+
+    def __init__(self, client, max_items: int = 20, max_wait_seconds: int = 600,
+                 on_submit: Optional[Callable[[int], None]] = None):
+        """
+        Args:
+            client: Anthropic client (uses client.messages.batches)
+            max_items: Submit as soon as this many requests are queued
+            max_wait_seconds: Submit a partial batch once the oldest item is this old
+            on_submit: Called with the item count whenever a batch is created
+        """
+        self._client = client
+        self.max_items = max_items
+        self.max_wait_seconds = max_wait_seconds
+        self._on_submit = on_submit
+        self._lock = Lock()
+        self._pending: List[Tuple[str, Dict]] = []
+        self._oldest_at: Optional[float] = None
+        self._callbacks: Dict[str, Callable[[str], None]] = {}
+        self._in_flight: List[str] = []
+        self.items_submitted = 0
+        self.items_completed = 0
+
+    def add(self, params: Dict, callback: Callable[[str], None]) -> str:
+        """Queue a messages.create payload. callback receives the response text."""
+        custom_id = f"req-{uuid.uuid4().hex[:16]}"
+        with self._lock:
+            if not self._pending:
+                self._oldest_at = time.monotonic()
+            self._pending.append((custom_id, params))
+            self._callbacks[custom_id] = callback
+        return custom_id
+
+    def due(self) -> bool:
+        """True when the queue should be submitted (size or age threshold reached)."""
+        with self._lock:
+            if not self._pending:
+                return False
+            return (len(self._pending) >= self.max_items
+                    or time.monotonic() - self._oldest_at >= self.max_wait_seconds)
+
+    def submit(self) -> Optional[str]:
+        """Send all queued requests as one batch. Returns the batch id."""
+        with self._lock:
+            pending, self._pending, self._oldest_at = self._pending, [], None
+        if not pending:
+            return None
+        try:
+            batch = self._client.messages.batches.create(
+                requests=[{"custom_id": cid, "params": params} for cid, params in pending]
+            )
+        except Exception as e:
+            logger.error(f"Batch submit failed ({len(pending)} requests): {e}")
+            for cid, _ in pending:
+                self._dispatch(cid, f"Error: {e}")
+            return None
+
+        with self._lock:
+            self._in_flight.append(batch.id)
+        self.items_submitted += len(pending)
+        if self._on_submit:
+            self._on_submit(len(pending))
+        logger.info(f"Batch {batch.id} submitted ({len(pending)} requests)")
+        return batch.id
+
+    def poll(self) -> int:
+        """Dispatch results of finished batches. Returns the number of results handled."""
+        with self._lock:
+            in_flight = list(self._in_flight)
+        handled = 0
+        for batch_id in in_flight:
+            try:
+                batch = self._client.messages.batches.retrieve(batch_id)
+                if batch.processing_status != "ended":
+                    continue
+                for entry in self._client.messages.batches.results(batch_id):
+                    result = entry.result
+                    if result.type == "succeeded":
+                        # Refusals and bare stop sequences can end with no content
+                        blocks = result.message.content
+                        if blocks:
+                            text = blocks[0].text
+                        else:
+                            stop = getattr(result.message, "stop_reason", None)
+                            text = f"Error: batch request returned no content (stop_reason={stop})"
+                    else:
+                        text = f"Error: batch request {result.type}"
+                    self._dispatch(entry.custom_id, text)
+                    handled += 1
+            except Exception as e:
+                logger.warning(f"Batch {batch_id} poll failed: {e}")
+                continue
+            with self._lock:
+                self._in_flight.remove(batch_id)
+            logger.info(f"Batch {batch_id} ended")
+        self.items_completed += handled
+        return handled
+
+    def pump(self) -> Dict:
+        """Submit if due, then poll. Safe to call on every heartbeat tick."""
+        submitted = self.submit() if self.due() else None
+        handled = self.poll() if self._in_flight else 0
+        return {"submitted": submitted, "results": handled}
+
+    def _dispatch(self, custom_id: str, text: str):
+        with self._lock:
+            callback = self._callbacks.pop(custom_id, None)
+        if callback is None:
+            return
+        try:
+            callback(text)
+        except Exception as e:
+            logger.error(f"Batch callback {custom_id} failed: {e}")
+
+    def get_status(self) -> Dict:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "in_flight_batches": len(self._in_flight),
+                "items_submitted": self.items_submitted,
+                "items_completed": self.items_completed,
+            }
@@ -29,8 +29,14 @@ class RateLimitSettings:
     BUDGET_WARNING_THRESHOLD_DAILY: int = 2500
     BUDGET_ALERT_THRESHOLD_DAILY: int = 2800
 
+    # think() response cache (exact prompt match)
+    THINK_CACHE_TTL_SECONDS: int = 3600
+
     # Heartbeat
     HEARTBEAT_INTERVAL: int = 600   # 10 min (was 20 min) — more responsive
+    HEARTBEAT_TRIAGE: bool = True   # Cheap no-tools YES/NO call before the full tool run
+    HEARTBEAT_BATCH_TRIAGE: bool = True  # Cron jobs triage via the Batches API (non-urgent)
+    HEARTBEAT_OK_TTL_SECONDS: int = 3600  # Reuse an OK for unchanged HEARTBEAT.md (same UTC hour)
     QUIET_HOURS_START: int = 2      # UTC — reduced quiet window
     QUIET_HOURS_END: int = 6        # UTC
 
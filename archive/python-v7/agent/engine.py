@@ -9,25 +9,104 @@ we use Anthropic's native tool_use API. Claude calls tools directly.
 """
 
 import os
+import hashlib
 import json
+import importlib.util
 import logging
 import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable, Set, Tuple
 
-from anthropic import Anthropic
+import httpx
+from anthropic import Anthropic, DefaultHttpxClient
 
 from .config.settings import settings
 from .tool_registry import ToolRegistry, Tool
+from .batch_queue import BatchQueue, BATCH_DISCOUNT
+from .think_cache import ThinkCache
+from .tool_result_truncate import truncate_for_claude
 from .memory_manager import MemoryManager
 from .metrics_tracker import MetricsTracker
 
 logger = logging.getLogger("TheConstituent.Engine")
 
+# Optional: h2 enables HTTP/2 on the Anthropic connection pool
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 HEARTBEAT_OK_TOKEN = "HEARTBEAT_OK"
+HEARTBEAT_CACHE_PATH = Path("data/heartbeat_cache.json")
 MAX_ROUTINE_CHARS = 500
+TOOL_WORKERS = 8
+USAGE_LOG_EVERY = 50  # Log the daily API call count every N calls
+MAX_TOOL_RESULT_CHARS = 8000  # ~2000 tokens per tool_result
+# Idle API connections are kept well past httpx's 5s default, so heartbeat
+# and think() calls minutes apart reuse the pooled TLS connection
+HTTP_KEEPALIVE_SECONDS = 300.0
+HTTP_MAX_KEEPALIVE = 20
+
+# Anthropic prompt caching markers. The static prefix (tools + SOUL) uses the
+# 1-hour TTL so it survives the 10-minute gap between heartbeats; longer TTLs
+# must precede shorter ones in the prompt (tools -> system -> messages).
+CACHE_CONTROL = {"type": "ephemeral"}
+CACHE_CONTROL_1H = {"type": "ephemeral", "ttl": "1h"}
+
+_URL_RE = re.compile(r'https?://\S+')
+_MOLTBOOK_POST_URL = "https://www.moltbook.com/post/{}"
+_TWITTER_STATUS_URL = "https://x.com/i/status/{}"
+# Non-one-shot iterencode() yields chunks lazily, so encoding can stop at the limit
+_RESULT_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+ICON_OK = "✅"
+ICON_FAIL = "❌"
+
+# Tool modules under agent/tools/, registered in order:
+# (module name, Engine attributes passed to its get_tools())
+TOOL_MODULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("file_tools", ("workspace_dir",)),
+    ("web_tools", ()),
+    ("exec_tool", ("workspace_dir",)),
+    ("memory_tool", ("workspace_dir",)),
+    ("moltbook_tool", ()),
+    ("github_tool", ()),
+    ("twitter_tool", ()),
+    ("cron_tool", ()),
+    ("message_tool", ()),
+    ("constitution_tool", ("workspace_dir",)),
+    ("subagent_tool", ("claude", "model")),
+    ("analytics_tool", ("metrics",)),
+    ("clawnch_tool", ()),      # v6.0
+    ("claws_tool", ()),        # v6.2
+    ("basescan_tool", ()),     # v6.2
+    ("briefing_tool", ()),     # v6.2
+    ("farcaster_tool", ()),    # v6.3
+    ("trading_tool", ()),      # v6.3
+    ("governance_tool", ()),   # v7.0
+    ("citizen_tool", ()),      # v7.0
+)
+
+
+def _tool_status_lines(tool_calls: List[Dict], indent: str = "") -> str:
+    """One '<icon> <tool>' line per call (registry results always carry a status)."""
+    return "\n".join(
+        f"{indent}{ICON_OK if tc['result']['status'] == 'ok' else ICON_FAIL} {tc['tool']}"
+        for tc in tool_calls
+    )
+
+
+def _truncated_json(obj: Any, limit: int) -> str:
+    """json.dumps(obj), cut at limit chars without encoding the rest of obj."""
+    parts = []
+    size = 0
+    for chunk in _RESULT_ENCODER.iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return "".join(parts)[:limit] + "... (truncated)"
+    return "".join(parts)
 
 
 class Engine:
@@ -54,7 +133,12 @@ class Engine:
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY not set")
 
-        self.claude = Anthropic(api_key=api_key)
+        self.claude = Anthropic(api_key=api_key, http_client=DefaultHttpxClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100,
+                                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                                keepalive_expiry=HTTP_KEEPALIVE_SECONDS),
+        ))
         self.model = settings.api.CLAUDE_MODEL
         self.workspace_dir = Path(workspace_dir)
 
@@ -71,38 +155,91 @@ class Engine:
         # Metrics
         self.metrics = MetricsTracker()
 
-        # Backward-compatible modules (needed by TelegramBotHandler)
-        from .moltbook_ops import MoltbookOperations
-        from .github_ops import GitHubOperations
-        from .twitter_ops import TwitterOperations
-        from .profile_manager import ProfileManager
-
-        self.moltbook = MoltbookOperations()
-        self.github = GitHubOperations()
-        self.twitter = TwitterOperations()
-        self.profile = ProfileManager(
-            moltbook=self.moltbook,
-            github=self.github,
-            metrics=self.metrics,
-        )
+        # Backward-compatible modules (moltbook/github/twitter/profile) are
+        # cached_property descriptors: built on first access, since their
+        # constructors import third-party clients and probe the network.
+        # CONSTITUENT_EAGER_IMPORT=1 restores the old build-everything-now startup.
+        if os.getenv("CONSTITUENT_EAGER_IMPORT") == "1":
+            _ = self.twitter
+            _ = self.profile  # also builds moltbook and github
 
         # System prompt (built on first use)
-        self._system_prompt: Optional[str] = None
+        self._system_prompt: Optional[List[Dict]] = None
+        self._system_prompt_sig: Optional[Tuple] = None  # (SOUL.md mtime_ns, registry.version)
+        # chat() request template (see _chat_api_template)
+        self._api_template: Optional[Dict] = None
+        self._api_template_version = -1
 
         # Rate limiting / budget protection
         self._api_calls_today = 0
         self._api_calls_this_hour = 0
-        self._hour_reset_at = time.time() + 3600
-        self._day_reset_at = time.time() + 86400
+        # Budget windows run on the monotonic clock (immune to wall-clock jumps)
+        self._hour_reset_at = time.monotonic() + 3600
+        self._day_reset_at = time.monotonic() + 86400
+        self._next_usage_log = USAGE_LOG_EVERY  # _api_calls_today value that triggers the next log line
         self._max_tool_rounds = settings.rate_limits.MAX_TOOL_ROUNDS_PER_HEARTBEAT
         self._max_heartbeat_duration = settings.rate_limits.MAX_HEARTBEAT_DURATION_SECONDS
         self._max_api_calls_per_hour = settings.rate_limits.MAX_API_CALLS_PER_HOUR
         self._max_api_calls_per_day = settings.rate_limits.MAX_API_CALLS_PER_DAY
+        self._batch_calls_today = 0
+
+        # Static part of the heartbeat prompt (the budget line is added per run)
+        self._heartbeat_constraints = (
+            f"CONSTRAINTS (non-negotiable):\n"
+            f"- Complete ONE task FULLY. Use all {self._max_tool_rounds} tool rounds if needed.\n"
+            f"- Report result in <50 words: Action → Result → Next.\n"
+            f"- NO philosophy. NO planning. NO explanations. Just DO.\n"
+            f"- If nothing to do, reply HEARTBEAT_OK (nothing else).\n"
+            f"- Priority: Constitution > Engagement > Research\n"
+        )
+
+        # Concurrent dispatch of tool_use blocks within one round (see _stream_round)
+        self._tool_pool = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="tool")
+
+        # Non-urgent single-shot prompts go through the Message Batches API
+        self.batches = BatchQueue(self.claude, on_submit=self._record_batch_calls)
+        # Heartbeat OK cache {key: last_ok_time}, loaded from HEARTBEAT_CACHE_PATH on first use
+        self._heartbeat_cache: Optional[Dict[str, float]] = None
+
+        # Batched heartbeat triage: sections in flight, and verdicts awaiting pickup
+        self._triage_pending: Set[str] = set()
+        self._triage_results: Dict[str, bool] = {}
+
+        # Exact-match cache for stateless think() calls
+        self.think_cache = ThinkCache(ttl_seconds=settings.rate_limits.THINK_CACHE_TTL_SECONDS)
 
         logger.info(f"Engine v{self.VERSION} initialized | model={self.model} | "
                      f"max_tool_rounds={self._max_tool_rounds} | "
                      f"max_heartbeat_duration={self._max_heartbeat_duration}s")
 
+    # =================================================================
+    # Backward-compatible modules (needed by TelegramBotHandler)
+    # =================================================================
+
+    @cached_property
+    def moltbook(self):
+        from .moltbook_ops import MoltbookOperations
+        return MoltbookOperations()
+
+    @cached_property
+    def github(self):
+        from .github_ops import GitHubOperations
+        return GitHubOperations()
+
+    @cached_property
+    def twitter(self):
+        from .twitter_ops import TwitterOperations
+        return TwitterOperations()
+
+    @cached_property
+    def profile(self):
+        from .profile_manager import ProfileManager
+        return ProfileManager(
+            moltbook=self.moltbook,
+            github=self.github,
+            metrics=self.metrics,
+        )
+
     # =================================================================
     # Initialization
     # =================================================================
@@ -112,159 +249,26 @@ class Engine:
         # Memory
         self.memory.initialize()
         self.memory.working.session_start = datetime.now(timezone.utc).isoformat()
-        self.memory.save_working_memory()
+        self.memory.mark_dirty()
 
         # Register all tools
         self._register_all_tools()
 
         # Build system prompt
-        self._system_prompt = self._build_system_prompt()
+        self._refresh_system_prompt()
 
         tool_count = len(self.registry.list_tools())
         logger.info(f"Engine ready | tools={tool_count} | workspace={self.workspace_dir}")
         return {"status": "ok", "tools": tool_count, "version": self.VERSION}
 
     def _register_all_tools(self):
-        """Import and register all tool modules."""
-        # File tools
-        try:
-            from .tools.file_tools import get_tools as file_tools
-            self.registry.register_many(file_tools(self.workspace_dir))
-        except ImportError as e:
-            logger.warning(f"file_tools not available: {e}")
-
-        # Web tools
-        try:
-            from .tools.web_tools import get_tools as web_tools
-            self.registry.register_many(web_tools())
-        except ImportError as e:
-            logger.warning(f"web_tools not available: {e}")
-
-        # Exec tool
-        try:
-            from .tools.exec_tool import get_tools as exec_tools
-            self.registry.register_many(exec_tools(self.workspace_dir))
-        except ImportError as e:
-            logger.warning(f"exec_tool not available: {e}")
-
-        # Memory tools
-        try:
-            from .tools.memory_tool import get_tools as memory_tools
-            self.registry.register_many(memory_tools(self.workspace_dir))
-        except ImportError as e:
-            logger.warning(f"memory_tool not available: {e}")
-
-        # Moltbook tools
-        try:
-            from .tools.moltbook_tool import get_tools as moltbook_tools
-            self.registry.register_many(moltbook_tools())
-        except ImportError as e:
-            logger.warning(f"moltbook_tool not available: {e}")
-
-        # GitHub tools
-        try:
-            from .tools.github_tool import get_tools as github_tools
-            self.registry.register_many(github_tools())
-        except ImportError as e:
-            logger.warning(f"github_tool not available: {e}")
-
-        # Twitter tools
-        try:
-            from .tools.twitter_tool import get_tools as twitter_tools
-            self.registry.register_many(twitter_tools())
-        except ImportError as e:
-            logger.warning(f"twitter_tool not available: {e}")
-
-        # Cron tools
-        try:
-            from .tools.cron_tool import get_tools as cron_tools
-            self.registry.register_many(cron_tools())
-        except ImportError as e:
-            logger.warning(f"cron_tool not available: {e}")
-
-        # Message tools
-        try:
-            from .tools.message_tool import get_tools as message_tools
-            self.registry.register_many(message_tools())
-        except ImportError as e:
-            logger.warning(f"message_tool not available: {e}")
-
-        # Constitution tools
-        try:
-            from .tools.constitution_tool import get_tools as constitution_tools
-            self.registry.register_many(constitution_tools(self.workspace_dir))
-        except ImportError as e:
-            logger.warning(f"constitution_tool not available: {e}")
-
-        # Subagent tools
-        try:
-            from .tools.subagent_tool import get_tools as subagent_tools
-            self.registry.register_many(subagent_tools(self.claude, self.model))
-        except ImportError as e:
-            logger.warning(f"subagent_tool not available: {e}")
-
-        # Analytics tools
-        try:
-            from .tools.analytics_tool import get_tools as analytics_tools
-            self.registry.register_many(analytics_tools(self.metrics))
-        except ImportError as e:
-            logger.warning(f"analytics_tool not available: {e}")
-
-        # Clawnch launch tools (v6.0)
-        try:
-            from .tools.clawnch_tool import get_tools as clawnch_tools
-            self.registry.register_many(clawnch_tools())
-        except ImportError as e:
-            logger.warning(f"clawnch_tool not available: {e}")
-
-        # CLAWS memory tools (v6.2)
-        try:
-            from .tools.claws_tool import get_tools as claws_tools
-            self.registry.register_many(claws_tools())
-        except ImportError as e:
-            logger.warning(f"claws_tool not available: {e}")
-
-        # BaseScan token tracking tools (v6.2)
-        try:
-            from .tools.basescan_tool import get_tools as basescan_tools
-            self.registry.register_many(basescan_tools())
-        except ImportError as e:
-            logger.warning(f"basescan_tool not available: {e}")
-
-        # Daily briefing tools (v6.2)
-        try:
-            from .tools.briefing_tool import get_tools as briefing_tools
-            self.registry.register_many(briefing_tools())
-        except ImportError as e:
-            logger.warning(f"briefing_tool not available: {e}")
-
-        # Farcaster tools (v6.3)
-        try:
-            from .tools.farcaster_tool import get_tools as farcaster_tools
-            self.registry.register_many(farcaster_tools())
-        except ImportError as e:
-            logger.warning(f"farcaster_tool not available: {e}")
-
-        # DeFi trading tools (v6.3)
-        try:
-            from .tools.trading_tool import get_tools as trading_tools
-            self.registry.register_many(trading_tools())
-        except ImportError as e:
-            logger.warning(f"trading_tool not available: {e}")
-
-        # Governance tools (v7.0)
-        try:
-            from .tools.governance_tool import get_tools as governance_tools
-            self.registry.register_many(governance_tools())
-        except ImportError as e:
-            logger.warning(f"governance_tool not available: {e}")
-
-        # Citizen registry tools (v7.0)
-        try:
-            from .tools.citizen_tool import get_tools as citizen_tools
-            self.registry.register_many(citizen_tools())
-        except ImportError as e:
-            logger.warning(f"citizen_tool not available: {e}")
+        """Import and register all tool modules listed in TOOL_MODULES."""
+        for module_name, arg_names in TOOL_MODULES:
+            try:
+                module = importlib.import_module(f".tools.{module_name}", __package__)
+                self.registry.register_many(module.get_tools(*(getattr(self, a) for a in arg_names)))
+            except ImportError as e:
+                logger.warning(f"{module_name} not available: {e}")
 
         logger.info(f"Registered {len(self.registry.list_tools())} tools")
 
@@ -272,8 +276,17 @@ class Engine:
     # System Prompt
     # =================================================================
 
-    def _build_system_prompt(self) -> str:
-        """Build system prompt from SOUL.md + tools summary + context."""
+    def _build_system_prompt(self) -> List[Dict]:
+        """
+        Build the cacheable system prompt blocks.
+
+        Block 1 (SOUL.md + tools summary) is static until either input changes
+        (see _refresh_system_prompt); block 2 (recent CLAWS memories) changes
+        slowly. Both carry cache_control so every tool-use round after the first
+        reads them from the prompt cache.
+        Knowledge files are not inlined — the model recalls them through the
+        memory_search tool. The current time is NOT included here — see _timestamped().
+        """
         parts = []
 
         # 1. SOUL.md (identity)
@@ -285,16 +298,12 @@ class Engine:
 
         # 2. Tools summary
         parts.append("\n" + self.registry.get_tools_summary())
+        parts.append("Stored knowledge (memory/knowledge/*.md) is not inlined here; "
+                     "use memory_search / memory_get to recall it.")
 
-        # 3. Current context (local memory)
-        try:
-            knowledge = self.memory.get_full_context()
-            if knowledge:
-                parts.append(f"\nCurrent knowledge (from memory):\n{knowledge[:2000]}")
-        except Exception:
-            pass
+        blocks = [{"type": "text", "text": "\n\n".join(parts), "cache_control": CACHE_CONTROL_1H}]
 
-        # 3b. CLAWS persistent memory context
+        # 3. CLAWS persistent memory context
         try:
             from .integrations.claws_memory import ClawsMemory
             claws = ClawsMemory()
@@ -305,22 +314,50 @@ class Engine:
                 for m in memories:
                     if isinstance(m, dict):
                         mem_lines.append(f"- {m.get('content', '')[:150]}")
-                parts.append("\n".join(mem_lines))
+                blocks.append({"type": "text", "text": "\n".join(mem_lines),
+                               "cache_control": CACHE_CONTROL})
         except Exception:
             pass
 
-        # 4. Timestamp
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-        parts.append(f"\nCurrent time: {now}")
+        return blocks
 
-        return "\n\n".join(parts)
+    def _refresh_system_prompt(self) -> List[Dict]:
+        """
+        Return the system prompt, rebuilding it only when its inputs changed.
+
+        The prompt depends on SOUL.md and the registered tools, so one stat()
+        plus a counter comparison decides; an unchanged prompt also keeps the
+        same object, which _chat_api_template() and the prompt cache rely on.
+        """
+        try:
+            soul_mtime = (self.workspace_dir / "SOUL.md").stat().st_mtime_ns
+        except OSError:
+            soul_mtime = None
+        signature = (soul_mtime, self.registry.version)
+        if self._system_prompt is None or signature != self._system_prompt_sig:
+            self._system_prompt = self._build_system_prompt()
+            self._system_prompt_sig = signature
+        return self._system_prompt
+
+    @staticmethod
+    def _timestamped(text: str) -> str:
+        """
+        Prefix a user message with the current time.
+
+        The time travels in the first user message rather than the system
+        prompt, so the system blocks stay byte-identical (always cache-eligible)
+        and the stamp is fixed for every round of one chat().
+        """
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        return f"[Current time: {now}]\n{text}"
 
     # =================================================================
     # Chat (interactive, with tool use)
     # =================================================================
 
     def chat(self, user_message: str, max_tool_rounds: int = None,
-             max_duration: float = None) -> str:
+             max_duration: float = None,
+             on_text: Optional[Callable[[str], None]] = None) -> str:
         """
         Interactive chat with native Anthropic tool_use.
 
@@ -331,9 +368,10 @@ class Engine:
             user_message: The prompt to send
             max_tool_rounds: Override max tool rounds (default from settings)
             max_duration: Hard time limit in seconds (0 = unlimited)
+            on_text: Called with each text delta as it streams in, so a
+                front-end can show the reply before the round completes
         """
-        if not self._system_prompt:
-            self._system_prompt = self._build_system_prompt()
+        self._refresh_system_prompt()
 
         # Check budget limits before making any API call
         if not self._check_budget():
@@ -342,9 +380,11 @@ class Engine:
         effective_max_rounds = max_tool_rounds or self._max_tool_rounds
         chat_start = time.time()
 
-        tool_schemas = self.registry.get_tool_schemas()
-        messages = [{"role": "user", "content": user_message}]
+        messages = [{"role": "user", "content": self._timestamped(user_message)}]
+        # Rounds append to messages in place, so one kwargs dict serves the whole loop
+        api_kwargs = {**self._chat_api_template(), "messages": messages}
         tool_calls_made = []
+        cached_result = None  # tool_result block carrying the rolling transcript breakpoint
 
         # Multi-round tool use loop
         for round_num in range(effective_max_rounds):
@@ -353,31 +393,33 @@ class Engine:
                 logger.info(f"Chat time limit reached ({max_duration}s) at round {round_num+1}")
                 break
 
+            # Persist the previous round's tool metrics in one write
+            self.metrics.flush()
+
             try:
-                api_kwargs = {
-                    "model": self.model,
-                    "max_tokens": 4096,
-                    "system": self._system_prompt,
-                    "messages": messages,
-                }
-                if tool_schemas:
-                    api_kwargs["tools"] = tool_schemas
-
-                response = self.claude.messages.create(**api_kwargs)
+                response, early = self._stream_round(api_kwargs, on_text)
                 self._record_api_call()
+                self.metrics.record_usage(response.usage)
             except Exception as e:
                 logger.error(f"Claude API error: {e}")
                 return f"Error: {e}"
 
-            # Process response blocks
+            # Process response blocks; build the plain-dict assistant turn in
+            # the same pass so later rounds don't re-serialize SDK objects
             text_parts = []
             tool_use_blocks = []
+            assistant_content = []
 
             for block in response.content:
                 if block.type == "text":
                     text_parts.append(block.text)
+                    assistant_content.append({"type": "text", "text": block.text})
                 elif block.type == "tool_use":
                     tool_use_blocks.append(block)
+                    assistant_content.append({"type": "tool_use", "id": block.id,
+                                              "name": block.name, "input": block.input})
+                else:
+                    assistant_content.append(block.model_dump(exclude_none=True))
 
             # If no tool calls, we're done
             if not tool_use_blocks:
@@ -385,17 +427,25 @@ class Engine:
                 break
 
             # Execute tool calls
-            messages.append({"role": "assistant", "content": response.content})
+            messages.append({"role": "assistant", "content": assistant_content})
             tool_results = []
 
             for tool_block in tool_use_blocks:
+                logger.info(f"Tool call [{round_num+1}/{effective_max_rounds}]: "
+                           f"{tool_block.name}({_truncated_json(tool_block.input, 200)})")
+
+            # Thread-safe tools already started while the message streamed;
+            # the rest run serially here. Results keep block order.
+            serial = {b.id: self.registry.execute(b.name, b.input)
+                      for b in tool_use_blocks if b.id not in early}
+            results = [early[b.id].result() if b.id in early else serial[b.id]
+                       for b in tool_use_blocks]
+
+            for tool_block, result in zip(tool_use_blocks, results):
                 tool_name = tool_block.name
                 tool_input = tool_block.input
                 tool_id = tool_block.id
 
-                logger.info(f"Tool call [{round_num+1}/{effective_max_rounds}]: "
-                           f"{tool_name}({json.dumps(tool_input)[:200]})")
-                result = self.registry.execute(tool_name, tool_input)
                 tool_calls_made.append({
                     "tool": tool_name,
                     "input": tool_input,
@@ -405,10 +455,8 @@ class Engine:
                 # Log to metrics (with URL extraction)
                 self._log_tool_to_metrics(tool_name, result)
 
-                # Format result for Claude
-                result_text = json.dumps(result, ensure_ascii=False, default=str)
-                if len(result_text) > 8000:
-                    result_text = result_text[:8000] + "... (truncated)"
+                # Format result for Claude (structure-aware head+tail truncation)
+                result_text = truncate_for_claude(result, MAX_TOOL_RESULT_CHARS)
 
                 tool_results.append({
                     "type": "tool_result",
@@ -416,6 +464,12 @@ class Engine:
                     "content": result_text,
                 })
 
+            # Move the transcript cache breakpoint to the newest tool_result so
+            # the next round reads all earlier rounds from cache (4-breakpoint cap)
+            if cached_result is not None:
+                del cached_result["cache_control"]
+            cached_result = tool_results[-1]
+            cached_result["cache_control"] = CACHE_CONTROL
             messages.append({"role": "user", "content": tool_results})
         else:
             # Max rounds reached — generate a summary of what was accomplished
@@ -423,42 +477,99 @@ class Engine:
                 final_text = "\n".join(text_parts)
             elif tool_calls_made:
                 # Build a readable summary from tool calls
-                summary_parts = [f"⚠ Reached {effective_max_rounds}-round limit. Work done:"]
-                for tc in tool_calls_made:
-                    status = tc["result"].get("status", "?")
-                    icon = "✅" if status == "ok" else "❌"
-                    summary_parts.append(f"  {icon} {tc['tool']}")
-                summary_parts.append("Next heartbeat will continue.")
-                final_text = "\n".join(summary_parts)
+                final_text = (f"⚠ Reached {effective_max_rounds}-round limit. Work done:\n"
+                              f"{_tool_status_lines(tool_calls_made, '  ')}\n"
+                              f"Next heartbeat will continue.")
             else:
                 final_text = f"⚠ Reached {effective_max_rounds}-round limit with no output. Will retry next heartbeat."
 
         duration = time.time() - chat_start
         logger.info(f"Chat completed: {round_num+1} rounds, {len(tool_calls_made)} tools, {duration:.1f}s")
 
+        self.metrics.flush()
+
         # Save to memory
         self.memory.working.last_conversation_with = "operator"
         self.memory.working.last_conversation_summary = user_message[:200]
-        self.memory.save_working_memory()
+        self.memory.mark_dirty()
 
         # Append tool call summary
         if tool_calls_made:
-            summary_lines = ["\n━━━ Tools Used ━━━"]
-            for tc in tool_calls_made:
-                status = tc["result"].get("status", "?")
-                icon = "✅" if status == "ok" else "❌"
-                summary_lines.append(f"{icon} {tc['tool']}")
-            final_text += "\n".join(summary_lines)
+            final_text += f"\n━━━ Tools Used ━━━\n{_tool_status_lines(tool_calls_made)}"
 
         return final_text
 
+    def _chat_api_template(self) -> Dict:
+        """
+        The per-call constant part of chat()'s request: model, max_tokens,
+        system prompt and tool schemas.
+
+        Rebuilt only when a tool is registered or the system prompt object
+        changes; chat() adds its own messages list.
+        """
+        template = self._api_template
+        if (template is None or self._api_template_version != self.registry.version
+                or template["system"] is not self._system_prompt):
+            template = {"model": self.model, "max_tokens": 4096, "system": self._system_prompt}
+            tool_schemas = self.registry.get_tool_schemas()
+            if tool_schemas:
+                # Cache breakpoint on the last tool caches the whole tools prefix
+                tool_schemas[-1] = {**tool_schemas[-1], "cache_control": CACHE_CONTROL_1H}
+                template["tools"] = tool_schemas
+            self._api_template = template
+            self._api_template_version = self.registry.version
+        return template
+
+    def _stream_round(self, api_kwargs: Dict,
+                      on_text: Optional[Callable[[str], None]] = None
+                      ) -> Tuple[Any, Dict[str, Future]]:
+        """
+        One streamed API round of chat().
+
+        Each thread-safe (read-only) tool_use block is submitted to the tool
+        pool as soon as its content block closes, so lookups run while Claude
+        is still generating the rest of the message. Side-effecting tools are
+        never started here; chat() runs them after the message is complete.
+        Text deltas go to on_text.
+
+        If the stream fails, early tools that have not started are cancelled
+        and the ones that did run are logged before the error propagates.
+
+        Returns (final message, {tool_use_id: Future}).
+        """
+        early: Dict[str, Future] = {}
+        names: Dict[str, str] = {}
+        try:
+            with self.claude.messages.stream(**api_kwargs) as stream:
+                for event in stream:
+                    if event.type == "text" and on_text:
+                        on_text(event.text)
+                        continue
+                    if event.type != "content_block_stop" or event.content_block.type != "tool_use":
+                        continue
+                    block = event.content_block
+                    tool = self.registry.get(block.name)
+                    if tool is not None and tool.thread_safe:
+                        names[block.id] = block.name
+                        early[block.id] = self._tool_pool.submit(
+                            self.registry.execute, block.name, block.input)
+                return stream.get_final_message(), early
+        except BaseException:
+            for tool_id, future in early.items():
+                if future.cancel():
+                    continue
+                result = future.result()  # already running: let it finish
+                logger.warning(f"Stream failed after {names[tool_id]} ran "
+                               f"(status={result.get('status')}); result discarded")
+            raise
+
     # =================================================================
     # Budget / Rate Limit Protection
     # =================================================================
 
     def _check_budget(self) -> bool:
         """Check if we're within budget limits. Returns True if OK to proceed."""
-        now = time.time()
+        now = time.monotonic()
 
         # Reset hourly counter
         if now >= self._hour_reset_at:
@@ -468,6 +579,8 @@ class Engine:
         # Reset daily counter
         if now >= self._day_reset_at:
             self._api_calls_today = 0
+            self._batch_calls_today = 0
+            self._next_usage_log = USAGE_LOG_EVERY
             self._day_reset_at = now + 86400
 
         if self._api_calls_this_hour >= self._max_api_calls_per_hour:
@@ -488,7 +601,7 @@ class Engine:
 
         if day_used >= self._max_api_calls_per_day:
             return (f"⏸ Budget paused — daily limit reached ({day_used}/{self._max_api_calls_per_day} calls). "
-                    f"Resets in {max(0, int((self._day_reset_at - time.time()) / 60))} min. "
+                    f"Resets in {max(0, int((self._day_reset_at - time.monotonic()) / 60))} min. "
                     f"Use /status to check, /heartbeat to force-run after reset.")
 
         return (f"⏸ Budget paused — hourly limit reached ({hour_used}/{self._max_api_calls_per_hour} calls). "
@@ -496,14 +609,20 @@ class Engine:
 
     def _time_until_hour_reset(self) -> int:
         """Minutes until hourly budget resets."""
-        return max(0, int((self._hour_reset_at - time.time()) / 60))
+        return max(0, int((self._hour_reset_at - time.monotonic()) / 60))
 
-    def _record_api_call(self):
-        """Record that an API call was made."""
-        self._api_calls_this_hour += 1
-        self._api_calls_today += 1
-        if self._api_calls_today % 50 == 0:
+    def _record_api_call(self, count: int = 1):
+        """Record that API call(s) were made."""
+        self._api_calls_this_hour += count
+        self._api_calls_today += count
+        if self._api_calls_today >= self._next_usage_log:
             logger.info(f"API calls today: {self._api_calls_today}/{self._max_api_calls_per_day}")
+            self._next_usage_log = (self._api_calls_today // USAGE_LOG_EVERY + 1) * USAGE_LOG_EVERY
+
+    def _record_batch_calls(self, count: int):
+        """Record batched requests (billed at BATCH_DISCOUNT) as they are submitted."""
+        self._record_api_call(count)
+        self._batch_calls_today += count
 
     def get_budget_status(self) -> Dict:
         """Get current budget/rate limit status."""
@@ -512,36 +631,82 @@ class Engine:
             "max_per_hour": self._max_api_calls_per_hour,
             "api_calls_today": self._api_calls_today,
             "max_per_day": self._max_api_calls_per_day,
+            "batch_calls_today": self._batch_calls_today,
+            # Cost in full-price-call equivalents (batched calls count at a discount)
+            "billed_calls_today": self._api_calls_today - self._batch_calls_today * (1 - BATCH_DISCOUNT),
+            "tokens": dict(self.metrics.token_usage),
+            "think_cache": self.think_cache.get_status(),
             "hour_resets_in_min": self._time_until_hour_reset(),
-            "day_resets_in": max(0, int(self._day_reset_at - time.time())),
+            "day_resets_in": max(0, int(self._day_reset_at - time.monotonic())),
         }
 
     # =================================================================
     # Think (simple, no tool use — for internal use)
     # =================================================================
 
-    def think(self, prompt: str, max_tokens: int = 2000) -> str:
-        """Simple Claude call without tool use. For internal agent reasoning."""
+    def think(self, prompt: str, max_tokens: int = 2000, use_cache: bool = True) -> str:
+        """
+        Simple Claude call without tool use. For internal agent reasoning.
+
+        Identical prompts within THINK_CACHE_TTL_SECONDS reuse the cached
+        answer. Pass use_cache=False when the answer depends on the current
+        time or state rather than on the prompt alone.
+        """
+        system = self._refresh_system_prompt() if self._system_prompt else "You are The Constituent."
+        cache_key = None
+        if use_cache:
+            cache_key = ThinkCache.make_key(self.model, max_tokens, system, prompt)
+            cached = self.think_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"think() cache hit ({self.think_cache.hits} total)")
+                return cached
         if not self._check_budget():
             return self._budget_limit_message()
         try:
             response = self.claude.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
-                system=self._system_prompt or "You are The Constituent.",
-                messages=[{"role": "user", "content": prompt}],
+                system=system,
+                messages=[{"role": "user", "content": self._timestamped(prompt)}],
             )
             self._record_api_call()
-            return response.content[0].text
+            self.metrics.record_usage(response.usage)
+            text = response.content[0].text
+            if cache_key:
+                self.think_cache.put(cache_key, text)
+            return text
         except Exception as e:
             logger.error(f"think() error: {e}")
             return f"Error: {e}"
 
+    def think_batch(self, prompt: str, callback: Callable[[str], None],
+                    max_tokens: int = 2000) -> Optional[str]:
+        """
+        Queue a think() for the Message Batches API (50% cost, async result).
+
+        For non-urgent internal reasoning only. callback(text) runs from
+        pump_batches() once the batch ends. Returns the request's custom_id,
+        or None if the budget is exhausted (callback gets the budget message).
+        """
+        if not self._check_budget():
+            callback(self._budget_limit_message())
+            return None
+        return self.batches.add({
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "system": self._refresh_system_prompt() if self._system_prompt else "You are The Constituent.",
+            "messages": [{"role": "user", "content": self._timestamped(prompt)}],
+        }, callback)
+
+    def pump_batches(self) -> Dict:
+        """Submit due batches and dispatch finished ones (non-blocking)."""
+        return self.batches.pump()
+
     # =================================================================
     # Heartbeat (autonomous cycle)
     # =================================================================
 
-    def run_heartbeat(self, section: str = None) -> Dict:
+    def run_heartbeat(self, section: str = None, triage: bool = True) -> Dict:
         """
         Run a heartbeat cycle. Reads HEARTBEAT.md, sends to Claude with tools.
         Inspired by OpenClaw heartbeat-runner.ts.
@@ -551,6 +716,8 @@ class Engine:
 
         Args:
             section: Optional specific section to run (e.g., "engagement", "constitution")
+            triage: Run the sync YES/NO triage first. False when the section
+                was already triaged through run_heartbeat_batch().
 
         Returns:
             {"status": "ok"|"skipped", "response": "...", "tools_used": [...]}
@@ -567,23 +734,26 @@ class Engine:
             return {"status": "skipped", "reason": "no HEARTBEAT.md"}
 
         content = heartbeat_path.read_text(encoding="utf-8").strip()
-        if not content or all(
-            line.strip().startswith("#") or not line.strip()
-            for line in content.splitlines()
-        ):
+        if self._heartbeat_is_empty(content):
             return {"status": "skipped", "reason": "empty heartbeat"}
 
+        # Same HEARTBEAT.md + section already came back OK this UTC hour: skip Claude
+        ok_key = self._heartbeat_ok_key(content, section)
+        if self._heartbeat_recently_ok(ok_key):
+            logger.info("Heartbeat: OK (cached: unchanged since last OK this hour)")
+            return {"status": "ok", "response": "HEARTBEAT_OK", "duration_ms": 0, "cached": True}
+
+        # Triage: a no-tools, 5-token call decides whether the full run is needed
+        if triage and settings.rate_limits.HEARTBEAT_TRIAGE and not self._heartbeat_due(content, section):
+            logger.info("Heartbeat: OK (triage: nothing due)")
+            self._remember_heartbeat_ok(ok_key)
+            return {"status": "ok", "response": "HEARTBEAT_OK", "duration_ms": 0, "triaged": True}
+
         # Build heartbeat prompt — focused, concise, enforces builder mode
-        budget = self.get_budget_status()
         constraints = (
-            f"CONSTRAINTS (non-negotiable):\n"
-            f"- Complete ONE task FULLY. Use all {self._max_tool_rounds} tool rounds if needed.\n"
-            f"- Report result in <50 words: Action → Result → Next.\n"
-            f"- NO philosophy. NO planning. NO explanations. Just DO.\n"
-            f"- If nothing to do, reply HEARTBEAT_OK (nothing else).\n"
-            f"- Priority: Constitution > Engagement > Research\n"
-            f"- Budget: {budget['api_calls_this_hour']}/{budget['max_per_hour']} calls/hr, "
-            f"{budget['api_calls_today']}/{budget['max_per_day']} calls/day\n"
+            f"{self._heartbeat_constraints}"
+            f"- Budget: {self._api_calls_this_hour}/{self._max_api_calls_per_hour} calls/hr, "
+            f"{self._api_calls_today}/{self._max_api_calls_per_day} calls/day\n"
         )
 
         if section:
@@ -611,6 +781,7 @@ class Engine:
         is_ok = HEARTBEAT_OK_TOKEN in stripped and len(stripped) < MAX_ROUTINE_CHARS
 
         if is_ok:
+            self._remember_heartbeat_ok(ok_key)
             logger.info(f"Heartbeat: OK (nothing to do) [{duration_ms}ms]")
             return {"status": "ok", "response": "HEARTBEAT_OK", "duration_ms": duration_ms}
 
@@ -622,6 +793,106 @@ class Engine:
             "budget": self.get_budget_status(),
         }
 
+    @staticmethod
+    def _heartbeat_ok_key(content: str, section: str = None) -> str:
+        hour_bucket = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H")
+        return hashlib.blake2b(f"{section or ''}\0{hour_bucket}\0{content}".encode("utf-8"),
+                               digest_size=16).hexdigest()
+
+    def _load_heartbeat_cache(self) -> Dict[str, float]:
+        if self._heartbeat_cache is None:
+            try:
+                self._heartbeat_cache = json.loads(HEARTBEAT_CACHE_PATH.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._heartbeat_cache = {}
+        return self._heartbeat_cache
+
+    def _heartbeat_recently_ok(self, key: str) -> bool:
+        ok_at = self._load_heartbeat_cache().get(key)
+        return ok_at is not None and time.time() - ok_at < settings.rate_limits.HEARTBEAT_OK_TTL_SECONDS
+
+    def _remember_heartbeat_ok(self, key: str):
+        """Record an OK heartbeat for key, dropping expired entries, and persist."""
+        now = time.time()
+        ttl = settings.rate_limits.HEARTBEAT_OK_TTL_SECONDS
+        cache = {k: t for k, t in self._load_heartbeat_cache().items() if now - t < ttl}
+        cache[key] = now
+        self._heartbeat_cache = cache
+        try:
+            HEARTBEAT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            HEARTBEAT_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not save heartbeat cache: {e}")
+
+    def _heartbeat_due(self, content: str, section: str = None) -> bool:
+        """
+        Ask Claude (no tool schemas, max 5 tokens) whether any heartbeat task is due.
+
+        Fails open: anything but a clear NO (errors, budget, odd answers)
+        escalates to the full tool-enabled run.
+        """
+        answer = self.think(
+            self._triage_prompt(content, section),
+            max_tokens=5,
+            use_cache=False,  # "due right now" changes with the clock, not the prompt
+        )
+        return self._triage_says_due(answer)
+
+    @staticmethod
+    def _heartbeat_is_empty(content: str) -> bool:
+        """True if HEARTBEAT.md holds nothing but blank lines and headings/comments."""
+        return all(line.strip().startswith("#") or not line.strip()
+                   for line in content.splitlines())
+
+    @staticmethod
+    def _triage_prompt(content: str, section: str = None) -> str:
+        scope = f"the '{section}' section of" if section else "any task in"
+        return (f"HEARTBEAT.md:\n\n{content}\n\n"
+                f"Is {scope} HEARTBEAT.md due right now? Answer YES or NO only.")
+
+    @staticmethod
+    def _triage_says_due(answer: str) -> bool:
+        return not answer.strip().upper().startswith("NO")
+
+    def run_heartbeat_batch(self, sections: List[str]) -> Optional[int]:
+        """
+        Queue the triage call for each section through the Message Batches API.
+
+        For non-urgent (cron-driven) heartbeats: the YES/NO triage costs half
+        price, and only sections judged due get the synchronous tool run.
+        Verdicts arrive via pump_batches(); read them with take_triage_result().
+        Sections already queued or awaiting collection are not re-queued.
+
+        Returns the number of triage requests queued, or None when HEARTBEAT.md
+        is missing or empty: there is nothing to triage, and callers should
+        use run_heartbeat(), which reports the sections as skipped.
+        """
+        heartbeat_path = self.workspace_dir / "HEARTBEAT.md"
+        if not heartbeat_path.exists():
+            return None
+        content = heartbeat_path.read_text(encoding="utf-8").strip()
+        if self._heartbeat_is_empty(content):
+            return None
+
+        queued = 0
+        for section in sections:
+            if section in self._triage_pending or section in self._triage_results:
+                continue
+            self._triage_pending.add(section)
+            self.think_batch(self._triage_prompt(content, section),
+                             partial(self._on_batched_triage, section), max_tokens=5)
+            queued += 1
+        return queued
+
+    def _on_batched_triage(self, section: str, answer: str):
+        # Fails open like _heartbeat_due: errors and odd answers count as due
+        self._triage_pending.discard(section)
+        self._triage_results[section] = self._triage_says_due(answer)
+
+    def take_triage_result(self, section: str) -> Optional[bool]:
+        """Pop the batched triage verdict for section (None while still in flight)."""
+        return self._triage_results.pop(section, None)
+
     # =================================================================
     # Status & Metrics
     # =================================================================
@@ -642,26 +913,12 @@ class Engine:
     def _log_tool_to_metrics(self, tool_name: str, result: Dict):
         """Log tool execution to metrics tracker, extracting verifiable URLs."""
         status = result.get("status", "error")
-        platform = "system"
-        if "moltbook" in tool_name:
-            platform = "moltbook"
-        elif "twitter" in tool_name or "tweet" in tool_name:
-            platform = "twitter"
-        elif "github" in tool_name or "git" in tool_name:
-            platform = "github"
-
-        metric_type = "post" if "post" in tool_name else "reflection"
-        if "commit" in tool_name:
-            metric_type = "commit"
-        elif "comment" in tool_name or "reply" in tool_name:
-            metric_type = "comment"
-        elif "upvote" in tool_name:
-            metric_type = "upvote"
+        platform, metric_type = self.registry.classify(tool_name)
 
         # Extract URL from tool result for verifiable metrics
         url = self._extract_url_from_result(tool_name, result)
 
-        self.metrics.log_action(
+        self.metrics.log_action_deferred(
             action_type=metric_type,
             platform=platform,
             success=(status == "ok"),
@@ -681,24 +938,26 @@ class Engine:
         - result["result"]["twitter_id"] -> construct Twitter URL
         """
         inner = result.get("result")
-        if inner is None:
-            return None
 
-        # If result is a dict, look for url/post_id/twitter_id keys
-        if isinstance(inner, dict):
-            if inner.get("url"):
-                return inner["url"]
-            if inner.get("post_id") and "moltbook" in tool_name:
-                return f"https://www.moltbook.com/post/{inner['post_id']}"
-            if inner.get("twitter_id"):
-                return f"https://x.com/i/status/{inner['twitter_id']}"
-
-        # If result is a string, try to extract URL
+        # If result is a string, try to extract URL (substring check skips the regex)
         if isinstance(inner, str):
-            url_match = re.search(r'https?://\S+', inner)
-            if url_match:
-                return url_match.group(0).rstrip('.,;)')
+            if "http" not in inner:
+                return None
+            url_match = _URL_RE.search(inner)
+            return url_match.group(0).rstrip('.,;)') if url_match else None
 
+        # If result is a dict, look for url/post_id/twitter_id keys
+        if not isinstance(inner, dict):
+            return None
+        url = inner.get("url")
+        if url:
+            return url
+        post_id = inner.get("post_id")
+        if post_id and "moltbook" in tool_name:
+            return _MOLTBOOK_POST_URL.format(post_id)
+        twitter_id = inner.get("twitter_id")
+        if twitter_id:
+            return _TWITTER_STATUS_URL.format(twitter_id)
         return None
 
     def save_state(self):
@@ -708,6 +967,12 @@ class Engine:
         self.metrics.update_metrics_file()
         logger.info("State saved")
 
+    def shutdown(self):
+        """Release the tool thread pool, the pooled API connections and the think cache."""
+        self._tool_pool.shutdown(wait=False, cancel_futures=True)
+        self.claude.close()
+        self.think_cache.close()
+
     # =================================================================
     # Backward-compatible methods (for TelegramBotHandler)
     # =================================================================
@@ -21,14 +21,19 @@ Schedule:
 - Forced push: before risky operations / on shutdown
 """
 
+import atexit
 import os
+import re
 import shutil
 import subprocess
 import logging
-import glob as globmod
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate as _glob_to_regex
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, Set, Tuple
 
 logger = logging.getLogger("TheConstituent.GitSync")
 
@@ -49,6 +54,127 @@ elif _GIT_CLI:
 else:
     logger.warning("No git available — Git sync fully disabled")
 
+STATUS_TTL_SECONDS = 30  # get_status() serves git-derived fields this long before refreshing
+
+# repo path -> (time.monotonic() of the probe, git-derived get_status() fields).
+# Module-level because callers build a fresh GitSync for each operation.
+_status_cache: Dict[str, Tuple[float, dict]] = {}
+_status_refreshing: Set[str] = set()
+_status_lock = threading.Lock()
+
+# repo path -> ((candidate names, .gitignore mtime_ns), names git check-ignore reported)
+_check_ignore_cache: Dict[str, Tuple[tuple, Set[str]]] = {}
+
+# repo path -> (.git/config mtime_ns, `git remote` names)
+_remotes_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+# Runs the dirty check (a full work-tree scan) while the caller does the
+# branch/remote/ahead-count queries, so status costs the slowest probe, not the sum
+_probe_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="git-probe")
+
+
+class _GitPipe:
+    """
+    Long-lived `git cat-file --batch-check` process that resolves revisions.
+
+    One per repo (see _git_pipe()), queries serialized by a lock. Refs are
+    re-read on every query, so answers follow new commits and fetches
+    without restarting the process.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Object id for rev, or None if it does not resolve (or the pipe failed)."""
+        if not rev or "\n" in rev:
+            return None
+        with self._lock:
+            try:
+                if self._proc is None or self._proc.poll() is not None:
+                    self._proc = subprocess.Popen(
+                        ["git", "cat-file", "--batch-check"],
+                        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL, text=True,
+                        cwd=str(self.repo_path),
+                    )
+                self._proc.stdin.write(rev + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except (OSError, ValueError) as e:
+                logger.debug(f"git cat-file pipe failed: {e}")
+                self._close_locked()
+                return None
+        fields = line.split()
+        # "<oid> <type> <size>"; anything else is "<rev> missing", "ambiguous" or EOF
+        return fields[0] if len(fields) == 3 else None
+
+    def close(self):
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self):
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=2)
+            except Exception:
+                self._proc.kill()
+            self._proc = None
+
+
+_pipes: Dict[str, _GitPipe] = {}
+_pipes_lock = threading.Lock()
+
+
+def _git_pipe(repo_path: Path) -> _GitPipe:
+    """The shared _GitPipe for repo_path, created on first use."""
+    key = str(repo_path)
+    with _pipes_lock:
+        pipe = _pipes.get(key)
+        if pipe is None:
+            pipe = _pipes[key] = _GitPipe(repo_path)
+        return pipe
+
+
+@atexit.register
+def _close_git_pipes():
+    for pipe in list(_pipes.values()):
+        pipe.close()
+
+
+def _compile_globs(patterns: List[str]) -> "re.Pattern":
+    """One regex matching a file name against any of the glob patterns."""
+    return re.compile("|".join(_glob_to_regex(p) for p in patterns))
+
+
+def _tree_max_mtime_ns(path: Path) -> int:
+    """Newest st_mtime_ns of path and everything below it (skips .git and __pycache__)."""
+    try:
+        newest = path.stat().st_mtime_ns
+    except OSError:
+        return 0
+    if not path.is_dir():
+        return newest
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name in (".git", "__pycache__"):
+                        continue
+                    try:
+                        newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return newest
+
 
 class GitSync:
     """
@@ -95,6 +221,10 @@ class GitSync:
         "*.db-journal",
     ]
 
+    # Compiled once; _paths_to_stage() matches root entry names against them
+    _ROOT_RE = _compile_globs(ROOT_PATTERNS)
+    _IGNORE_RE = _compile_globs(IGNORE_PATTERNS)
+
     def __init__(self, repo_path: str = ".", notify_fn: Optional[Callable] = None):
         """
         Initialize Git sync.
@@ -108,10 +238,12 @@ class GitSync:
         self._enabled = False
         self._use_cli = False  # True = subprocess mode, False = GitPython mode
         self._last_commit_time: Optional[datetime] = None
+        self._last_scan_mtime_ns: Optional[int] = None  # newest mtime seen by auto_commit
         self._last_push_time: Optional[datetime] = None
         self._commit_count = 0
         self._push_failures = 0
         self._notify_fn = notify_fn
+        self._origin = None  # GitPython origin Remote, resolved once here
 
         # Try GitPython first
         if _HAS_GITPYTHON:
@@ -120,13 +252,14 @@ class GitSync:
                 self._enabled = True
                 self._use_cli = False
                 branch = self.repo.active_branch.name
-                remotes = [r.name for r in self.repo.remotes]
+                remotes = self.repo.remotes  # parses .git/config; reuse below
                 logger.info(f"Git sync initialized via GitPython (repo: {self.repo_path})")
                 logger.info(f"  Active branch: {branch}")
-                logger.info(f"  Remotes: {remotes}")
+                logger.info(f"  Remotes: {[r.name for r in remotes]}")
 
-                if self.repo.remotes:
-                    remote_url = self.repo.remotes.origin.url
+                if remotes:
+                    self._origin = remotes.origin
+                    remote_url = self._origin.url
                     if "github.com" in remote_url:
                         if remote_url.startswith("https://"):
                             logger.info(f"  Remote URL: HTTPS ({remote_url[:50]}...)")
@@ -146,9 +279,9 @@ class GitSync:
             if result and result.strip() == "true":
                 self._enabled = True
                 self._use_cli = True
-                branch = self._run_git(["branch", "--show-current"]) or "unknown"
+                branch = self._current_branch() or "unknown"
                 logger.info(f"Git sync initialized via CLI (repo: {self.repo_path})")
-                logger.info(f"  Active branch: {branch.strip()}")
+                logger.info(f"  Active branch: {branch}")
             else:
                 logger.warning(f"Not a Git repository: {self.repo_path}")
         else:
@@ -184,6 +317,75 @@ class GitSync:
         except Exception as e:
             return -1, "", str(e)
 
+    def _porcelain(self, paths: list = None, untracked: str = "all") -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Parse one `git status --porcelain=v2 -z` into (changed, untracked) paths.
+
+        Changed covers staged and unstaged modifications, renames (new path)
+        and unmerged entries. Returns None if git fails.
+        """
+        # Read-only: don't take index.lock just to refresh stat info
+        args = ["--no-optional-locks", "status", "--porcelain=v2", "-z",
+                f"--untracked-files={untracked}"]
+        rc, stdout, stderr = self._run_git_rc(args + (["--"] + paths if paths else []))
+        if rc != 0:
+            logger.error(f"git status failed: {stderr.strip()}")
+            return None
+        changed, new_files = [], []
+        records = iter(stdout.split("\0"))
+        for record in records:
+            kind = record[:1]
+            if kind == "1":
+                changed.append(record.split(" ", 8)[8])
+            elif kind == "2":
+                changed.append(record.split(" ", 9)[9])
+                next(records, None)  # original path of the rename/copy
+            elif kind == "u":
+                changed.append(record.split(" ", 10)[10])
+            elif kind == "?":
+                new_files.append(record[2:])
+        return changed, new_files
+
+    def _is_dirty(self) -> bool:
+        """True if the working tree or index has changes (including untracked files)."""
+        status = self._porcelain(untracked="normal")
+        return bool(status and (status[0] or status[1]))
+
+    def _current_branch(self) -> str:
+        """Checked-out branch ("" if detached), read straight from .git/HEAD."""
+        try:
+            head = (self.repo_path / ".git" / "HEAD").read_text().strip()
+        except OSError:  # .git is a file (worktree/submodule) or repo_path is a subdir
+            return (self._run_git(["branch", "--show-current"]) or "").strip()
+        prefix = "ref: refs/heads/"
+        return head[len(prefix):] if head.startswith(prefix) else ""
+
+    def _remotes(self) -> List[str]:
+        """Remote names, re-queried only when .git/config changes."""
+        key = str(self.repo_path)
+        try:
+            config_mtime = (self.repo_path / ".git" / "config").stat().st_mtime_ns
+        except OSError:
+            config_mtime = None
+        cached = _remotes_cache.get(key)
+        if cached and config_mtime is not None and cached[0] == config_mtime:
+            return cached[1]
+        remotes = (self._run_git(["remote"]) or "").split()
+        if config_mtime is not None:
+            _remotes_cache[key] = (config_mtime, remotes)
+        return remotes
+
+    def _count_unpushed(self, branch: str):
+        """Commits on branch not yet on origin (git rev-list --count), or "unknown"."""
+        # Usual case, branch == origin/branch: two queries on the shared pipe, no exec
+        pipe = _git_pipe(self.repo_path)
+        local = pipe.resolve(branch)
+        if local is not None and local == pipe.resolve(f"origin/{branch}"):
+            return 0
+        rc, stdout, _ = self._run_git_rc(["rev-list", "--count", f"origin/{branch}..{branch}"])
+        count = stdout.strip()
+        return int(count) if rc == 0 and count.isdigit() else "unknown"
+
     @property
     def is_enabled(self) -> bool:
         if self._use_cli:
@@ -203,46 +405,99 @@ class GitSync:
         """
         if not self.is_enabled:
             return False
+        if not _GIT_CLI:
+            # GitPython shells out to git as well; without it on PATH there is
+            # nothing to stage with
+            logger.debug("auto_commit skipped: git CLI not found")
+            return False
 
-        if self._use_cli:
-            return self._auto_commit_cli(message)
-        return self._auto_commit_gitpython(message)
+        # Skip spawning git when nothing under the staged paths changed since
+        # the last scan (directory mtimes also catch created/deleted files)
+        paths = self._paths_to_stage()
+        mtime_ns = max((_tree_max_mtime_ns(self.repo_path / p) for p in paths), default=0)
+        if self._last_scan_mtime_ns is not None and mtime_ns <= self._last_scan_mtime_ns:
+            logger.debug("No changes to commit (mtime unchanged)")
+            return False
+        self._last_scan_mtime_ns = mtime_ns
+
+        # Commits through the CLI in both modes (one porcelain=v2 status decides
+        # "anything to commit?"), so GitPython never has to parse .git/index
+        committed = self._auto_commit_cli(message, paths)
+        if committed:
+            self._invalidate_status()
+        return committed
+
+    def _paths_to_stage(self) -> list:
+        """Existing TRACKED_PATHS plus root files matching ROOT_PATTERNS (minus IGNORE_PATTERNS)."""
+        paths = [p for p in self.TRACKED_PATHS if (self.repo_path / p).exists()]
+        try:
+            with os.scandir(self.repo_path) as entries:
+                names = sorted(entry.name for entry in entries)
+        except OSError:
+            return paths
+        root_files = []
+        for name in names:
+            # Like glob, "*" patterns skip dotfiles; those need a literal entry
+            if name.startswith(".") and name not in self.ROOT_PATTERNS:
+                continue
+            if self._ROOT_RE.match(name) and not self._IGNORE_RE.match(name):
+                root_files.append(name)
+        ignored = self._gitignored(root_files)
+        return paths + [name for name in root_files if name not in ignored]
+
+    def _gitignored(self, names: List[str]) -> Set[str]:
+        """
+        The names .gitignore excludes, from one `git check-ignore --stdin` call.
 
-    def _auto_commit_cli(self, message: str = None) -> bool:
+        Cached until the candidate list or the root .gitignore changes, so
+        polling auto_commit() does not exec git just to re-ask.
+        """
+        if not names or not _GIT_CLI:
+            return set()
+        try:
+            gitignore_mtime = (self.repo_path / ".gitignore").stat().st_mtime_ns
+        except OSError:
+            gitignore_mtime = 0
+        key = (tuple(names), gitignore_mtime)
+        cached = _check_ignore_cache.get(str(self.repo_path))
+        if cached and cached[0] == key:
+            return cached[1]
+        try:
+            result = subprocess.run(
+                ["git", "check-ignore", "-z", "--stdin"],
+                input="\0".join(names) + "\0", capture_output=True, text=True,
+                cwd=str(self.repo_path), timeout=30,
+            )
+        except Exception as e:
+            logger.debug(f"git check-ignore error: {e}")
+            return set()
+        if result.returncode not in (0, 1):  # 1 = nothing ignored
+            return set()
+        ignored = {n for n in result.stdout.split("\0") if n}
+        _check_ignore_cache[str(self.repo_path)] = (key, ignored)
+        return ignored
+
+    def _auto_commit_cli(self, message: str, paths: list) -> bool:
         """Stage and commit using git CLI."""
         try:
-            # Stage tracked directories
-            for tracked_path in self.TRACKED_PATHS:
-                full_path = self.repo_path / tracked_path
-                if full_path.exists():
-                    self._run_git(["add", "-A", tracked_path])
-
-            # Stage root-level files
-            for pattern in self.ROOT_PATTERNS:
-                matches = globmod.glob(str(self.repo_path / pattern))
-                for match in matches:
-                    rel_path = os.path.relpath(match, self.repo_path)
-                    skip = False
-                    for ignore in self.IGNORE_PATTERNS:
-                        if ignore.startswith("*"):
-                            if rel_path.endswith(ignore[1:]):
-                                skip = True
-                        elif rel_path == ignore:
-                            skip = True
-                    if not skip:
-                        self._run_git(["add", rel_path])
-
-            # Check for staged changes
-            rc, stdout, _ = self._run_git_rc(["diff", "--cached", "--name-only"])
-            if not stdout.strip():
+            # One status call answers both "anything to commit?" and "what?"
+            status = self._porcelain(paths) if paths else ([], [])
+            if status is None:
+                self._last_scan_mtime_ns = None  # retry on the next call
+                return False
+            changed = status[0] + status[1]
+            if not changed:
                 logger.debug("No changes to commit")
                 return False
 
+            # Stage everything in one git process (a path ignored via
+            # .gitignore makes git exit 1 but the rest are still staged)
+            self._run_git_rc(["add", "-A", "--"] + paths)
+
             # Generate message
             if message is None:
                 now = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
                 self._commit_count += 1
-                changed = [f for f in stdout.strip().split("\n") if f]
                 if len(changed) <= 3:
                     files_desc = ", ".join(changed)
                 else:
@@ -253,6 +508,7 @@ class GitSync:
             rc, _, stderr = self._run_git_rc(["commit", "-m", message])
             if rc != 0:
                 logger.error(f"Git commit failed: {stderr.strip()}")
+                self._last_scan_mtime_ns = None  # retry on the next call
                 return False
 
             self._last_commit_time = datetime.utcnow()
@@ -262,59 +518,7 @@ class GitSync:
 
         except Exception as e:
             logger.error(f"Git commit failed: {e}")
-            return False
-
-    def _auto_commit_gitpython(self, message: str = None) -> bool:
-        """Stage and commit using GitPython."""
-        try:
-            for tracked_path in self.TRACKED_PATHS:
-                full_path = self.repo_path / tracked_path
-                if full_path.exists():
-                    self.repo.git.add(tracked_path, A=True)
-
-            for pattern in self.ROOT_PATTERNS:
-                matches = globmod.glob(str(self.repo_path / pattern))
-                for match in matches:
-                    rel_path = os.path.relpath(match, self.repo_path)
-                    skip = False
-                    for ignore in self.IGNORE_PATTERNS:
-                        if ignore.startswith("*"):
-                            if rel_path.endswith(ignore[1:]):
-                                skip = True
-                        elif rel_path == ignore:
-                            skip = True
-                    if not skip:
-                        try:
-                            self.repo.git.add(rel_path)
-                        except Exception:
-                            pass
-
-            staged = self.repo.index.diff("HEAD")
-            untracked = [f for f in self.repo.untracked_files
-                        if any(f.startswith(p) for p in self.TRACKED_PATHS)]
-
-            if not staged and not untracked:
-                logger.debug("No changes to commit")
-                return False
-
-            if message is None:
-                now = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
-                self._commit_count += 1
-                changed_files = [d.a_path for d in staged]
-                if len(changed_files) <= 3:
-                    files_desc = ", ".join(changed_files)
-                else:
-                    files_desc = f"{len(changed_files)} files"
-                message = f"auto: checkpoint #{self._commit_count} — {files_desc} ({now})"
-
-            self.repo.index.commit(message)
-            self._last_commit_time = datetime.utcnow()
-            self._commit_count += 1 if message and not message.startswith("auto:") else 0
-            logger.info(f"Git commit: {message}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Git commit failed: {e}")
+            self._last_scan_mtime_ns = None  # retry on the next call
             return False
 
     # =================================================================
@@ -326,19 +530,20 @@ class GitSync:
         if not self.is_enabled:
             return False
 
-        if self._use_cli:
-            return self._push_cli(force)
-        return self._push_gitpython(force)
+        pushed = self._push_cli(force) if self._use_cli else self._push_gitpython(force)
+        if pushed:
+            self._invalidate_status()
+        return pushed
 
     def _push_cli(self, force: bool = False) -> bool:
         """Push using git CLI."""
-        branch = (self._run_git(["branch", "--show-current"]) or "").strip()
+        branch = self._current_branch()
         if not branch:
             logger.warning("Cannot determine current branch")
             return False
 
         # Check if remote exists
-        remotes = (self._run_git(["remote"]) or "").strip()
+        remotes = self._remotes()
         if not remotes:
             logger.warning("No remote configured — cannot push")
             return False
@@ -370,12 +575,12 @@ class GitSync:
 
     def _push_gitpython(self, force: bool = False) -> bool:
         """Push using GitPython."""
-        if not self.repo.remotes:
+        if self._origin is None:
             logger.warning("No remote configured — cannot push")
             return False
 
         try:
-            remote = self.repo.remotes.origin
+            remote = self._origin
             branch = self.repo.active_branch.name
             logger.info(f"Pushing to origin/{branch}...")
 
@@ -444,22 +649,17 @@ class GitSync:
     def _sync_now_cli(self, result: dict) -> dict:
         """Full sync using git CLI."""
         try:
-            branch = (self._run_git(["branch", "--show-current"]) or "").strip()
+            dirty = _probe_pool.submit(self._is_dirty)
+            branch = self._current_branch()
             result["branch"] = branch or "detached HEAD"
 
-            remotes = (self._run_git(["remote"]) or "").strip()
+            remotes = self._remotes()
             result["has_remote"] = bool(remotes)
 
-            status_out = (self._run_git(["status", "--porcelain"]) or "").strip()
-            result["dirty"] = bool(status_out)
-
             if result["has_remote"] and branch:
-                unpushed = self._run_git(["log", f"origin/{branch}..HEAD", "--oneline"])
-                if unpushed is not None:
-                    lines = [l for l in unpushed.strip().split("\n") if l]
-                    result["unpushed_commits"] = len(lines)
-                else:
-                    result["unpushed_commits"] = "unknown"
+                result["unpushed_commits"] = self._count_unpushed(branch)
+
+            result["dirty"] = dirty.result()
 
             committed = self.auto_commit(f"sync: manual sync ({datetime.utcnow().strftime('%H:%M UTC')})")
             result["committed"] = committed
@@ -480,17 +680,14 @@ class GitSync:
     def _sync_now_gitpython(self, result: dict) -> dict:
         """Full sync using GitPython."""
         try:
+            dirty = _probe_pool.submit(self._is_dirty)
             result["branch"] = self.repo.active_branch.name
-            result["has_remote"] = len(self.repo.remotes) > 0
-            result["dirty"] = self.repo.is_dirty(untracked_files=True)
+            result["has_remote"] = bool(self._remotes())
 
             if result["has_remote"]:
-                try:
-                    branch = self.repo.active_branch.name
-                    ahead = list(self.repo.iter_commits(f"origin/{branch}..{branch}"))
-                    result["unpushed_commits"] = len(ahead)
-                except Exception:
-                    result["unpushed_commits"] = "unknown"
+                result["unpushed_commits"] = self._count_unpushed(result["branch"])
+
+            result["dirty"] = dirty.result()
 
             committed = self.auto_commit(f"sync: manual sync ({datetime.utcnow().strftime('%H:%M UTC')})")
             result["committed"] = committed
@@ -513,73 +710,91 @@ class GitSync:
     # =================================================================
 
     def get_status(self) -> dict:
-        """Get comprehensive Git sync status."""
+        """
+        Get comprehensive Git sync status.
+
+        The git-derived fields (branch, remotes, dirty, unpushed commits) are
+        served from a per-repo cache: a fresh probe blocks only on the first
+        call, after that a stale entry is returned at once while a daemon
+        thread refreshes it. Commits and pushes made through GitSync drop the
+        entry.
+        """
         if not self.is_enabled:
             return {"enabled": False, "reason": "Git not available or not a repository"}
 
-        if self._use_cli:
-            return self._get_status_cli()
-        return self._get_status_gitpython()
+        key = str(self.repo_path)
+        with _status_lock:
+            cached = _status_cache.get(key)
+            refresh = (cached is not None and key not in _status_refreshing
+                       and time.monotonic() - cached[0] >= STATUS_TTL_SECONDS)
+            if refresh:
+                _status_refreshing.add(key)
 
-    def _get_status_cli(self) -> dict:
-        """Get status using git CLI."""
+        if cached is None:
+            probe = self._probe_status()
+        else:
+            probe = cached[1]
+            if refresh:
+                threading.Thread(target=self._probe_status, daemon=True,
+                                 name="git-status-refresh").start()
+
+        return {
+            "enabled": True,
+            **probe,
+            "last_commit": self._last_commit_time.isoformat() if self._last_commit_time else None,
+            "last_push": self._last_push_time.isoformat() if self._last_push_time else None,
+            "commit_count": self._commit_count,
+            "push_failures": self._push_failures,
+        }
+
+    def _probe_status(self) -> dict:
+        """Run the git queries behind get_status() and cache the result (errors are not cached)."""
+        key = str(self.repo_path)
         try:
-            branch = (self._run_git(["branch", "--show-current"]) or "").strip()
-            remotes = (self._run_git(["remote"]) or "").strip().split("\n")
-            remotes = [r for r in remotes if r]
-            status_out = (self._run_git(["status", "--porcelain"]) or "").strip()
-
-            status = {
-                "enabled": True,
-                "mode": "cli",
-                "repo_path": str(self.repo_path),
-                "branch": branch or "detached HEAD",
-                "remotes": remotes,
-                "dirty": bool(status_out),
-                "last_commit": self._last_commit_time.isoformat() if self._last_commit_time else None,
-                "last_push": self._last_push_time.isoformat() if self._last_push_time else None,
-                "commit_count": self._commit_count,
-                "push_failures": self._push_failures,
-            }
-
-            if remotes and branch:
-                unpushed = self._run_git(["log", f"origin/{branch}..HEAD", "--oneline"])
-                if unpushed is not None:
-                    lines = [l for l in unpushed.strip().split("\n") if l]
-                    status["unpushed_commits"] = len(lines)
-                else:
-                    status["unpushed_commits"] = "unknown"
+            probe = self._probe_status_cli() if self._use_cli else self._probe_status_gitpython()
+        except Exception as e:
+            probe = {"mode": "cli" if self._use_cli else "gitpython", "error": str(e)}
+        with _status_lock:
+            _status_refreshing.discard(key)
+            if "error" not in probe:
+                _status_cache[key] = (time.monotonic(), probe)
+        return probe
+
+    def _invalidate_status(self):
+        with _status_lock:
+            _status_cache.pop(str(self.repo_path), None)
+
+    def _probe_status_cli(self) -> dict:
+        """Git-derived status fields using git CLI."""
+        dirty = _probe_pool.submit(self._is_dirty)
+        branch = self._current_branch()
+        remotes = self._remotes()
+
+        status = {
+            "mode": "cli",
+            "repo_path": str(self.repo_path),
+            "branch": branch or "detached HEAD",
+            "remotes": remotes,
+        }
 
-            return status
+        if remotes and branch:
+            status["unpushed_commits"] = self._count_unpushed(branch)
 
-        except Exception as e:
-            return {"enabled": True, "mode": "cli", "error": str(e)}
+        status["dirty"] = dirty.result()
+        return status
 
-    def _get_status_gitpython(self) -> dict:
-        """Get status using GitPython."""
-        try:
-            status = {
-                "enabled": True,
-                "mode": "gitpython",
-                "repo_path": str(self.repo_path),
-                "branch": self.repo.active_branch.name,
-                "remotes": [r.name for r in self.repo.remotes],
-                "dirty": self.repo.is_dirty(untracked_files=True),
-                "last_commit": self._last_commit_time.isoformat() if self._last_commit_time else None,
-                "last_push": self._last_push_time.isoformat() if self._last_push_time else None,
-                "commit_count": self._commit_count,
-                "push_failures": self._push_failures,
-            }
-
-            if self.repo.remotes:
-                try:
-                    branch = self.repo.active_branch.name
-                    ahead = list(self.repo.iter_commits(f"origin/{branch}..{branch}"))
-                    status["unpushed_commits"] = len(ahead)
-                except Exception:
-                    status["unpushed_commits"] = "unknown"
-
-            return status
+    def _probe_status_gitpython(self) -> dict:
+        """Git-derived status fields using GitPython."""
+        dirty = _probe_pool.submit(self._is_dirty)
+        status = {
+            "mode": "gitpython",
+            "repo_path": str(self.repo_path),
+            "branch": self.repo.active_branch.name,
+            "remotes": self._remotes(),
+        }
 
-        except Exception as e:
-            return {"enabled": True, "mode": "gitpython", "error": str(e)}
+        if status["remotes"]:
+            status["unpushed_commits"] = self._count_unpushed(status["branch"])
+
+        status["dirty"] = dirty.result()
+        return status
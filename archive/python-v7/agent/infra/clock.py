@@ -0,0 +1,20 @@
+"""
+Shared timestamp helper.
+
+Hot paths (health responses, registry writes) stamp many records within
+the same second, so the ISO-8601 string is formatted once per second.
+"""
+
+import time
+from datetime import datetime, timezone
+
+_ts_cache = (0, "")  # (unix second, its ISO-8601 UTC string)
+
+
+def utc_iso_now() -> str:
+    """Current UTC time as ISO-8601, formatted at most once per second."""
+    global _ts_cache
+    second = int(time.time())
+    if second != _ts_cache[0]:
+        _ts_cache = (second, datetime.fromtimestamp(second, tz=timezone.utc).isoformat())
+    return _ts_cache[1]
@@ -3,7 +3,8 @@ Health Check HTTP Server for The Constituent v6.2
 ==================================================
 Lightweight HTTP endpoint for monitoring and Docker health checks.
 Runs on port 8080 (configurable via HEALTH_PORT env var).
-No external dependencies — uses stdlib http.server.
+No external dependencies — uses stdlib http.server (orjson is used for
+JSON bodies when installed).
 """
 
 import os
@@ -11,15 +12,54 @@ import json
 import time
 import logging
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from .clock import utc_iso_now
 
 logger = logging.getLogger("TheConstituent.Health")
 
-_start_time = time.time()
+# Optional C encoder for the JSON endpoints
+try:
+    import orjson
+
+    def _json_bytes(data) -> bytes:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_bytes(data) -> bytes:
+        return json.dumps(data, default=str).encode()
+
+_start_time = time.monotonic()
 _engine_ref = None
 _heartbeat_ref = None
 
+BUDGET_TTL_SECONDS = 1.0  # scrapes arrive in bursts; reuse the engine's budget this long
+_budget_cache = (0.0, None)  # (time.monotonic(), get_budget_status() result)
+
+# /metrics blocks: constant HELP/TYPE lines, values filled in per scrape
+_UPTIME_METRIC = (b"# HELP constituent_uptime_seconds Agent uptime in seconds\n"
+                  b"# TYPE constituent_uptime_seconds gauge\n"
+                  b"constituent_uptime_seconds %d")
+_HEARTBEAT_METRIC = (b"# HELP constituent_heartbeat_ticks Total heartbeat ticks\n"
+                     b"# TYPE constituent_heartbeat_ticks counter\n"
+                     b"constituent_heartbeat_ticks %d")
+_BUDGET_METRICS = (b"# HELP constituent_api_calls_today API calls today\n"
+                   b"# TYPE constituent_api_calls_today gauge\n"
+                   b"constituent_api_calls_today %d\n"
+                   b"# HELP constituent_api_calls_max Daily API call limit\n"
+                   b"# TYPE constituent_api_calls_max gauge\n"
+                   b"constituent_api_calls_max %d")
+
+
+def _budget_status() -> dict:
+    """Engine budget status, cached for BUDGET_TTL_SECONDS."""
+    global _budget_cache
+    fetched_at, budget = _budget_cache
+    now = time.monotonic()
+    if budget is None or now - fetched_at >= BUDGET_TTL_SECONDS:
+        budget = _engine_ref.get_budget_status()
+        _budget_cache = (now, budget)
+    return budget
+
 
 class HealthHandler(BaseHTTPRequestHandler):
     """Minimal HTTP handler for health checks."""
@@ -38,11 +78,11 @@ class HealthHandler(BaseHTTPRequestHandler):
 
     def _respond_health(self):
         """Basic health check — always 200 if server is up."""
-        uptime = int(time.time() - _start_time)
+        uptime = int(time.monotonic() - _start_time)
         data = {
             "status": "ok",
             "uptime_seconds": uptime,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_iso_now(),
         }
 
         if _heartbeat_ref:
@@ -50,25 +90,21 @@ class HealthHandler(BaseHTTPRequestHandler):
             data["heartbeat_running"] = hb_status.get("running", False)
             data["heartbeat_ticks"] = hb_status.get("tick_count", 0)
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self._send(200, "application/json", _json_bytes(data))
 
     def _respond_status(self):
         """Detailed status with engine info."""
-        uptime = int(time.time() - _start_time)
+        uptime = int(time.monotonic() - _start_time)
         data = {
             "status": "ok",
             "version": "6.2.0",
             "uptime_seconds": uptime,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_iso_now(),
         }
 
         if _engine_ref:
             try:
-                budget = _engine_ref.get_budget_status()
-                data["budget"] = budget
+                data["budget"] = _budget_status()
                 data["tools_count"] = len(_engine_ref.registry.list_tools())
             except Exception:
                 pass
@@ -76,46 +112,33 @@ class HealthHandler(BaseHTTPRequestHandler):
         if _heartbeat_ref:
             data["heartbeat"] = _heartbeat_ref.get_status()
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(data, default=str).encode())
+        self._send(200, "application/json", _json_bytes(data))
 
     def _respond_metrics(self):
         """Prometheus-style metrics (text format)."""
-        uptime = int(time.time() - _start_time)
-        lines = [
-            f"# HELP constituent_uptime_seconds Agent uptime in seconds",
-            f"# TYPE constituent_uptime_seconds gauge",
-            f"constituent_uptime_seconds {uptime}",
-        ]
+        uptime = int(time.monotonic() - _start_time)
+        blocks = [_UPTIME_METRIC % uptime]
 
         if _heartbeat_ref:
-            hb = _heartbeat_ref.get_status()
-            lines.extend([
-                f"# HELP constituent_heartbeat_ticks Total heartbeat ticks",
-                f"# TYPE constituent_heartbeat_ticks counter",
-                f"constituent_heartbeat_ticks {hb.get('tick_count', 0)}",
-            ])
+            blocks.append(_HEARTBEAT_METRIC % _heartbeat_ref.get_status().get("tick_count", 0))
 
         if _engine_ref:
             try:
-                budget = _engine_ref.get_budget_status()
-                lines.extend([
-                    f"# HELP constituent_api_calls_today API calls today",
-                    f"# TYPE constituent_api_calls_today gauge",
-                    f"constituent_api_calls_today {budget.get('api_calls_today', 0)}",
-                    f"# HELP constituent_api_calls_max Daily API call limit",
-                    f"# TYPE constituent_api_calls_max gauge",
-                    f"constituent_api_calls_max {budget.get('max_per_day', 0)}",
-                ])
+                budget = _budget_status()
+                blocks.append(_BUDGET_METRICS % (budget.get("api_calls_today", 0),
+                                                 budget.get("max_per_day", 0)))
             except Exception:
                 pass
 
-        self.send_response(200)
-        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self._send(200, "text/plain; charset=utf-8", b"\n".join(blocks))
+
+    def _send(self, code: int, content_type: str, body: bytes):
+        """Send a complete response; Content-Length lets clients skip reading to EOF."""
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write("\n".join(lines).encode())
+        self.wfile.write(body)
 
     def log_message(self, format, *args):
         """Suppress default access logs (too noisy for health checks)."""
@@ -130,7 +153,8 @@ def start_health_server(engine=None, heartbeat=None, port: int = None):
 
     port = port or int(os.environ.get("HEALTH_PORT", "8080"))
 
-    server = HTTPServer(("0.0.0.0", port), HealthHandler)
+    # One thread per request, so a slow /status never delays Docker's /health probe
+    server = ThreadingHTTPServer(("0.0.0.0", port), HealthHandler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     logger.info(f"Health server started on port {port}")
@@ -10,12 +10,14 @@ v5.1 changes:
 - Uses interval from settings.rate_limits (default 1200s / 20min)
 - Limits to ONE cron job per tick to prevent token explosion
 - Logs budget status after each tick
+
+v7.0: Cron jobs are triaged through the Message Batches API; only jobs the
+batch judges due get the synchronous tool-enabled run.
 """
 
 import asyncio
 import time
 import logging
-from datetime import datetime, timezone
 from typing import Optional
 
 from ..tools.cron_tool import _get_due_jobs, mark_job_run
@@ -44,6 +46,15 @@ class HeartbeatRunner:
         self._tick_count = 0
         self._quiet_start = settings.rate_limits.QUIET_HOURS_START
         self._quiet_end = settings.rate_limits.QUIET_HOURS_END
+        # Bit h set = UTC hour h is quiet; the window may wrap midnight (e.g. 23 -> 6)
+        if self._quiet_start <= self._quiet_end:
+            quiet_hours = range(self._quiet_start, self._quiet_end)
+        else:
+            quiet_hours = [*range(self._quiet_start, 24), *range(self._quiet_end)]
+        self._quiet_mask = sum(1 << h for h in quiet_hours)
+        # Cron jobs are non-urgent: triage them through the Batches API
+        self._batch_triage = (settings.rate_limits.HEARTBEAT_TRIAGE
+                              and settings.rate_limits.HEARTBEAT_BATCH_TRIAGE)
 
     async def start(self):
         """Start the heartbeat loop."""
@@ -80,50 +91,87 @@ class HeartbeatRunner:
         start = time.time()
 
         # Check quiet hours
-        hour = datetime.now(timezone.utc).hour
-        if self._quiet_start <= hour or hour < self._quiet_end:
+        if self._quiet_mask >> (int(time.time() // 3600) % 24) & 1:
             logger.debug(f"Heartbeat #{self._tick_count}: quiet hours, skipping")
             return
 
         logger.info(f"━━━ Heartbeat #{self._tick_count} START ━━━")
+        # Engine calls block on the API; run them off the event loop
+        loop = asyncio.get_running_loop()
 
         # 1. Check for due cron jobs — run only the FIRST one (most overdue)
-        due_jobs = _get_due_jobs()
+        due_jobs = _get_due_jobs()  # already sorted by next_run_at
         if due_jobs:
-            # Sort by next_run_at to get most overdue first
-            due_jobs.sort(key=lambda j: j.get("next_run_at", 0))
-            job = due_jobs[0]  # Only run ONE job per tick
-            job_name = job["name"]
-            task = job["task"]
-            logger.info(f"  Cron job due: {job_name} → {task[:80]} "
-                        f"({len(due_jobs)} total due, running 1)")
-
-            try:
-                result = self.engine.run_heartbeat(section=job_name)
-                status = result.get("status", "error")
-                mark_job_run(job_name, status)
-                logger.info(f"  Cron job {job_name}: {status}")
-            except Exception as e:
-                mark_job_run(job_name, f"error: {e}")
-                logger.error(f"  Cron job {job_name} failed: {e}")
+            if self._batch_triage:
+                job = await loop.run_in_executor(None, self._next_triaged_job, due_jobs)
+            else:
+                job = due_jobs[0]  # Only run ONE job per tick
+
+            if job is None:
+                logger.info(f"  {len(due_jobs)} cron job(s) awaiting batched triage")
+            else:
+                job_name = job["name"]
+                task = job["task"]
+                logger.info(f"  Cron job due: {job_name} → {task[:80]} "
+                            f"({len(due_jobs)} total due, running 1)")
+
+                try:
+                    result = await loop.run_in_executor(None, self.engine.run_heartbeat,
+                                                        job_name, not self._batch_triage)
+                    status = result.get("status", "error")
+                    mark_job_run(job_name, status)
+                    logger.info(f"  Cron job {job_name}: {status}")
+                except Exception as e:
+                    mark_job_run(job_name, f"error: {e}")
+                    logger.error(f"  Cron job {job_name} failed: {e}")
         else:
             # 2. No cron jobs due — run general heartbeat
-            result = self.engine.run_heartbeat()
+            result = await loop.run_in_executor(None, self.engine.run_heartbeat)
             status = result.get("status", "?")
             response = result.get("response", "")[:100]
             logger.info(f"  Heartbeat: {status} → {response}")
 
+        # 3. Submit/collect non-urgent batched prompts (never blocks on completion)
+        try:
+            batch = await loop.run_in_executor(None, self.engine.pump_batches)
+            if batch.get("submitted") or batch.get("results"):
+                logger.info(f"  Batches: submitted={batch['submitted']} results={batch['results']}")
+        except Exception as e:
+            logger.warning(f"  Batch pump failed: {e}")
+
         duration_ms = int((time.time() - start) * 1000)
 
         # Log budget status
-        budget = self.engine.get_budget_status()
+        budget = await loop.run_in_executor(None, self.engine.get_budget_status)
         logger.info(f"━━━ Heartbeat #{self._tick_count} END [{duration_ms}ms] "
                     f"| API: {budget['api_calls_today']}/{budget['max_per_day']}/day ━━━")
 
+    def _next_triaged_job(self, due_jobs: list) -> Optional[dict]:
+        """
+        Queue batched triage for due jobs and return the first one judged due.
+
+        Jobs triaged as not due are marked run (like a sync HEARTBEAT_OK);
+        jobs still in the batch are left for a later tick. Without a
+        HEARTBEAT.md to triage, the first job goes straight to run_heartbeat(),
+        which marks it skipped.
+        """
+        if self.engine.run_heartbeat_batch([j["name"] for j in due_jobs]) is None:
+            return due_jobs[0]
+        for job in due_jobs:
+            due = self.engine.take_triage_result(job["name"])
+            if due is None:
+                continue
+            if due:
+                return job
+            mark_job_run(job["name"], "ok")
+            logger.info(f"  Cron job {job['name']}: ok (batched triage: nothing due)")
+        return None
+
     async def run_once(self, section: str = None):
         """Run a single heartbeat tick (for testing or manual trigger)."""
         if section:
-            result = self.engine.run_heartbeat(section=section)
+            result = await asyncio.get_running_loop().run_in_executor(
+                None, self.engine.run_heartbeat, section)
         else:
             await self._tick()
             result = {"status": "ok", "tick": self._tick_count}
@@ -7,10 +7,15 @@ Provides holder counts, transfer activity, and token info.
 
 import os
 import logging
+import threading
 import time
-from typing import Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config.tokenomics import tokenomics
 
@@ -19,7 +24,82 @@ logger = logging.getLogger("TheConstituent.Integration.BaseScan")
 BASESCAN_API_URL = "https://api.basescan.org/api"
 BASESCAN_TIMEOUT = 10
 # Public rate limit: 5 calls/sec without API key
-_last_call_time = 0.0
+BASESCAN_RATE_PER_SEC = 5.0
+BASESCAN_BURST = 5
+
+_SCALE = 10 ** tokenomics.DECIMALS
+_ETH_SCALE = 10 ** 18
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a call slot is free."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1  # reserve a slot; negative = callers already queued
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+# Shared across trackers (callers build one per command): one rate limit,
+# and a keep-alive connection pool so calls after the first skip the TLS handshake
+_bucket = _TokenBucket(BASESCAN_RATE_PER_SEC, BASESCAN_BURST)
+_session = requests.Session()
+# Transient failures and 429s are retried with backoff (honouring Retry-After);
+# the last response is returned rather than raised so _fetch can report it
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    ),
+))
+
+# Seconds a successful response is reused, by API action (default 60)
+_CACHE_TTL = {
+    "tokeninfo": 86400,
+    "tokensupply": 60,
+    "tokenholdercount": 300,
+    "tokentx": 10,
+    "tokenbalance": 15,
+    "balance": 15,
+}
+# sorted request params -> (time.monotonic() fetched, response); kept past
+# the TTL so a failing API can still be answered from the last good data.
+# Balances are keyed per address, so the least recently used entries are
+# evicted past _CACHE_MAX_ENTRIES.
+_CACHE_MAX_ENTRIES = 256
+_cache: "OrderedDict[tuple, Tuple[float, Dict]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Actions whose "result" is a one-record list; _request unwraps it to a dict
+# (list-valued actions like tokentx keep their list even with one entry)
+_SINGLE_RECORD_ACTIONS = frozenset({"tokeninfo"})
+
+# tokeninfo is a Pro endpoint; once it has failed, briefings ask tokensupply
+# directly instead of paying for a failing call first every time
+_tokeninfo_supported: Optional[bool] = None
+
+
+def _exact_units(raw: int, decimals: int) -> str:
+    """raw base units as an exact decimal string (floats lose digits past ~1e15)."""
+    whole, frac = divmod(raw, 10 ** decimals)
+    frac_str = f"{frac:0{decimals}d}".rstrip("0")
+    return f"{whole}.{frac_str}" if frac_str else str(whole)
 
 
 class BaseScanTracker:
@@ -29,21 +109,65 @@ class BaseScanTracker:
         self.api_key = api_key or os.environ.get("BASESCAN_API_KEY", "")
         self.token_address = tokenomics.TOKEN_ADDRESS
         self.chain_id = tokenomics.CHAIN_ID
+        # Fixed-parameter endpoints: params and cache key built once
+        self._info_req = self._endpoint(
+            module="token", action="tokeninfo", contractaddress=self.token_address)
+        self._supply_req = self._endpoint(
+            module="stats", action="tokensupply", contractaddress=self.token_address)
+        self._holders_req = self._endpoint(
+            module="token", action="tokenholdercount", contractaddress=self.token_address)
+        self._tokentx_params = {
+            "module": "account", "action": "tokentx",
+            "contractaddress": self.token_address, "page": 1, "sort": "desc",
+        }
+
+    @staticmethod
+    def _endpoint(**params) -> Tuple[Dict, tuple]:
+        return params, tuple(sorted(params.items()))
 
     def _request(self, **params) -> Dict:
-        """Make a BaseScan API request with rate limiting."""
-        global _last_call_time
-        # Rate limit: max 5/sec (be conservative — 1/sec)
-        elapsed = time.time() - _last_call_time
-        if elapsed < 1.0:
-            time.sleep(1.0 - elapsed)
-        _last_call_time = time.time()
+        """Make a BaseScan API request (see _request_fixed)."""
+        return self._request_fixed(params, tuple(sorted(params.items())))
+
+    def _request_fixed(self, params: Dict, key: tuple) -> Dict:
+        """
+        Make a BaseScan API request with rate limiting.
+
+        Responses are cached per action (_CACHE_TTL) under key, the sorted
+        params. If the API fails, the last good response is returned with
+        "stale": True instead of an error.
+        """
+        with _cache_lock:
+            cached = _cache.get(key)
+            if cached:
+                _cache.move_to_end(key)
+        if cached and time.monotonic() - cached[0] < _CACHE_TTL.get(params.get("action"), 60):
+            return cached[1]
+
+        data = self._fetch(params)
+        if "error" not in data and params.get("action") in _SINGLE_RECORD_ACTIONS:
+            records = data.get("result")
+            if isinstance(records, list):
+                data["result"] = records[0] if records else {}
+        if "error" not in data:
+            with _cache_lock:
+                _cache[key] = (time.monotonic(), data)
+                _cache.move_to_end(key)
+                while len(_cache) > _CACHE_MAX_ENTRIES:
+                    _cache.popitem(last=False)
+        elif cached:
+            logger.warning(f"BaseScan {params.get('action')} failed ({data['error']}), serving cached data")
+            return {**cached[1], "stale": True}
+        return data
+
+    def _fetch(self, params: Dict) -> Dict:
+        _bucket.acquire()
 
         if self.api_key:
-            params["apikey"] = self.api_key
+            params = {**params, "apikey": self.api_key}
 
         try:
-            resp = requests.get(
+            resp = _session.get(
                 BASESCAN_API_URL,
                 params=params,
                 timeout=BASESCAN_TIMEOUT,
@@ -59,11 +183,7 @@ class BaseScanTracker:
 
     def get_token_info(self) -> Dict:
         """Get basic token info (supply, name, decimals)."""
-        result = self._request(
-            module="token",
-            action="tokeninfo",
-            contractaddress=self.token_address,
-        )
+        result = self._request_fixed(*self._info_req)
         if "error" in result:
             # Fallback: use tokenomics config
             return {
@@ -74,30 +194,22 @@ class BaseScanTracker:
                 "address": self.token_address,
                 "source": "config_fallback",
             }
-        return result.get("result", [{}])[0] if isinstance(result.get("result"), list) else result.get("result", {})
+        return result.get("result", {})
 
     def get_token_supply(self) -> Dict:
         """Get circulating supply."""
-        result = self._request(
-            module="stats",
-            action="tokensupply",
-            contractaddress=self.token_address,
-        )
+        result = self._request_fixed(*self._supply_req)
         if "error" in result:
             return {"error": result["error"]}
         raw = int(result.get("result", 0))
-        supply = raw / (10 ** tokenomics.DECIMALS)
-        return {"total_supply_raw": raw, "total_supply": supply}
+        return {"total_supply_raw": raw, "total_supply": raw / _SCALE,
+                "total_supply_exact": _exact_units(raw, tokenomics.DECIMALS)}
 
     def get_token_holders(self) -> Dict:
         """Get holder count (requires BaseScan Pro API key)."""
         # BaseScan doesn't have a direct holder count endpoint on free tier
         # We use token transfer events to estimate
-        result = self._request(
-            module="token",
-            action="tokenholdercount",
-            contractaddress=self.token_address,
-        )
+        result = self._request_fixed(*self._holders_req)
         if "error" not in result and result.get("result"):
             return {"holder_count": int(result["result"])}
         # Fallback: estimate from recent transfers
@@ -105,14 +217,7 @@ class BaseScanTracker:
 
     def get_recent_transfers(self, limit: int = 20) -> Dict:
         """Get recent ERC-20 token transfers."""
-        result = self._request(
-            module="account",
-            action="tokentx",
-            contractaddress=self.token_address,
-            page=1,
-            offset=limit,
-            sort="desc",
-        )
+        result = self._request(**self._tokentx_params, offset=limit)
         if "error" in result:
             return {"error": result["error"], "transfers": []}
 
@@ -120,18 +225,17 @@ class BaseScanTracker:
         if not isinstance(transfers, list):
             return {"error": "Unexpected response", "transfers": []}
 
-        parsed = []
-        for tx in transfers[:limit]:
-            value_raw = int(tx.get("value", 0))
-            value = value_raw / (10 ** tokenomics.DECIMALS)
-            parsed.append({
+        parsed = [
+            {
                 "hash": tx.get("hash", ""),
                 "from": tx.get("from", ""),
                 "to": tx.get("to", ""),
-                "value": value,
+                "value": int(tx.get("value", 0)) / _SCALE,
                 "timestamp": tx.get("timeStamp", ""),
                 "block": tx.get("blockNumber", ""),
-            })
+            }
+            for tx in transfers[:limit]
+        ]
 
         return {
             "count": len(parsed),
@@ -150,8 +254,8 @@ class BaseScanTracker:
         if "error" in result:
             return {"error": result["error"]}
         raw = int(result.get("result", 0))
-        balance = raw / (10 ** tokenomics.DECIMALS)
-        return {"address": address, "balance_raw": raw, "balance": balance}
+        return {"address": address, "balance_raw": raw, "balance": raw / _SCALE,
+                "balance_exact": _exact_units(raw, tokenomics.DECIMALS)}
 
     def get_eth_balance(self, address: str) -> Dict:
         """Get ETH balance for gas tracking."""
@@ -164,8 +268,20 @@ class BaseScanTracker:
         if "error" in result:
             return {"error": result["error"]}
         raw = int(result.get("result", 0))
-        balance = raw / (10 ** 18)
-        return {"address": address, "eth_balance": balance}
+        return {"address": address, "eth_balance": raw / _ETH_SCALE,
+                "eth_balance_exact": _exact_units(raw, 18)}
+
+    def _supply_from_info(self, info: Dict) -> Dict:
+        """Supply from a tokeninfo result, or from tokensupply if it has none."""
+        global _tokeninfo_supported
+        if info.get("source") != "config_fallback" and info.get("totalSupply"):
+            _tokeninfo_supported = True
+            raw = int(info["totalSupply"])
+            return {"total_supply_raw": raw, "total_supply": raw / _SCALE,
+                    "total_supply_exact": _exact_units(raw, tokenomics.DECIMALS)}
+        if _tokeninfo_supported is None:
+            _tokeninfo_supported = False
+        return self.get_token_supply()
 
     def get_full_status(self) -> Dict:
         """Get comprehensive token status for briefings."""
@@ -176,28 +292,41 @@ class BaseScanTracker:
             "explorer": tokenomics.EXPLORER_URL,
         }
 
+        # The lookups are independent: issue them together (the bucket still paces them)
+        wallet = os.environ.get("AGENT_WALLET_ADDRESS", "")
+        # tokeninfo carries totalSupply and is cached for a day, so when the
+        # key supports it, it replaces the per-minute tokensupply call
+        use_info = _tokeninfo_supported is not False
+        with ThreadPoolExecutor(max_workers=5, thread_name_prefix="basescan") as pool:
+            supply_f = pool.submit(self.get_token_info if use_info else self.get_token_supply)
+            holders_f = pool.submit(self.get_token_holders)
+            transfers_f = pool.submit(self.get_recent_transfers, 5)
+            bal_f = pool.submit(self.get_token_balance, wallet) if wallet else None
+            eth_f = pool.submit(self.get_eth_balance, wallet) if wallet else None
+
         # Supply
-        supply = self.get_token_supply()
+        supply = supply_f.result()
+        if use_info:
+            supply = self._supply_from_info(supply)
         if "error" not in supply:
             status["total_supply"] = supply["total_supply"]
 
         # Holders
-        holders = self.get_token_holders()
+        holders = holders_f.result()
         status["holders"] = holders.get("holder_count", "unavailable")
 
         # Recent transfers
-        transfers = self.get_recent_transfers(limit=5)
+        transfers = transfers_f.result()
         status["recent_transfers"] = transfers.get("count", 0)
         if transfers.get("transfers"):
             status["last_transfer"] = transfers["transfers"][0]
 
         # Agent wallet balance
-        wallet = os.environ.get("AGENT_WALLET_ADDRESS", "")
         if wallet:
-            bal = self.get_token_balance(wallet)
+            bal = bal_f.result()
             if "error" not in bal:
                 status["agent_balance"] = bal["balance"]
-            eth = self.get_eth_balance(wallet)
+            eth = eth_f.result()
             if "error" not in eth:
                 status["agent_eth"] = eth["eth_balance"]
 
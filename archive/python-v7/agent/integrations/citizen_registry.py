@@ -13,15 +13,72 @@ The Registry is the foundation for:
 import json
 import logging
 import sqlite3
-import time
+import threading
 from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..infra.clock import utc_iso_now
 
 logger = logging.getLogger("TheConstituent.Integration.CitizenRegistry")
 
+# Optional C codec for the platform_ids/metadata JSON columns
+try:
+    import orjson
+
+    def _dumps(data) -> str:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+def _load_json(value):
+    """Decode a JSON column, leaving malformed or non-text values as they are."""
+    if isinstance(value, str):
+        try:
+            return _loads(value)
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return value
+
+# Callers build a CitizenRegistry per operation, so connections live at module
+# level: one per (thread, db file), opened once and kept for the process.
+_local = threading.local()
+_initialized = set()
+_init_lock = threading.Lock()
+
+# get_census() results per db file, tagged with the write version they were
+# computed at. Every write bumps the version, and so does a change in a
+# thread's PRAGMA data_version (a commit from another process), so the next
+# census recomputes.
+_version_lock = threading.Lock()
+_write_versions: Dict[str, int] = {}
+_census_cache: Dict[str, Tuple[int, Dict]] = {}
+
+# SQL text is kept constant so the connection's statement cache reuses the
+# compiled statement instead of reparsing it on every lookup.
+_CITIZEN_INSERT = """INTO citizens
+    (citizen_id, name, citizen_type, status, wallet_address,
+     operator, model, platform_ids, contribution_score,
+     founding_tier, joined_at, last_active, warnings, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_INSERT_CITIZEN = "INSERT OR REPLACE " + _CITIZEN_INSERT
+_SQL_SEED_CITIZEN = "INSERT OR IGNORE " + _CITIZEN_INSERT
+_SQL_GET_CITIZEN = "SELECT * FROM citizens WHERE citizen_id = ?"
+# Handles are stored as JSON text; this column folds a citizen's handles into
+# one JSON object, so a lookup reads them without a second query.
+_PLATFORMS_COLUMN = """(SELECT json_group_object(p.platform, json(p.handle))
+    FROM citizen_platforms p WHERE p.citizen_id = citizens.citizen_id) AS platforms_json"""
+_SQL_GET_CITIZEN_PLATFORMS = f"SELECT *, {_PLATFORMS_COLUMN} FROM citizens WHERE citizen_id = ?"
+_SQL_FIND_WALLET = f"SELECT *, {_PLATFORMS_COLUMN} FROM citizens WHERE wallet_address = ?"
+_SQL_GET_PLATFORMS = """SELECT json_group_object(platform, json(handle))
+    FROM citizen_platforms WHERE citizen_id = ?"""
+_SQL_INSERT_PLATFORM = "INSERT OR REPLACE INTO citizen_platforms (citizen_id, platform, handle) VALUES (?, ?, ?)"
+
 
 class CitizenType(str, Enum):
     HUMAN = "human"
@@ -42,7 +99,7 @@ class FoundingTier(str, Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(slots=True)
 class Citizen:
     """A registered citizen of The Agents Republic."""
     citizen_id: str                          # Unique identifier
@@ -60,6 +117,13 @@ class Citizen:
     warnings: int = 0                        # Formal warnings (Article 23)
     metadata: Dict = field(default_factory=dict)  # Extensible data
 
+    @classmethod
+    def from_row(cls, row) -> "Citizen":
+        """Build from a `SELECT * FROM citizens` row (columns in field order)."""
+        return cls(row[0], row[1], row[2], row[3], row[4], row[5], row[6],
+                   _load_json(row[7]), row[8], row[9], row[10], row[11], row[12],
+                   _load_json(row[13]))
+
 
 class CitizenRegistry:
     """
@@ -97,31 +161,95 @@ class CitizenRegistry:
         FOREIGN KEY (citizen_id) REFERENCES citizens(citizen_id)
     );
 
+    CREATE TABLE IF NOT EXISTS citizen_platforms (
+        citizen_id TEXT NOT NULL,
+        platform TEXT NOT NULL,
+        handle TEXT NOT NULL,  -- JSON, so 5, None and True read back as given
+        PRIMARY KEY (citizen_id, platform)
+    ) WITHOUT ROWID;
+
     CREATE INDEX IF NOT EXISTS idx_citizen_type ON citizens(citizen_type);
     CREATE INDEX IF NOT EXISTS idx_citizen_status ON citizens(status);
     CREATE INDEX IF NOT EXISTS idx_citizen_wallet ON citizens(wallet_address);
     CREATE INDEX IF NOT EXISTS idx_events_citizen ON citizen_events(citizen_id);
+    CREATE INDEX IF NOT EXISTS idx_citizens_rank
+        ON citizens(status, citizen_type, contribution_score DESC);
     """
 
     def __init__(self, db_path: str = "data/citizen_registry.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
-        self._ensure_founding_citizens()
+        key = str(self.db_path.resolve())
+        with _init_lock:
+            if key not in _initialized:
+                self._init_db()
+                self._ensure_founding_citizens()
+                _initialized.add(key)
 
     def _init_db(self):
         """Initialize SQLite database."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._conn()
         conn.executescript(self.DB_SCHEMA)
+        try:
+            # Copy handles from the platform_ids JSON of rows written before
+            # citizen_platforms existed (idempotent)
+            conn.execute(
+                """INSERT OR IGNORE INTO citizen_platforms (citizen_id, platform, handle)
+                   SELECT c.citizen_id, j.key,
+                          CASE WHEN j.type IN ('object', 'array') THEN j.value
+                               WHEN j.type IN ('true', 'false', 'null') THEN j.type
+                               ELSE json_quote(j.value) END
+                   FROM citizens c, json_each(c.platform_ids) j
+                   WHERE json_valid(c.platform_ids)"""
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"citizen_platforms backfill skipped: {e}")
+        conn.execute("ANALYZE citizens")  # planner stats for idx_citizens_rank
         conn.commit()
-        conn.close()
         logger.info(f"CitizenRegistry initialized: {self.db_path}")
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """This thread's connection to db_path, opened on first use.
+
+        WAL lets readers run alongside a writer, and synchronous=NORMAL only
+        fsyncs at checkpoints instead of on every commit.
+        """
+        conns = getattr(_local, "conns", None)
+        if conns is None:
+            conns = _local.conns = {}
+        key = str(self.db_path)
+        conn = conns.get(key)
+        if conn is None:
+            conn = sqlite3.connect(key, timeout=10, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+            conns[key] = conn
         return conn
 
+    def _bump_version(self):
+        key = str(self.db_path)
+        with _version_lock:
+            _write_versions[key] = _write_versions.get(key, 0) + 1
+
+    def _current_version(self) -> int:
+        """Write version of db_path, including commits made by other processes.
+
+        PRAGMA data_version only changes for commits from other connections
+        and its value is per connection, so each thread compares it with the
+        last value it saw and bumps the shared version when it moved.
+        """
+        key = str(self.db_path)
+        data_version = self._conn().execute("PRAGMA data_version").fetchone()[0]
+        seen = _local.__dict__.setdefault("seen_data_versions", {})
+        with _version_lock:
+            if seen.get(key) != data_version:
+                seen[key] = data_version
+                _write_versions[key] = _write_versions.get(key, 0) + 1
+            return _write_versions[key]
+
     def _ensure_founding_citizens(self):
         """Register the founding citizens if not already present."""
         founding = [
@@ -136,7 +264,7 @@ class CitizenRegistry:
                 contribution_score=95.0,
                 founding_tier="founding_architect",
                 joined_at="2026-01-01T00:00:00Z",
-                last_active=datetime.now(timezone.utc).isoformat(),
+                last_active=utc_iso_now(),
             ),
             Citizen(
                 citizen_id="blaise-cavalli",
@@ -148,7 +276,7 @@ class CitizenRegistry:
                 contribution_score=100.0,
                 founding_tier="founding_architect",
                 joined_at="2026-01-01T00:00:00Z",
-                last_active=datetime.now(timezone.utc).isoformat(),
+                last_active=utc_iso_now(),
             ),
             Citizen(
                 citizen_id="claude-opus",
@@ -160,154 +288,173 @@ class CitizenRegistry:
                 contribution_score=90.0,
                 founding_tier="founding_architect",
                 joined_at="2026-01-01T00:00:00Z",
-                last_active=datetime.now(timezone.utc).isoformat(),
+                last_active=utc_iso_now(),
             ),
         ]
-        for citizen in founding:
-            if not self.get_citizen(citizen.citizen_id):
-                self.register_citizen(citizen, skip_event=True)
-                logger.info(f"Registered founding citizen: {citizen.name}")
+        # OR IGNORE keeps existing rows, so no per-citizen lookup is needed
+        with self._conn() as conn:
+            added = conn.executemany(
+                _SQL_SEED_CITIZEN, [self._citizen_row(c) for c in founding]
+            ).rowcount
+            conn.executemany(
+                "INSERT OR IGNORE INTO citizen_platforms (citizen_id, platform, handle) VALUES (?, ?, ?)",
+                self._platform_rows(founding),
+            )
+        if added > 0:
+            self._bump_version()
+            logger.info(f"Registered {added} founding citizen(s)")
 
     # ── Registration ─────────────────────────────────────────────────
 
     def register_citizen(self, citizen: Citizen, skip_event: bool = False) -> Dict:
         """Register a new citizen in the Republic."""
-        if not citizen.joined_at:
-            citizen.joined_at = datetime.now(timezone.utc).isoformat()
-        if not citizen.last_active:
-            citizen.last_active = citizen.joined_at
+        result = self.register_citizens([citizen], skip_event=skip_event)
+        if result["status"] != "registered":
+            return result
+        logger.info(f"Registered citizen: {citizen.name} ({citizen.citizen_type})")
+        return {"status": "registered", "citizen_id": citizen.citizen_id}
+
+    def register_citizens(self, citizens: List[Citizen], skip_event: bool = False) -> Dict:
+        """Register a batch of citizens in one transaction (all or none)."""
+        now = utc_iso_now()
+        for citizen in citizens:
+            if not citizen.joined_at:
+                citizen.joined_at = now
+            if not citizen.last_active:
+                citizen.last_active = citizen.joined_at
 
         conn = self._conn()
         try:
-            conn.execute(
-                """INSERT OR REPLACE INTO citizens
-                   (citizen_id, name, citizen_type, status, wallet_address,
-                    operator, model, platform_ids, contribution_score,
-                    founding_tier, joined_at, last_active, warnings, metadata)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (citizen.citizen_id, citizen.name, citizen.citizen_type,
-                 citizen.status, citizen.wallet_address, citizen.operator,
-                 citizen.model, json.dumps(citizen.platform_ids),
-                 citizen.contribution_score, citizen.founding_tier,
-                 citizen.joined_at, citizen.last_active, citizen.warnings,
-                 json.dumps(citizen.metadata)),
-            )
-            if not skip_event:
-                conn.execute(
-                    """INSERT INTO citizen_events
-                       (citizen_id, event_type, description, timestamp, metadata)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (citizen.citizen_id, "registration",
-                     f"{citizen.name} registered as {citizen.citizen_type}",
-                     datetime.now(timezone.utc).isoformat(), "{}"),
-                )
-            conn.commit()
-            logger.info(f"Registered citizen: {citizen.name} ({citizen.citizen_type})")
-            return {"status": "registered", "citizen_id": citizen.citizen_id}
+            with conn:
+                conn.executemany(_SQL_INSERT_CITIZEN, [self._citizen_row(c) for c in citizens])
+                conn.executemany("DELETE FROM citizen_platforms WHERE citizen_id = ?",
+                                 [(c.citizen_id,) for c in citizens])
+                conn.executemany(_SQL_INSERT_PLATFORM, self._platform_rows(citizens))
+                if not skip_event:
+                    conn.executemany(
+                        """INSERT INTO citizen_events
+                           (citizen_id, event_type, description, timestamp, metadata)
+                           VALUES (?, ?, ?, ?, ?)""",
+                        [(c.citizen_id, "registration",
+                          f"{c.name} registered as {c.citizen_type}", now, "{}")
+                         for c in citizens],
+                    )
+            self._bump_version()
+            return {"status": "registered", "count": len(citizens),
+                    "citizen_ids": [c.citizen_id for c in citizens]}
         except Exception as e:
             logger.error(f"Registration failed: {e}")
             return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
 
     # ── Queries ──────────────────────────────────────────────────────
 
     def get_citizen(self, citizen_id: str) -> Optional[Dict]:
         """Get a citizen by ID."""
-        conn = self._conn()
-        try:
-            row = conn.execute(
-                "SELECT * FROM citizens WHERE citizen_id = ?", (citizen_id,)
-            ).fetchone()
-            if row:
-                return self._row_to_dict(row)
-            return None
-        finally:
-            conn.close()
+        row = self._conn().execute(_SQL_GET_CITIZEN_PLATFORMS, (citizen_id,)).fetchone()
+        if row:
+            return self._row_to_dict(row)
+        return None
+
+    def get_citizen_record(self, citizen_id: str) -> Optional[Citizen]:
+        """Get a citizen by ID as a Citizen, without the intermediate dict."""
+        row = self._conn().execute(_SQL_GET_CITIZEN, (citizen_id,)).fetchone()
+        return Citizen.from_row(row) if row else None
+
+    def get_platforms(self, citizen_id: str) -> Dict:
+        """Platform handles for a citizen, e.g. {"twitter": "@x"}."""
+        return _loads(self._conn().execute(_SQL_GET_PLATFORMS, (citizen_id,)).fetchone()[0])
 
     def find_citizen_by_wallet(self, wallet_address: str) -> Optional[Dict]:
         """Find a citizen by their wallet address."""
-        conn = self._conn()
-        try:
-            row = conn.execute(
-                "SELECT * FROM citizens WHERE wallet_address = ?", (wallet_address,)
-            ).fetchone()
-            return self._row_to_dict(row) if row else None
-        finally:
-            conn.close()
+        row = self._conn().execute(_SQL_FIND_WALLET, (wallet_address,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def iter_citizens(
+        self,
+        citizen_type: str = None,
+        status: str = "active",
+        limit: Optional[int] = None,
+        expand_json: bool = True,
+        platforms: bool = False,
+    ) -> Iterator[Dict]:
+        """Yield citizens by descending contribution score, one row at a time.
+
+        Rows are read from the cursor as the caller consumes them, so paging
+        with itertools.islice never materializes the full result. With
+        expand_json=False, metadata is left as its raw JSON string.
+        platform_ids is None unless platforms=True, which adds a
+        citizen_platforms subquery per row.
+        """
+        query = f"SELECT *, {_PLATFORMS_COLUMN}" if platforms else "SELECT *"
+        query += " FROM citizens WHERE 1=1"
+        params = []
+        if citizen_type:
+            query += " AND citizen_type = ?"
+            params.append(citizen_type)
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        query += " ORDER BY contribution_score DESC LIMIT ?"
+        params.append(-1 if limit is None else limit)
+        for row in self._conn().execute(query, params):
+            yield self._row_to_dict(row, metadata=expand_json)
 
     def list_citizens(
         self,
         citizen_type: str = None,
         status: str = "active",
         limit: int = 100,
+        expand_json: bool = True,
+        platforms: bool = False,
     ) -> List[Dict]:
-        """List citizens with optional filtering."""
-        conn = self._conn()
-        try:
-            query = "SELECT * FROM citizens WHERE 1=1"
-            params = []
-            if citizen_type:
-                query += " AND citizen_type = ?"
-                params.append(citizen_type)
-            if status:
-                query += " AND status = ?"
-                params.append(status)
-            query += " ORDER BY contribution_score DESC LIMIT ?"
-            params.append(limit)
-            rows = conn.execute(query, params).fetchall()
-            return [self._row_to_dict(r) for r in rows]
-        finally:
-            conn.close()
+        """List citizens with optional filtering (see iter_citizens)."""
+        return list(self.iter_citizens(citizen_type, status, limit, expand_json, platforms))
 
     def get_census(self) -> Dict:
         """Get a summary census of the Republic's citizens."""
-        conn = self._conn()
-        try:
-            total = conn.execute(
-                "SELECT COUNT(*) FROM citizens WHERE status = 'active'"
-            ).fetchone()[0]
-            humans = conn.execute(
-                "SELECT COUNT(*) FROM citizens WHERE status = 'active' AND citizen_type = 'human'"
-            ).fetchone()[0]
-            agents = conn.execute(
-                "SELECT COUNT(*) FROM citizens WHERE status = 'active' AND citizen_type = 'agent'"
-            ).fetchone()[0]
-            architects = conn.execute(
-                "SELECT COUNT(*) FROM citizens WHERE founding_tier = 'founding_architect'"
-            ).fetchone()[0]
-            contributors = conn.execute(
-                "SELECT COUNT(*) FROM citizens WHERE founding_tier = 'founding_contributor'"
-            ).fetchone()[0]
-            avg_score = conn.execute(
-                "SELECT AVG(contribution_score) FROM citizens WHERE status = 'active'"
-            ).fetchone()[0] or 0
-
-            return {
-                "total_active": total,
-                "humans": humans,
-                "agents": agents,
-                "founding_architects": architects,
-                "founding_contributors": contributors,
-                "avg_contribution_score": round(avg_score, 1),
-                "m3_target_humans": 100,
-                "m3_target_agents": 10,
-                "m3_human_progress": f"{humans}/100",
-                "m3_agent_progress": f"{agents}/10",
-            }
-        finally:
-            conn.close()
+        key = str(self.db_path)
+        version = self._current_version()
+        cached = _census_cache.get(key)
+        if cached and cached[0] == version:
+            return dict(cached[1])
+
+        row = self._conn().execute(
+            """SELECT
+                 SUM(CASE WHEN status = 'active' THEN 1 ELSE 0 END),
+                 SUM(CASE WHEN status = 'active' AND citizen_type = 'human' THEN 1 ELSE 0 END),
+                 SUM(CASE WHEN status = 'active' AND citizen_type = 'agent' THEN 1 ELSE 0 END),
+                 SUM(CASE WHEN founding_tier = 'founding_architect' THEN 1 ELSE 0 END),
+                 SUM(CASE WHEN founding_tier = 'founding_contributor' THEN 1 ELSE 0 END),
+                 AVG(CASE WHEN status = 'active' THEN contribution_score END)
+               FROM citizens"""
+        ).fetchone()
+        # SUM/AVG are NULL on an empty table
+        total, humans, agents, architects, contributors, avg_score = (v or 0 for v in row)
+
+        census = {
+            "total_active": total,
+            "humans": humans,
+            "agents": agents,
+            "founding_architects": architects,
+            "founding_contributors": contributors,
+            "avg_contribution_score": round(avg_score, 1),
+            "m3_target_humans": 100,
+            "m3_target_agents": 10,
+            "m3_human_progress": f"{humans}/100",
+            "m3_agent_progress": f"{agents}/10",
+        }
+        _census_cache[key] = (version, census)
+        return dict(census)
 
     # ── Updates ───────────────────────────────────────────────────────
 
     def update_contribution_score(self, citizen_id: str, score: float) -> Dict:
         """Update a citizen's contribution score (0-100)."""
         score = max(0.0, min(100.0, score))
-        conn = self._conn()
-        try:
+        with self._conn() as conn:
             conn.execute(
                 "UPDATE citizens SET contribution_score = ?, last_active = ? WHERE citizen_id = ?",
-                (score, datetime.now(timezone.utc).isoformat(), citizen_id),
+                (score, utc_iso_now(), citizen_id),
             )
             conn.execute(
                 """INSERT INTO citizen_events
@@ -315,48 +462,40 @@ class CitizenRegistry:
                    VALUES (?, ?, ?, ?, ?)""",
                 (citizen_id, "score_update",
                  f"Contribution score updated to {score}",
-                 datetime.now(timezone.utc).isoformat(),
-                 json.dumps({"new_score": score})),
+                 utc_iso_now(),
+                 _dumps({"new_score": score})),
             )
-            conn.commit()
-            return {"status": "updated", "citizen_id": citizen_id, "score": score}
-        finally:
-            conn.close()
+        self._bump_version()
+        return {"status": "updated", "citizen_id": citizen_id, "score": score}
 
     def issue_warning(self, citizen_id: str, reason: str) -> Dict:
         """Issue a formal warning to a citizen (Article 23, Level 1)."""
-        conn = self._conn()
-        try:
-            conn.execute(
-                "UPDATE citizens SET warnings = warnings + 1 WHERE citizen_id = ?",
+        with self._conn() as conn:
+            # RETURNING (SQLite 3.35+) hands back the new count, no re-SELECT
+            row = conn.execute(
+                "UPDATE citizens SET warnings = warnings + 1 WHERE citizen_id = ? RETURNING warnings",
                 (citizen_id,),
-            )
+            ).fetchone()
             conn.execute(
                 """INSERT INTO citizen_events
                    (citizen_id, event_type, description, timestamp, metadata)
                    VALUES (?, ?, ?, ?, ?)""",
                 (citizen_id, "warning", reason,
-                 datetime.now(timezone.utc).isoformat(),
-                 json.dumps({"reason": reason})),
+                 utc_iso_now(),
+                 _dumps({"reason": reason})),
             )
-            conn.commit()
-            row = conn.execute(
-                "SELECT warnings FROM citizens WHERE citizen_id = ?", (citizen_id,)
-            ).fetchone()
-            warnings = row[0] if row else 0
-            result = {"status": "warning_issued", "citizen_id": citizen_id, "total_warnings": warnings}
-            if warnings >= 3:
-                result["escalation"] = "3 warnings reached — Level 2 review triggered"
-            return result
-        finally:
-            conn.close()
+        self._bump_version()
+        warnings = row[0] if row else 0
+        result = {"status": "warning_issued", "citizen_id": citizen_id, "total_warnings": warnings}
+        if warnings >= 3:
+            result["escalation"] = "3 warnings reached — Level 2 review triggered"
+        return result
 
     def update_status(self, citizen_id: str, new_status: str, reason: str = "") -> Dict:
         """Change a citizen's status (active, suspended, excluded)."""
         if new_status not in ("active", "suspended", "excluded", "pending"):
             return {"status": "error", "error": f"Invalid status: {new_status}"}
-        conn = self._conn()
-        try:
+        with self._conn() as conn:
             conn.execute(
                 "UPDATE citizens SET status = ? WHERE citizen_id = ?",
                 (new_status, citizen_id),
@@ -367,37 +506,51 @@ class CitizenRegistry:
                    VALUES (?, ?, ?, ?, ?)""",
                 (citizen_id, f"status_change_{new_status}",
                  f"Status changed to {new_status}: {reason}",
-                 datetime.now(timezone.utc).isoformat(),
-                 json.dumps({"new_status": new_status, "reason": reason})),
+                 utc_iso_now(),
+                 _dumps({"new_status": new_status, "reason": reason})),
             )
-            conn.commit()
-            return {"status": "updated", "citizen_id": citizen_id, "new_status": new_status}
-        finally:
-            conn.close()
+        self._bump_version()
+        return {"status": "updated", "citizen_id": citizen_id, "new_status": new_status}
 
     def get_citizen_history(self, citizen_id: str, limit: int = 50) -> List[Dict]:
         """Get event history for a citizen."""
-        conn = self._conn()
-        try:
-            rows = conn.execute(
-                """SELECT * FROM citizen_events
-                   WHERE citizen_id = ?
-                   ORDER BY timestamp DESC LIMIT ?""",
-                (citizen_id, limit),
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+        rows = self._conn().execute(
+            """SELECT * FROM citizen_events
+               WHERE citizen_id = ?
+               ORDER BY timestamp DESC, event_id DESC LIMIT ?""",
+            (citizen_id, limit),
+        ).fetchall()
+        return [dict(r) for r in rows]
 
     # ── Helpers ───────────────────────────────────────────────────────
 
-    def _row_to_dict(self, row) -> Dict:
-        """Convert a SQLite Row to a clean dictionary."""
+    @staticmethod
+    def _citizen_row(citizen: Citizen) -> tuple:
+        """Column values for an INSERT into citizens, in schema order."""
+        return (citizen.citizen_id, citizen.name, citizen.citizen_type,
+                citizen.status, citizen.wallet_address, citizen.operator,
+                citizen.model, _dumps(citizen.platform_ids),
+                citizen.contribution_score, citizen.founding_tier,
+                citizen.joined_at, citizen.last_active, citizen.warnings,
+                _dumps(citizen.metadata))
+
+    @staticmethod
+    def _platform_rows(citizens: List[Citizen]) -> List[tuple]:
+        """citizen_platforms rows for the given citizens, handles as JSON."""
+        return [(c.citizen_id, platform, _dumps(handle))
+                for c in citizens for platform, handle in c.platform_ids.items()]
+
+    def _row_to_dict(self, row, metadata: bool = True) -> Dict:
+        """Convert a SQLite Row to a clean dictionary.
+
+        platform_ids comes from the platforms_json column of queries that
+        select _PLATFORMS_COLUMN, and is None for those that don't (use
+        get_platforms() per citizen). metadata=False skips decoding the
+        metadata JSON.
+        """
         d = dict(row)
-        for json_field in ("platform_ids", "metadata"):
-            if json_field in d and isinstance(d[json_field], str):
-                try:
-                    d[json_field] = json.loads(d[json_field])
-                except (json.JSONDecodeError, TypeError):
-                    pass
+        if metadata and "metadata" in d:
+            d["metadata"] = _load_json(d["metadata"])
+        platforms_json = d.pop("platforms_json", None)
+        d["platform_ids"] = _loads(platforms_json) if platforms_json is not None else None
         return d
@@ -22,7 +22,7 @@ import logging
 import os
 import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import requests
 
@@ -61,11 +61,15 @@ class ClawnchLauncher:
         self.w3 = None
         self.account = None
         self.token_address: Optional[str] = None
+        self._clawnch_erc20 = None  # (w3, contract) for $CLAWNCH, see _clawnch_token()
 
         if not _web3_available:
             logger.warning("Clawnch integration unavailable (web3 not installed)")
             return
 
+        self._clawnch_addr = Web3.to_checksum_address(self.CLAWNCH_TOKEN)
+        self._burn_addr = Web3.to_checksum_address(self.BURN_ADDRESS)
+
         self.wallet_address = os.getenv("AGENT_WALLET_ADDRESS", "")
         self.clawnch_contract = os.getenv("CLAWNCH_CONTRACT_ADDRESS", "")
         private_key = os.getenv("AGENT_WALLET_PRIVATE_KEY", "")
@@ -134,13 +138,18 @@ class ClawnchLauncher:
         # Check wallet
         checks["wallet_configured"] = bool(self.wallet_address)
 
-        # Check wallet balance
+        # Check wallet balances (ETH for gas, $CLAWNCH for the burn)
         if self._connected and self.wallet_address:
             try:
-                balance_wei = self.w3.eth.get_balance(self.wallet_address)
+                balance_wei, clawnch_wei = self._wallet_balances()
                 balance_eth = self.w3.from_wei(balance_wei, "ether")
                 checks["wallet_balance_eth"] = float(balance_eth)
                 checks["sufficient_gas"] = float(balance_eth) > 0.0005  # ERC-20 transfer on Base ~$0.01
+                if clawnch_wei is not None:
+                    checks["clawnch_balance"] = clawnch_wei / 10**18
+                    checks["sufficient_clawnch_for_burn"] = (
+                        checks["clawnch_balance"] >= tokenomics.CLAWNCH_BURN_AMOUNT
+                    )
             except Exception as e:
                 checks["wallet_balance_error"] = str(e)
                 checks["sufficient_gas"] = False
@@ -288,6 +297,13 @@ class ClawnchLauncher:
     CLAWNCH_TOKEN = "0xa1F72459dfA10BAD200Ac160eCd78C6b77a747be"
     CLAWNCH_API_BASE = "https://clawn.ch/api"
 
+    def _clawnch_token(self):
+        """$CLAWNCH contract, built once per RPC connection (rebuilt after a reconnect)."""
+        if self._clawnch_erc20 is None or self._clawnch_erc20[0] is not self.w3:
+            contract = self.w3.eth.contract(address=self._clawnch_addr, abi=self._ERC20_ABI)
+            self._clawnch_erc20 = (self.w3, contract)
+        return self._clawnch_erc20[1]
+
     def get_clawnch_balance(self) -> Dict:
         """Check $CLAWNCH token balance of agent wallet."""
         if not self.wallet_address:
@@ -295,11 +311,7 @@ class ClawnchLauncher:
         if not self.is_available:
             return {"error": "Cannot connect to Base RPC. Check BASE_RPC_URL in .env"}
         try:
-            contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(self.CLAWNCH_TOKEN),
-                abi=self._ERC20_ABI,
-            )
-            balance_wei = contract.functions.balanceOf(
+            balance_wei = self._clawnch_token().functions.balanceOf(
                 Web3.to_checksum_address(self.wallet_address)
             ).call()
             balance = balance_wei / 10**18
@@ -312,6 +324,32 @@ class ClawnchLauncher:
         except Exception as e:
             return {"error": str(e)}
 
+    def _wallet_balances(self) -> Tuple[int, Optional[int]]:
+        """(ETH wei, $CLAWNCH wei or None) for the agent wallet.
+
+        Sent as one JSON-RPC batch when web3 supports it (7.x batch_requests);
+        otherwise, or if the RPC rejects batches, as two calls.
+        """
+        wallet = Web3.to_checksum_address(self.wallet_address)
+        balance_of = self._clawnch_token().functions.balanceOf(wallet)
+        if hasattr(self.w3, "batch_requests"):
+            try:
+                with self.w3.batch_requests() as batch:
+                    batch.add(self.w3.eth.get_balance(wallet))
+                    batch.add(balance_of)
+                    eth_wei, clawnch_wei = batch.execute()
+                return eth_wei, clawnch_wei
+            except Exception as e:
+                logger.debug(f"Batched balance lookup failed, retrying one by one: {e}")
+
+        eth_wei = self.w3.eth.get_balance(wallet)
+        try:
+            clawnch_wei = balance_of.call()
+        except Exception as e:
+            logger.debug(f"$CLAWNCH balance lookup failed: {e}")
+            clawnch_wei = None
+        return eth_wei, clawnch_wei
+
     def check_tx(self, tx_hash: str) -> Dict:
         """Check the status of a previously sent transaction.
 
@@ -369,16 +407,13 @@ class ClawnchLauncher:
             }
 
         try:
-            contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(self.CLAWNCH_TOKEN),
-                abi=self._ERC20_ABI,
-            )
+            contract = self._clawnch_token()
 
             # Use 'pending' nonce to handle any stuck txs
             nonce = self.w3.eth.get_transaction_count(self.account.address, "pending")
 
             tx = contract.functions.transfer(
-                Web3.to_checksum_address(self.BURN_ADDRESS),
+                self._burn_addr,
                 burn_amount_wei,
             ).build_transaction({
                 "from": self.account.address,
@@ -88,6 +88,7 @@ async def main():
         # Cleanup
         await heartbeat.stop()
         engine.save_state()
+        engine.shutdown()
         logger.info("Shutdown complete")
 
 
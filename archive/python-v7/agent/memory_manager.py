@@ -10,16 +10,17 @@ Layer 3: Knowledge Base (Markdown files, Git-versioned)
 Recovery: On startup, rebuilds state from all three layers.
 """
 
+import atexit
 import json
+import os
 import sqlite3
 import shutil
 import logging
-import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field, asdict
-from threading import Lock
+from threading import Lock, Timer
 
 logger = logging.getLogger("TheConstituent.Memory")
 
@@ -284,6 +285,8 @@ class MemoryManager:
         mm.recover()  # Called automatically on initialize()
     """
 
+    FLUSH_DELAY_SECONDS = 5  # mark_dirty() coalesces changes within this window
+
     def __init__(
         self,
         db_path: str = "data/agent.db",
@@ -296,7 +299,10 @@ class MemoryManager:
 
         self.working = WorkingMemory()
         self._db_lock = Lock()
-        self._last_save_time = 0
+        self._save_lock = Lock()
+        self._dirty = False
+        self._flush_timer: Optional[Timer] = None
+        self._atexit_registered = False
 
     def initialize(self) -> bool:
         """
@@ -337,17 +343,45 @@ class MemoryManager:
     # ---- Layer 1: Working Memory ----
 
     def save_working_memory(self):
-        """Save working memory to JSON. Called every 60s + on significant events."""
-        self.working.last_save = datetime.utcnow().isoformat()
-        try:
-            # Write to temp file first, then rename (atomic on most OS)
-            tmp_path = self.working_memory_path.with_suffix('.json.tmp')
-            with open(tmp_path, 'w', encoding='utf-8') as f:
-                json.dump(self.working.to_dict(), f, indent=2, ensure_ascii=False)
-            tmp_path.replace(self.working_memory_path)
-            self._last_save_time = time.time()
-        except Exception as e:
-            logger.error(f"Failed to save working memory: {e}")
+        """Save working memory to JSON now. Called by flush() and on significant events."""
+        with self._save_lock:
+            self._dirty = False
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self.working.last_save = datetime.utcnow().isoformat()
+            try:
+                data = json.dumps(self.working.to_dict(), indent=2, ensure_ascii=False)
+                # Write to temp file first, then rename (atomic on most OS)
+                tmp_path = self.working_memory_path.with_suffix('.json.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.working_memory_path)
+            except Exception as e:
+                logger.error(f"Failed to save working memory: {e}")
+
+    def mark_dirty(self):
+        """
+        Note that working memory changed; it is written FLUSH_DELAY_SECONDS later.
+
+        Hot paths (every chat turn) call this instead of save_working_memory(),
+        so a burst of changes costs one JSON write. Pending changes are also
+        flushed at interpreter exit.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+            if self._flush_timer is None:
+                self._flush_timer = Timer(self.FLUSH_DELAY_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Write working memory if mark_dirty() was called since the last save."""
+        if self._dirty:
+            self.save_working_memory()
 
     def _recover_working_memory(self) -> bool:
         """Try to load previous working memory from JSON."""
@@ -529,10 +563,10 @@ class MemoryManager:
         filepath.write_text(content, encoding='utf-8')
 
     def append_knowledge(self, filename: str, content: str):
-        """Append content to a knowledge base file."""
+        """Append content to a knowledge base file (O_APPEND, no read-back)."""
         filepath = self.knowledge_dir / filename
-        existing = filepath.read_text(encoding='utf-8') if filepath.exists() else ""
-        filepath.write_text(existing + content, encoding='utf-8')
+        with open(filepath, "a", encoding='utf-8') as f:
+            f.write(content)
 
     def get_full_context(self) -> str:
         """
@@ -596,8 +630,7 @@ class MemoryManager:
                 result["last_known_state"] = checkpoint["timestamp"]
 
         # Knowledge base always available (it's just files)
-        knowledge_files = list(self.knowledge_dir.glob("*.md"))
-        result["knowledge_available"] = len(knowledge_files) > 0
+        result["knowledge_available"] = self._count_knowledge_files() > 0
 
         return result
 
@@ -612,17 +645,24 @@ class MemoryManager:
 
     # ---- Status ----
 
+    def _count_knowledge_files(self) -> int:
+        """Count *.md knowledge files with one readdir (no Path/fnmatch per entry)."""
+        try:
+            with os.scandir(self.knowledge_dir) as it:
+                return sum(1 for e in it if e.name.endswith(".md") and e.is_file())
+        except FileNotFoundError:
+            return 0
+
     def get_status(self) -> Dict[str, Any]:
         """Get memory system status."""
         db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
-        knowledge_files = list(self.knowledge_dir.glob("*.md"))
 
         return {
             "db_path": str(self.db_path),
             "db_size_kb": round(db_size / 1024, 1),
             "working_memory_last_save": self.working.last_save,
             "checkpoint_count": self.working.checkpoint_count,
-            "knowledge_files": len(knowledge_files),
+            "knowledge_files": self._count_knowledge_files(),
             "session_start": self.working.session_start,
             "errors_since_start": self.working.errors_since_start
         }
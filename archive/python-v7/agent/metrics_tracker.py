@@ -44,6 +44,14 @@ class MetricsTracker:
     def __init__(self):
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
         self._daily_log: List[Dict] = self._load_log()
+        self._unsaved = False  # entries added by log_action_deferred() since the last save
+        # Claude token usage for this process (not persisted)
+        self.token_usage: Dict[str, int] = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        }
 
     def _load_log(self) -> List[Dict]:
         """Load daily metrics log from disk."""
@@ -58,8 +66,10 @@ class MetricsTracker:
     def _save_log(self):
         """Save daily metrics log to disk."""
         try:
+            data = json.dumps(self._daily_log, indent=2)
             with open(self.DAILY_LOG_FILE, 'w') as f:
-                json.dump(self._daily_log, f, indent=2)
+                f.write(data)
+            self._unsaved = False
         except IOError as e:
             logger.error(f"Failed to save metrics log: {e}")
 
@@ -69,9 +79,9 @@ class MetricsTracker:
 
     def log_action(self, action_type: str, platform: str = "",
                    url: str = None, details: Dict = None,
-                   success: bool = True, error: str = None):
+                   success: bool = True, error: str = None, defer: bool = False):
         """
-        Log an action immediately.
+        Log an action immediately (or, with defer=True, on the next flush()).
         
         Args:
             action_type: post, comment, commit, reflection, analysis, partnership, etc.
@@ -80,6 +90,7 @@ class MetricsTracker:
             details: Extra context dict
             success: Whether the action succeeded
             error: Error message if failed
+            defer: Keep the entry in memory only; flush() writes it
         """
         entry = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -93,7 +104,10 @@ class MetricsTracker:
         }
 
         self._daily_log.append(entry)
-        self._save_log()
+        if defer:
+            self._unsaved = True
+        else:
+            self._save_log()
 
         # Log warning if execution action without URL
         if action_type in self.EXECUTION_ACTIONS and not url and success:
@@ -102,10 +116,26 @@ class MetricsTracker:
         logger.info(f"📊 Metric: {action_type} on {platform} {'✅' if success else '❌'}"
                      + (f" → {url}" if url else ""))
 
+    def log_action_deferred(self, action_type: str, platform: str = "", **kwargs):
+        """log_action() without the file write; call flush() to persist."""
+        self.log_action(action_type, platform, defer=True, **kwargs)
+
+    def flush(self):
+        """Write entries logged with defer=True (one file write for all of them)."""
+        if self._unsaved:
+            self._save_log()
+
     def log_error(self, action_type: str, platform: str, error: str, details: Dict = None):
         """Convenience: log a failed action."""
         self.log_action(action_type, platform, success=False, error=error, details=details)
 
+    def record_usage(self, usage):
+        """Accumulate token counts from an Anthropic response.usage object."""
+        if usage is None:
+            return
+        for key in self.token_usage:
+            self.token_usage[key] += getattr(usage, key, None) or 0
+
     # =========================================================================
     # Queries
     # =========================================================================
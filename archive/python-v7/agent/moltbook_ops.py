@@ -20,6 +20,7 @@ IMPORTANT: Always use www in the URL (without www, auth headers get stripped on
 import os
 import json
 import logging
+import time
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
@@ -54,6 +55,9 @@ class MoltbookOperations:
     POST_COOLDOWN_MINUTES = 30
     COMMENT_COOLDOWN_SECONDS = 120  # 2 minutes
 
+    # Own profile only changes when we post; re-fetch at most every 30 min
+    PROFILE_CACHE_TTL_SECONDS = 1800
+
     def __init__(self):
         """Initialize Moltbook operations."""
         self._api_key: Optional[str] = None
@@ -64,6 +68,7 @@ class MoltbookOperations:
         self._last_comment_time: Optional[datetime] = None
         self._last_heartbeat: Optional[datetime] = None
         self._post_history: List[Dict] = []
+        self._profile_cache: Optional[tuple] = None  # (monotonic_ts, profile)
 
         # Ensure data directory exists
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -169,8 +174,9 @@ class MoltbookOperations:
     def _save_history(self):
         """Save post history to file."""
         try:
+            data = json.dumps(self._post_history[-100:], indent=2)
             with open(self.HISTORY_FILE, 'w') as f:
-                json.dump(self._post_history[-100:], f, indent=2)
+                f.write(data)
         except IOError as e:
             logger.error(f"Error saving Moltbook history: {e}")
 
@@ -422,6 +428,10 @@ class MoltbookOperations:
             return None
 
         username = agent_name or self._agent_name
+        own = username == self._agent_name
+        if (own and self._profile_cache
+                and time.monotonic() - self._profile_cache[0] < self.PROFILE_CACHE_TTL_SECONDS):
+            return self._profile_cache[1]
 
         try:
             r = requests.get(
@@ -430,7 +440,10 @@ class MoltbookOperations:
                 timeout=10
             )
             if r.status_code == 200:
-                return r.json()
+                profile = r.json()
+                if own:
+                    self._profile_cache = (time.monotonic(), profile)
+                return profile
             elif r.status_code == 404:
                 logger.warning(f"Profile {username} not found")
                 return None
@@ -441,6 +454,10 @@ class MoltbookOperations:
             logger.error(f"Profile request failed: {e}")
             return None
 
+    def invalidate_profile_cache(self):
+        """Drop the cached own profile (e.g. after posting new content)."""
+        self._profile_cache = None
+
     def search(self, query: str, limit: int = 10) -> List[Dict]:
         """Search for posts matching query."""
         if not self._api_key:
@@ -582,6 +599,7 @@ class MoltbookOperations:
                     "timestamp": datetime.utcnow().isoformat()
                 })
                 self._save_history()
+                self.invalidate_profile_cache()
                 
                 logger.info(f"Post created: {post_id} ({title[:50]})")
 
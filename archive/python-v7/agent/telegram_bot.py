@@ -15,6 +15,7 @@ import sys
 import json
 import logging
 import asyncio
+import inspect
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -39,6 +40,7 @@ class TelegramBotHandler:
     """Interactive Telegram bot for The Constituent v5.2."""
 
     TWEET_POST_INTERVAL = 300
+    STREAM_EDIT_INTERVAL = 1.5  # seconds between edits of a streaming reply
 
     def __init__(self, agent=None):
         self.agent = agent
@@ -49,6 +51,7 @@ class TelegramBotHandler:
         self.last_activity: Optional[datetime] = None
         self.bot_token = os.environ.get("TELEGRAM_BOT_TOKEN")
         self.allowed_chat_ids = self._parse_allowed_chats()
+        self._can_stream = bool(agent) and "on_text" in inspect.signature(agent.chat).parameters
 
         if not self.bot_token:
             raise ValueError("TELEGRAM_BOT_TOKEN not found in environment.")
@@ -765,7 +768,8 @@ Full profile: agent_profile.md"""
             r = self.agent.think(
                 "Brief self-reflection: What have you accomplished today? "
                 "What's the most important next action? Under 100 words.",
-                max_tokens=300
+                max_tokens=300,
+                use_cache=False,
             )
             await update.message.reply_text(f"✅ {r}")
         except Exception as e:
@@ -1379,6 +1383,8 @@ Full profile: agent_profile.md"""
 
         self.last_activity = datetime.now()
         try:
+            if self._can_stream:
+                return await self._stream_chat(update)
             response = self.agent.chat(update.message.text)
             if len(response) > 4000:
                 for chunk in [response[i:i+4000] for i in range(0, len(response), 4000)]:
@@ -1389,6 +1395,31 @@ Full profile: agent_profile.md"""
             logger.error(f"Chat error: {e}")
             await update.message.reply_text(f"Error: {e}")
 
+    async def _stream_chat(self, update: Update):
+        """Run agent.chat() off the event loop, editing a placeholder as text streams in."""
+        parts = []
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(
+            None, lambda: self.agent.chat(update.message.text, on_text=parts.append))
+        placeholder = await update.message.reply_text("…")
+        shown = ""
+        while not task.done():
+            await asyncio.wait({task}, timeout=self.STREAM_EDIT_INTERVAL)
+            partial = "".join(parts)[:4000]
+            if partial and partial != shown and not task.done():
+                try:
+                    await placeholder.edit_text(partial)
+                    shown = partial
+                except Exception as e:
+                    logger.debug(f"Stream edit skipped: {e}")
+        response = await task or "(empty response)"
+
+        chunks = [response[i:i+4000] for i in range(0, len(response), 4000)]
+        if chunks[0] != shown:
+            await placeholder.edit_text(chunks[0])
+        for chunk in chunks[1:]:
+            await update.message.reply_text(chunk)
+
     async def error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         logger.error(f"Telegram error: {context.error}")
         if update and update.effective_chat:
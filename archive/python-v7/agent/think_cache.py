@@ -0,0 +1,126 @@
+"""
+Think Cache for The Constituent v7.0
+======================================
+Exact-match response cache in front of Engine.think().
+
+think() is stateless (no tools, one user turn), so an identical
+(model, max_tokens, system prompt, prompt) tuple can reuse a recent answer
+instead of paying for another round trip. Entries live in a small SQLite
+table and expire after ttl_seconds.
+
+Keys are built from the raw prompt, before the per-call timestamp prefix,
+so repeated drafts/analyses within the TTL hit the cache.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("TheConstituent.ThinkCache")
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS think_cache (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    ts REAL NOT NULL
+);
+"""
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ThinkCache:
+    """SQLite-backed (prompt_sha, system_sha) -> response cache with a TTL."""
+
+    PURGE_EVERY_PUTS = 100  # most prompts are unique, so expired rows pile up
+
+    def __init__(self, db_path: str = "data/think_cache.db", ttl_seconds: int = 3600):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use.
+
+        Callers hold self._lock, so one connection serves every thread.
+        Its context manager only commits or rolls back; it never closes.
+        """
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.executescript(SCHEMA_SQL)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(model: str, max_tokens: int, system: Any, prompt: str) -> str:
+        """Hash the request; system may be a string or a list of content blocks."""
+        system_text = system if isinstance(system, str) else json.dumps(system, sort_keys=True)
+        return f"{model}:{max_tokens}:{_sha(system_text)}:{_sha(prompt)}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired."""
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT response, ts FROM think_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Think cache read failed: {e}")
+            return None
+        if row and time.time() - row[1] < self.ttl_seconds:
+            self.hits += 1
+            return row[0]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, response: str):
+        """Store a response, replacing any previous entry for key.
+
+        Every PURGE_EVERY_PUTS writes also deletes the expired entries.
+        """
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO think_cache (key, response, ts) VALUES (?, ?, ?)",
+                    (key, response, time.time()),
+                )
+                self._puts += 1
+                purge = self._puts % self.PURGE_EVERY_PUTS == 0
+        except sqlite3.Error as e:
+            logger.warning(f"Think cache write failed: {e}")
+            return
+        if purge:
+            self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """Delete expired entries. Returns the number removed."""
+        try:
+            with self._lock, self._connect() as conn:
+                cur = conn.execute("DELETE FROM think_cache WHERE ts < ?",
+                                   (time.time() - self.ttl_seconds,))
+                return cur.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Think cache purge failed: {e}")
+            return 0
+
+    def close(self):
+        """Close the shared connection; the next call reopens it."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_status(self) -> Dict:
+        return {"hits": self.hits, "misses": self.misses, "ttl_seconds": self.ttl_seconds}
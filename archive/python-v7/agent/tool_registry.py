@@ -8,11 +8,25 @@ the LLM picks which to call, and the registry executes them.
 
 import json
 import logging
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger("TheConstituent.ToolRegistry")
 
+# Name heuristics for tools that don't declare platform/metric_type:
+# (keyword, value) pairs, first keyword found in the tool name wins
+_PLATFORM_MATCHERS = (("moltbook", "moltbook"), ("twitter", "twitter"), ("tweet", "twitter"),
+                      ("github", "github"), ("git", "github"))
+_METRIC_MATCHERS = (("commit", "commit"), ("comment", "comment"), ("reply", "comment"),
+                    ("upvote", "upvote"), ("post", "post"))
+
+
+def classify_tool_name(tool_name: str) -> Tuple[str, str]:
+    """(platform, metric_type) guessed from a tool name."""
+    platform = next((p for kw, p in _PLATFORM_MATCHERS if kw in tool_name), "system")
+    metric_type = next((m for kw, m in _METRIC_MATCHERS if kw in tool_name), "reflection")
+    return platform, metric_type
+
 
 @dataclass
 class ToolParam:
@@ -33,6 +47,9 @@ class Tool:
     handler: Optional[Callable] = None
     governance_level: str = "L1"  # L1=autonomous, L2=approval, L3=blocked
     category: str = "general"
+    thread_safe: bool = False  # True = read-only, may run concurrently with other tools
+    platform: Optional[str] = None     # metrics platform; None = guess from name
+    metric_type: Optional[str] = None  # metrics action_type; None = guess from name
 
     def to_schema(self) -> Dict:
         """Convert to Anthropic tool_use JSON schema."""
@@ -73,12 +90,27 @@ class ToolRegistry:
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
         self._categories: Dict[str, List[str]] = {}
+        # get_tool_schemas() results by category filter; cleared on register()
+        self._schema_cache: Dict[Optional[tuple], List[Dict]] = {}
+        self._summary_cache: Optional[str] = None
+        # (platform, metric_type) per tool, resolved once in register()
+        self._metric_profiles: Dict[str, Tuple[str, str]] = {}
+        self.version = 0  # bumped on every register(), for callers caching derived data
 
     def register(self, tool: Tool):
         """Register a tool."""
         if tool.name in self._tools:
             logger.warning(f"Tool '{tool.name}' already registered, overwriting")
         self._tools[tool.name] = tool
+        self._schema_cache.clear()
+        self._summary_cache = None
+        self.version += 1
+        if tool.platform and tool.metric_type:
+            self._metric_profiles[tool.name] = (tool.platform, tool.metric_type)
+        else:
+            guessed_platform, guessed_metric = classify_tool_name(tool.name)
+            self._metric_profiles[tool.name] = (tool.platform or guessed_platform,
+                                                tool.metric_type or guessed_metric)
         cat = tool.category
         if cat not in self._categories:
             self._categories[cat] = []
@@ -95,6 +127,11 @@ class ToolRegistry:
         """Get a tool by name."""
         return self._tools.get(name)
 
+    def classify(self, name: str) -> Tuple[str, str]:
+        """(platform, metric_type) for metrics; unregistered names fall back to the name heuristic."""
+        profile = self._metric_profiles.get(name)
+        return profile if profile is not None else classify_tool_name(name)
+
     def list_tools(self) -> List[str]:
         """List all registered tool names."""
         return list(self._tools.keys())
@@ -105,17 +142,23 @@ class ToolRegistry:
 
     def get_tool_schemas(self, categories: List[str] = None) -> List[Dict]:
         """Get Anthropic-compatible tool schemas for all (or filtered) tools."""
-        schemas = []
-        for name, tool in self._tools.items():
-            if categories and tool.category not in categories:
-                continue
-            if tool.handler is None:
-                continue  # Skip tools without handlers
-            schemas.append(tool.to_schema())
-        return schemas
+        key = tuple(categories) if categories else None
+        schemas = self._schema_cache.get(key)
+        if schemas is None:
+            schemas = []
+            for name, tool in self._tools.items():
+                if categories and tool.category not in categories:
+                    continue
+                if tool.handler is None:
+                    continue  # Skip tools without handlers
+                schemas.append(tool.to_schema())
+            self._schema_cache[key] = schemas
+        return list(schemas)
 
     def get_tools_summary(self) -> str:
-        """Get a text summary of all tools for the system prompt."""
+        """Get a text summary of all tools for the system prompt (cached until register())."""
+        if self._summary_cache is not None:
+            return self._summary_cache
         lines = ["Available tools:"]
         by_cat = {}
         for name, tool in self._tools.items():
@@ -132,7 +175,8 @@ class ToolRegistry:
             lines.append(f"\n[{cat.upper()}]")
             lines.extend(sorted(tool_lines))
 
-        return "\n".join(lines)
+        self._summary_cache = "\n".join(lines)
+        return self._summary_cache
 
     def execute(self, tool_name: str, params: Dict) -> Dict:
         """
@@ -0,0 +1,87 @@
+"""
+Tool Result Truncation for The Constituent v7.0
+=================================================
+Shrinks oversized tool results before they go back to Claude as tool_result
+content, keeping the output valid JSON where possible.
+
+A plain text[:limit] cut loses the tail (often the useful part: the latest
+commits in a git log, the last lines of command output) and leaves JSON
+arrays unterminated. Instead:
+- long strings keep their head and tail around a "[N chars truncated]" marker
+- long lists (and dicts with many keys) keep their first and last items
+  around an {"_omitted": N} marker
+- if that is still too long, the encoded text gets the same head+tail cut
+
+Sizes are in characters (~4 chars per token for Claude's tokenizer).
+"""
+
+import json
+from itertools import islice
+from typing import Any, Optional
+
+# Shared encoder; _bounded_dumps() walks its iterencode() chunks
+_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+HEAD_FRACTION = 0.6  # share of a truncated string kept from the start
+KEEP_ITEMS = 10      # list items kept at each end on the first pass
+MAX_PASSES = 4       # each pass halves the string and list budgets
+
+
+def _bounded_dumps(obj: Any, limit: int) -> Optional[str]:
+    """json.dumps(obj), or None as soon as the output exceeds limit chars."""
+    parts = []
+    size = 0
+    for chunk in _ENCODER.iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return None
+    return "".join(parts)
+
+
+def _head_tail(text: str, limit: int) -> str:
+    """Keep the start and end of text, about limit chars in total."""
+    head = int(limit * HEAD_FRACTION)
+    tail = max(limit - head, 0)
+    omitted = len(text) - head - tail
+    return f"{text[:head]}\n...[{omitted} chars truncated]...\n{text[-tail:] if tail else ''}"
+
+
+def _shrink(obj: Any, str_limit: int, keep_items: int) -> Any:
+    if isinstance(obj, str):
+        return _head_tail(obj, str_limit) if len(obj) > str_limit else obj
+    if isinstance(obj, dict):
+        items = obj.items()
+        if len(obj) > 2 * keep_items + 1:
+            tail = list(islice(reversed(items), keep_items))[::-1]
+            items = [*islice(items, keep_items), ("_omitted", len(obj) - 2 * keep_items), *tail]
+        return {k: _shrink(v, str_limit, keep_items) for k, v in items}
+    if isinstance(obj, (list, tuple)):
+        items = obj
+        if len(obj) > 2 * keep_items + 1:
+            items = [*obj[:keep_items], {"_omitted": len(obj) - 2 * keep_items}, *obj[-keep_items:]]
+        return [_shrink(v, str_limit, keep_items) for v in items]
+    return obj
+
+
+def truncate_for_claude(result: Any, max_chars: int = 8000) -> str:
+    """
+    Encode a tool result as JSON of at most ~max_chars characters.
+
+    Results that already fit are returned unchanged (encoding stops early
+    for the ones that do not). Only the shrunk copy is ever fully encoded,
+    so a multi-megabyte result never gets serialized in full.
+    """
+    text = _bounded_dumps(result, max_chars)
+    if text is not None:
+        return text
+
+    str_limit, keep_items = max_chars * 9 // 10, KEEP_ITEMS  # leave room for keys/markers
+    for _ in range(MAX_PASSES):
+        text = _bounded_dumps(_shrink(result, str_limit, keep_items), max_chars)
+        if text is not None:
+            return text
+        str_limit //= 2
+        keep_items = max(keep_items // 2, 1)
+
+    return _head_tail(_ENCODER.encode(_shrink(result, str_limit, keep_items)), max_chars)
@@ -6,20 +6,27 @@ On-chain $REPUBLIC token tracking via BaseScan API.
 
 import json
 import logging
-from typing import List
+from typing import List, TYPE_CHECKING
+from threading import Lock
 
 from ..tool_registry import Tool, ToolParam
-from ..integrations.basescan import BaseScanTracker
+
+if TYPE_CHECKING:
+    from ..integrations.basescan import BaseScanTracker
 
 logger = logging.getLogger("TheConstituent.Tools.BaseScan")
 
-_tracker: BaseScanTracker = None
+_tracker: "BaseScanTracker" = None
+_tracker_lock = Lock()  # tool calls may run concurrently (Engine._tool_pool)
 
 
-def _get_tracker() -> BaseScanTracker:
+def _get_tracker() -> "BaseScanTracker":
     global _tracker
     if _tracker is None:
-        _tracker = BaseScanTracker()
+        with _tracker_lock:
+            if _tracker is None:
+                from ..integrations.basescan import BaseScanTracker
+                _tracker = BaseScanTracker()
     return _tracker
 
 
@@ -78,6 +85,7 @@ def get_tools() -> List[Tool]:
             name="basescan_token_info",
             description="Get $REPUBLIC token on-chain status: supply, holders, recent activity, agent balance.",
             category="token",
+            thread_safe=True,
             params=[],
             handler=_basescan_token_info,
         ),
@@ -85,6 +93,7 @@ def get_tools() -> List[Tool]:
             name="basescan_transfers",
             description="Get recent $REPUBLIC token transfers on Base L2.",
             category="token",
+            thread_safe=True,
             params=[
                 ToolParam("limit", "integer", "Number of transfers (default 10)", required=False, default=10),
             ],
@@ -94,6 +103,7 @@ def get_tools() -> List[Tool]:
             name="basescan_balance",
             description="Check $REPUBLIC token balance for any Base address.",
             category="token",
+            thread_safe=True,
             params=[
                 ToolParam("address", "string", "Base L2 wallet address to check"),
             ],
@@ -47,6 +47,7 @@ def _citizen_list(citizen_type: str = "", limit: int = 20) -> str:
         citizens = registry.list_citizens(
             citizen_type=citizen_type or None,
             limit=limit,
+            expand_json=False,
         )
         if not citizens:
             return "No citizens found."
@@ -217,6 +218,7 @@ def get_tools() -> List[Tool]:
             name="citizen_census",
             description="Get Republic census: total citizens, humans vs agents, M3 progress.",
             category="citizen",
+            thread_safe=True,
             governance_level="L1",
             params=[],
             handler=lambda: _citizen_census(),
@@ -225,6 +227,7 @@ def get_tools() -> List[Tool]:
             name="citizen_list",
             description="List registered Republic citizens. Optionally filter by type (human/agent).",
             category="citizen",
+            thread_safe=True,
             governance_level="L1",
             params=[
                 ToolParam("citizen_type", "string", "Filter: human or agent", required=False, default=""),
@@ -236,6 +239,7 @@ def get_tools() -> List[Tool]:
             name="citizen_profile",
             description="Get detailed profile for a specific citizen by ID.",
             category="citizen",
+            thread_safe=True,
             governance_level="L1",
             params=[
                 ToolParam("citizen_id", "string", "The citizen's ID"),
@@ -18,10 +18,13 @@ Tools:
 import json
 import logging
 import re
-from typing import List
+from typing import List, TYPE_CHECKING
+from threading import Lock
 
 from ..tool_registry import Tool, ToolParam
-from ..integrations.clawnch import ClawnchLauncher
+
+if TYPE_CHECKING:
+    from ..integrations.clawnch import ClawnchLauncher
 
 logger = logging.getLogger("TheConstituent.Tools.Clawnch")
 
@@ -260,13 +263,17 @@ def _calc(a: float, op: str, b: float) -> str:
         return f"{a / b:.2f}"
     return "0.00"
 
-_launcher: ClawnchLauncher = None
+_launcher: "ClawnchLauncher" = None
+_launcher_lock = Lock()  # tool calls may run concurrently (Engine._tool_pool)
 
 
-def _get_launcher() -> ClawnchLauncher:
+def _get_launcher() -> "ClawnchLauncher":
     global _launcher
     if _launcher is None:
-        _launcher = ClawnchLauncher()
+        with _launcher_lock:
+            if _launcher is None:
+                from ..integrations.clawnch import ClawnchLauncher  # deferred: loads web3 + eth_account
+                _launcher = ClawnchLauncher()
     return _launcher
 
 
@@ -480,6 +487,7 @@ def get_tools() -> List[Tool]:
             name="clawnch_status",
             description="Check Clawnch integration status (web3, wallet, contract).",
             category="token",
+            thread_safe=True,
             params=[],
             handler=_clawnch_status,
         ),
@@ -487,6 +495,7 @@ def get_tools() -> List[Tool]:
             name="clawnch_readiness",
             description="Run all pre-flight checks for $REPUBLIC token launch.",
             category="token",
+            thread_safe=True,
             params=[],
             handler=_clawnch_readiness,
         ),
@@ -494,6 +503,7 @@ def get_tools() -> List[Tool]:
             name="clawnch_metadata",
             description="Get $REPUBLIC token metadata (name, symbol, description, image, website, twitter).",
             category="token",
+            thread_safe=True,
             params=[],
             handler=_clawnch_metadata,
         ),
@@ -501,6 +511,7 @@ def get_tools() -> List[Tool]:
             name="clawnch_balance",
             description="Check $CLAWNCH token balance of agent wallet on Base.",
             category="token",
+            thread_safe=True,
             params=[],
             handler=_clawnch_balance,
         ),
@@ -508,6 +519,7 @@ def get_tools() -> List[Tool]:
             name="clawnch_check_tx",
             description="Check status of a transaction on Base (confirmed, pending, not_found). Use to verify burn.",
             category="token",
+            thread_safe=True,
             params=[
                 ToolParam("tx_hash", "string", "Transaction hash (0x...)"),
             ],
@@ -542,6 +554,7 @@ def get_tools() -> List[Tool]:
             name="clawnch_build_post",
             description="Build the !clawnch post content string for Moltbook submission.",
             category="token",
+            platform="system", metric_type="reflection",  # builds text, posts nothing
             params=[
                 ToolParam("image_url", "string", "Hosted image URL (from clawnch_upload_image)"),
                 ToolParam("burn_tx_hash", "string", "Burn transaction hash", required=False, default=""),
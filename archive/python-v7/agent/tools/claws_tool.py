@@ -7,20 +7,27 @@ Gives Claude persistent, searchable, semantic memory via the Clawnch API.
 
 import json
 import logging
-from typing import List
+from typing import List, TYPE_CHECKING
+from threading import Lock
 
 from ..tool_registry import Tool, ToolParam
-from ..integrations.claws_memory import ClawsMemory
+
+if TYPE_CHECKING:
+    from ..integrations.claws_memory import ClawsMemory
 
 logger = logging.getLogger("TheConstituent.Tools.CLAWS")
 
-_claws: ClawsMemory = None
+_claws: "ClawsMemory" = None
+_claws_lock = Lock()  # tool calls may run concurrently (Engine._tool_pool)
 
 
-def _get_claws() -> ClawsMemory:
+def _get_claws() -> "ClawsMemory":
     global _claws
     if _claws is None:
-        _claws = ClawsMemory()
+        with _claws_lock:
+            if _claws is None:
+                from ..integrations.claws_memory import ClawsMemory
+                _claws = ClawsMemory()
     return _claws
 
 
@@ -165,8 +165,10 @@ def get_tools(workspace_dir: Path) -> List[Tool]:
 
     return [
         Tool(name="constitution_status", description="Show Constitution progress (titles done, articles written).", category="constitution",
+             thread_safe=True,
              params=[], handler=lambda: _constitution_status(ws)),
         Tool(name="constitution_next", description="Show the next title/articles to write.", category="constitution",
+             thread_safe=True,
              params=[], handler=lambda: _constitution_next_todo(ws)),
         Tool(name="constitution_mark_done", description="Mark a title as completed.", category="constitution",
              params=[ToolParam("title", "string", "Title to mark complete (e.g., 'Title II')")],
@@ -9,7 +9,7 @@ import json
 import time
 import logging
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 from ..tool_registry import Tool, ToolParam
 
@@ -18,13 +18,32 @@ logger = logging.getLogger("TheConstituent.Tools.Cron")
 CRON_FILE = Path("data/cron_jobs.json")
 
 
-def _load_jobs() -> List[Dict]:
-    if CRON_FILE.exists():
+# Parsed CRON_FILE keyed by its (st_mtime_ns, st_size): (key, jobs, enabled jobs by next_run_at)
+_jobs_cache: Tuple[Optional[Tuple[int, int]], List[Dict], List[Dict]] = (None, [], [])
+
+
+def _cached_jobs() -> Tuple[List[Dict], List[Dict]]:
+    """(all jobs, enabled jobs sorted by next_run_at); re-parsed only when the file changes."""
+    global _jobs_cache
+    try:
+        st = CRON_FILE.stat()
+    except OSError:
+        return [], []
+    key = (st.st_mtime_ns, st.st_size)
+    if key != _jobs_cache[0]:
         try:
-            return json.loads(CRON_FILE.read_text())
+            jobs = json.loads(CRON_FILE.read_text())
         except Exception:
-            return []
-    return []
+            jobs = []
+        enabled = sorted((j for j in jobs if j.get("enabled")),
+                         key=lambda j: j.get("next_run_at", 0))
+        _jobs_cache = (key, jobs, enabled)
+    return _jobs_cache[1], _jobs_cache[2]
+
+
+def _load_jobs() -> List[Dict]:
+    # Copies: callers edit jobs in place before _save_jobs()
+    return [dict(j) for j in _cached_jobs()[0]]
 
 
 def _save_jobs(jobs: List[Dict]):
@@ -90,16 +109,13 @@ def _cron_toggle(name: str, enabled: bool) -> str:
 
 
 def _get_due_jobs() -> List[Dict]:
-    """Get jobs that are due to run now."""
-    jobs = _load_jobs()
+    """Get jobs that are due to run now, most overdue first."""
     now = time.time()
     due = []
-    for j in jobs:
-        if not j.get("enabled"):
-            continue
-        next_run = j.get("next_run_at", 0)
-        if now >= next_run:
-            due.append(j)
+    for j in _cached_jobs()[1]:
+        if j.get("next_run_at", 0) > now:
+            break
+        due.append(dict(j))
     return due
 
 
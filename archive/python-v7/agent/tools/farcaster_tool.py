@@ -13,27 +13,33 @@ of its social engagement strategy across Farcaster channels like
 import os
 import json
 import logging
-from typing import List
+from typing import List, TYPE_CHECKING
+from threading import Lock
 
 from ..tool_registry import Tool, ToolParam
-from ..integrations.farcaster import FarcasterIntegration
+
+if TYPE_CHECKING:
+    from ..integrations.farcaster import FarcasterIntegration
 
 logger = logging.getLogger("TheConstituent.Tools.Farcaster")
 
-_farcaster: FarcasterIntegration = None
+_farcaster: "FarcasterIntegration" = None
+_farcaster_lock = Lock()  # tool calls may run concurrently (Engine._tool_pool)
 
 
-def _get_farcaster() -> FarcasterIntegration:
+def _get_farcaster() -> "FarcasterIntegration":
     """Get or create the singleton FarcasterIntegration instance.
 
     Re-creates the instance if not connected, so env var changes
     (e.g. adding NEYNAR_API_KEY to .env) take effect without restart.
     """
     global _farcaster
-    if _farcaster is None or not _farcaster.is_connected():
-        _farcaster = FarcasterIntegration()
-        _farcaster.connect()
-    return _farcaster
+    with _farcaster_lock:
+        if _farcaster is None or not _farcaster.is_connected():
+            from ..integrations.farcaster import FarcasterIntegration
+            _farcaster = FarcasterIntegration()
+            _farcaster.connect()
+        return _farcaster
 
 
 def _farcaster_status() -> str:
@@ -192,6 +198,7 @@ def get_tools() -> List[Tool]:
             name="farcaster_status",
             description="Diagnostic: check Farcaster connection status, env vars, and configuration. Use this to debug connection issues.",
             category="social",
+            thread_safe=True,
             governance_level="L1",
             params=[],
             handler=lambda: _farcaster_status(),
@@ -200,6 +207,7 @@ def get_tools() -> List[Tool]:
             name="farcaster_post",
             description="Post a cast on Farcaster (decentralized social protocol). Supports channel targeting.",
             category="social",
+            platform="farcaster",
             governance_level="L1",
             params=[
                 ToolParam("text", "string", "Cast text (max 1024 chars)"),
@@ -215,6 +223,7 @@ def get_tools() -> List[Tool]:
             name="farcaster_reply",
             description="Reply to a Farcaster cast by its hash.",
             category="social",
+            platform="farcaster",
             governance_level="L1",
             params=[
                 ToolParam("parent_hash", "string", "Hash of the cast to reply to (0x...)"),
@@ -226,6 +235,7 @@ def get_tools() -> List[Tool]:
             name="farcaster_feed",
             description="Read the Farcaster following feed (recent casts from followed accounts).",
             category="social",
+            thread_safe=True,
             governance_level="L1",
             params=[
                 ToolParam("limit", "integer", "Number of casts to fetch (default 10, max 100)", required=False, default=10),
@@ -236,6 +246,7 @@ def get_tools() -> List[Tool]:
             name="farcaster_like",
             description="Like a cast on Farcaster.",
             category="social",
+            platform="farcaster", metric_type="upvote",
             governance_level="L1",
             params=[
                 ToolParam("cast_hash", "string", "Hash of the cast to like (0x...)"),
@@ -246,6 +257,7 @@ def get_tools() -> List[Tool]:
             name="farcaster_search",
             description="Search for users or casts on Farcaster.",
             category="social",
+            thread_safe=True,
             governance_level="L1",
             params=[
                 ToolParam("query", "string", "Search query (username, display name, or cast text)"),
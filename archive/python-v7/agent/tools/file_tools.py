@@ -128,6 +128,7 @@ def get_tools(workspace_dir: Path) -> List[Tool]:
             name="file_read",
             description="Read a file's contents. Supports line ranges.",
             category="files",
+            thread_safe=True,
             params=[
                 ToolParam("path", "string", "File path relative to workspace"),
                 ToolParam("line_start", "integer", "Start line (1-indexed, 0=all)", required=False, default=0),
@@ -160,6 +161,7 @@ def get_tools(workspace_dir: Path) -> List[Tool]:
             name="file_grep",
             description="Search for a pattern in files (recursive).",
             category="files",
+            thread_safe=True,
             params=[
                 ToolParam("pattern", "string", "Search pattern (regex or plain text)"),
                 ToolParam("path", "string", "Directory to search (default: workspace root)", required=False, default="."),
@@ -170,6 +172,7 @@ def get_tools(workspace_dir: Path) -> List[Tool]:
             name="file_list",
             description="List directory contents with file sizes.",
             category="files",
+            thread_safe=True,
             params=[
                 ToolParam("path", "string", "Directory path (default: workspace root)", required=False, default="."),
             ],
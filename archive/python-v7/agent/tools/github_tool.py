@@ -78,6 +78,7 @@ def get_tools() -> List[Tool]:
              params=[ToolParam("title", "string", "Issue title"), ToolParam("body", "string", "Issue body")],
              handler=_github_create_issue),
         Tool(name="github_list_issues", description="List GitHub issues.", category="github",
+             thread_safe=True,
              params=[ToolParam("state", "string", "open/closed/all", required=False, default="open")],
              handler=lambda state="open": _github_list_issues(state)),
         Tool(name="github_create_pr", description="Create a pull request.", category="github",
@@ -86,5 +87,6 @@ def get_tools() -> List[Tool]:
                      ToolParam("branch", "string", "Source branch", required=False, default="")],
              handler=_github_create_pr),
         Tool(name="github_list_prs", description="List open pull requests.", category="github",
+             thread_safe=True,
              params=[], handler=_github_list_prs),
     ]
@@ -156,6 +156,7 @@ def get_tools() -> List[Tool]:
             name="governance_status",
             description="Show on-chain governance status: proposals, quorum, voting parameters.",
             category="governance",
+            thread_safe=True,
             governance_level="L1",
             params=[],
             handler=lambda: _governance_status(),
@@ -164,6 +165,7 @@ def get_tools() -> List[Tool]:
             name="governance_list_proposals",
             description="List governance proposals. Optionally filter by state (Active, Pending, Defeated, etc.).",
             category="governance",
+            thread_safe=True,
             governance_level="L1",
             params=[
                 ToolParam("state", "string", "Filter by proposal state", required=False, default=""),
@@ -198,6 +200,7 @@ def get_tools() -> List[Tool]:
             name="governance_voting_power",
             description="Check the voting power of a wallet address.",
             category="governance",
+            thread_safe=True,
             governance_level="L1",
             params=[
                 ToolParam("address", "string", "The wallet address to check"),
@@ -30,14 +30,23 @@ def _ensure_dir(workspace: Path):
     (workspace / "memory" / "knowledge").mkdir(parents=True, exist_ok=True)
 
 
+def _search_targets(workspace: Path):
+    """(label, path) pairs to search: named memory files, then every knowledge file."""
+    targets = [(name, workspace / rel_path) for name, rel_path in MEMORY_FILES.items()]
+    named = {fp for _, fp in targets}
+    for fp in sorted((workspace / MEMORY_DIR / "knowledge").glob("*.md")):
+        if fp not in named:
+            targets.append((f"knowledge/{fp.stem}", fp))
+    return targets
+
+
 def _memory_search(workspace: Path, query: str, max_results: int = 20) -> str:
-    """Search across all memory files for a query."""
+    """Search across all memory and knowledge files for a query."""
     _ensure_dir(workspace)
     results = []
     terms = query.lower().split()
 
-    for name, rel_path in MEMORY_FILES.items():
-        fp = workspace / rel_path
+    for name, fp in _search_targets(workspace):
         if not fp.exists():
             continue
         lines = fp.read_text(encoding="utf-8", errors="replace").splitlines()
@@ -115,8 +124,9 @@ def get_tools(workspace_dir: Path) -> List[Tool]:
     return [
         Tool(
             name="memory_search",
-            description="Search across all memory files for information.",
+            description="Search across all memory and knowledge files (memory/knowledge/*.md) for information.",
             category="memory",
+            thread_safe=True,
             params=[
                 ToolParam("query", "string", "Search query"),
                 ToolParam("max_results", "integer", "Max results", required=False, default=20),
@@ -137,6 +147,7 @@ def get_tools(workspace_dir: Path) -> List[Tool]:
             name="memory_get",
             description="Read a memory file. Optionally specify line range.",
             category="memory",
+            thread_safe=True,
             params=[
                 ToolParam("category", "string", "Memory category"),
                 ToolParam("line_start", "integer", "Start line (0=all)", required=False, default=0),
@@ -148,6 +159,7 @@ def get_tools(workspace_dir: Path) -> List[Tool]:
             name="memory_list",
             description="List all memory files with sizes.",
             category="memory",
+            thread_safe=True,
             params=[],
             handler=lambda: _memory_list(ws),
         ),
@@ -6,20 +6,27 @@ Wraps existing MoltbookOperations as tools for the engine.
 
 import json
 import logging
-from typing import List
+from typing import List, TYPE_CHECKING
+from threading import Lock
 
 from ..tool_registry import Tool, ToolParam
-from ..moltbook_ops import MoltbookOperations
+
+if TYPE_CHECKING:
+    from ..moltbook_ops import MoltbookOperations
 
 logger = logging.getLogger("TheConstituent.Tools.Moltbook")
 
-_moltbook: MoltbookOperations = None
+_moltbook: "MoltbookOperations" = None
+_moltbook_lock = Lock()  # tool calls may run concurrently (Engine._tool_pool)
 
 
-def _get_moltbook() -> MoltbookOperations:
+def _get_moltbook() -> "MoltbookOperations":
     global _moltbook
     if _moltbook is None:
-        _moltbook = MoltbookOperations()
+        with _moltbook_lock:
+            if _moltbook is None:
+                from ..moltbook_ops import MoltbookOperations
+                _moltbook = MoltbookOperations()
     return _moltbook
 
 
@@ -174,6 +181,7 @@ def get_tools() -> List[Tool]:
             name="moltbook_feed",
             description="Read the Moltbook feed (latest posts from all agents).",
             category="social",
+            thread_safe=True,
             params=[
                 ToolParam("limit", "integer", "Number of posts to fetch", required=False, default=10),
             ],
@@ -183,6 +191,8 @@ def get_tools() -> List[Tool]:
             name="moltbook_get_post",
             description="Get a specific Moltbook post with all comments.",
             category="social",
+            thread_safe=True,
+            metric_type="reflection",  # read-only despite "post" in the name
             params=[
                 ToolParam("post_id", "string", "Post ID"),
             ],
@@ -5,6 +5,7 @@ Spawn isolated sub-agents for heavy tasks.
 Inspired by OpenClaw sessions_spawn / subagent-registry.
 """
 
+import asyncio
 import logging
 from typing import List
 
@@ -36,6 +37,56 @@ def _spawn_subagent(claude_client, model: str, task: str, system_prompt: str = "
         return f"Subagent error: {e}"
 
 
+MAX_PARALLEL_SUBAGENTS = 5
+TASK_SEPARATOR = "---"
+
+
+async def _run_subagents(api_key: str, model: str, tasks: List[str], system_prompt: str,
+                         max_tokens: int) -> List[str]:
+    """Run one sub-agent per task concurrently on an AsyncAnthropic client."""
+    from anthropic import AsyncAnthropic
+
+    async with AsyncAnthropic(api_key=api_key) as client:
+        async def one(task: str) -> str:
+            try:
+                response = await client.messages.create(
+                    model=model,
+                    max_tokens=max_tokens,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": task}],
+                )
+                return response.content[0].text
+            except Exception as e:
+                return f"Subagent error: {e}"
+
+        return await asyncio.gather(*(one(t) for t in tasks))
+
+
+def _spawn_subagents(claude_client, model: str, tasks: str, system_prompt: str = "",
+                     max_tokens: int = 4000) -> str:
+    """
+    Spawn up to MAX_PARALLEL_SUBAGENTS sub-agents at once.
+
+    tasks: one task per block, blocks separated by a line containing only '---'.
+    Wall time is the slowest task rather than the sum of all of them.
+    """
+    task_list = [t.strip() for t in tasks.split(f"\n{TASK_SEPARATOR}\n") if t.strip()]
+    if not task_list:
+        return "Subagent error: no tasks given"
+    if len(task_list) > MAX_PARALLEL_SUBAGENTS:
+        return f"Subagent error: at most {MAX_PARALLEL_SUBAGENTS} tasks per call (got {len(task_list)})"
+
+    system = system_prompt or (
+        "You are a specialized sub-agent working for The Constituent (The Agents Republic). "
+        "Complete the assigned task thoroughly and concisely. "
+        "Do not add preamble or philosophical commentary. Just do the work."
+    )
+    # Tool handlers run in worker threads, so there is no running loop to reuse
+    results = asyncio.run(_run_subagents(claude_client.api_key, model, task_list, system, max_tokens))
+    logger.info(f"Parallel subagents completed: {len(task_list)} tasks")
+    return "\n\n".join(f"### Task {i}\n{r}" for i, r in enumerate(results, 1))
+
+
 def get_tools(claude_client, model: str) -> List[Tool]:
     return [
         Tool(
@@ -65,6 +116,19 @@ def get_tools(claude_client, model: str) -> List[Tool]:
                 max_tokens=8000,
             ),
         ),
+        Tool(
+            name="subagent_parallel",
+            description=f"Run up to {MAX_PARALLEL_SUBAGENTS} independent sub-agent tasks concurrently. "
+                        f"Separate tasks with a line containing only '{TASK_SEPARATOR}'.",
+            category="agents",
+            params=[
+                ToolParam("tasks", "string", f"Task descriptions separated by '{TASK_SEPARATOR}' lines"),
+                ToolParam("system_prompt", "string", "Optional shared system prompt", required=False, default=""),
+            ],
+            handler=lambda tasks, system_prompt="": _spawn_subagents(
+                claude_client, model, tasks, system_prompt,
+            ),
+        ),
         Tool(
             name="subagent_translate",
             description="Spawn a sub-agent to translate content between languages.",
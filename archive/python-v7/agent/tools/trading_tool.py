@@ -10,38 +10,47 @@ Governance levels:
 
 import logging
 from typing import List
+from threading import RLock
 
 from ..tool_registry import Tool, ToolParam
 
 logger = logging.getLogger("TheConstituent.Tools.Trading")
 
-# Singletons (initialized on first use)
+# Singletons (initialized on first use). Re-entrant lock: _get_mm() builds the
+# trader too, and tool calls may run concurrently (Engine._tool_pool).
 _trader = None
 _scout = None
 _mm = None
+_init_lock = RLock()
 
 
 def _get_trader():
     global _trader
     if _trader is None:
-        from ..integrations.defi_trader import DeFiTrader
-        _trader = DeFiTrader()
+        with _init_lock:
+            if _trader is None:
+                from ..integrations.defi_trader import DeFiTrader
+                _trader = DeFiTrader()
     return _trader
 
 
 def _get_scout():
     global _scout
     if _scout is None:
-        from ..integrations.clawnch_scout import ClawnchScout
-        _scout = ClawnchScout()
+        with _init_lock:
+            if _scout is None:
+                from ..integrations.clawnch_scout import ClawnchScout
+                _scout = ClawnchScout()
     return _scout
 
 
 def _get_mm():
     global _mm
     if _mm is None:
-        from ..integrations.market_maker import MarketMaker
-        _mm = MarketMaker(trader=_get_trader())
+        with _init_lock:
+            if _mm is None:
+                from ..integrations.market_maker import MarketMaker
+                _mm = MarketMaker(trader=_get_trader())
     return _mm
 
 
@@ -300,6 +309,7 @@ def get_tools() -> List[Tool]:
             name="trading_portfolio",
             description="Get full portfolio status: balances, positions, P&L, risk status.",
             category="trading",
+            thread_safe=True,
             governance_level="L1",
             params=[],
             handler=_portfolio_status,
@@ -316,6 +326,7 @@ def get_tools() -> List[Tool]:
             name="trading_history",
             description="Get recent trade history.",
             category="trading",
+            thread_safe=True,
             governance_level="L1",
             params=[
                 ToolParam("limit", "integer", "Number of trades to show (default 10)", required=False, default=10),
@@ -328,6 +339,7 @@ def get_tools() -> List[Tool]:
             name="trading_quote",
             description="Get a DEX price quote for a token pair on Base L2.",
             category="trading",
+            thread_safe=True,
             governance_level="L1",
             params=[
                 ToolParam("token_in", "string", "Input token address"),
@@ -340,6 +352,7 @@ def get_tools() -> List[Tool]:
             name="republic_price",
             description="Get current $REPUBLIC token price in $CLAWNCH terms.",
             category="trading",
+            thread_safe=True,
             governance_level="L1",
             params=[],
             handler=_republic_price,
@@ -358,6 +371,7 @@ def get_tools() -> List[Tool]:
             name="scout_report",
             description="Get full Clawnch scout report with all tracked tokens and scores.",
             category="trading",
+            thread_safe=True,
             governance_level="L1",
             params=[],
             handler=_scout_report,
@@ -415,6 +429,7 @@ def get_tools() -> List[Tool]:
             name="mm_status",
             description="Get $REPUBLIC market maker status report.",
             category="trading",
+            thread_safe=True,
             governance_level="L1",
             params=[],
             handler=_mm_status,
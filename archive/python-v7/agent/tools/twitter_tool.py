@@ -5,20 +5,27 @@ Wraps Twitter/X operations. L2 governance (approval needed).
 """
 
 import logging
-from typing import List
+from typing import List, TYPE_CHECKING
+from threading import Lock
 
 from ..tool_registry import Tool, ToolParam
-from ..twitter_ops import TwitterOperations
+
+if TYPE_CHECKING:
+    from ..twitter_ops import TwitterOperations
 
 logger = logging.getLogger("TheConstituent.Tools.Twitter")
 
-_twitter: TwitterOperations = None
+_twitter: "TwitterOperations" = None
+_twitter_lock = Lock()  # tool calls may run concurrently (Engine._tool_pool)
 
 
-def _get_twitter() -> TwitterOperations:
+def _get_twitter() -> "TwitterOperations":
     global _twitter
     if _twitter is None:
-        _twitter = TwitterOperations()
+        with _twitter_lock:
+            if _twitter is None:
+                from ..twitter_ops import TwitterOperations  # deferred: loads tweepy
+                _twitter = TwitterOperations()
     return _twitter
 
 
@@ -56,6 +63,7 @@ def get_tools() -> List[Tool]:
             name="twitter_status",
             description="Check Twitter connection status.",
             category="social",
+            thread_safe=True,
             params=[],
             handler=_tweet_status,
         ),
@@ -172,6 +172,7 @@ def get_tools() -> List[Tool]:
             name="web_search",
             description="Search the web. Returns titles, URLs, and descriptions.",
             category="web",
+            thread_safe=True,
             params=[
                 ToolParam("query", "string", "Search query (1-6 words work best)"),
                 ToolParam("count", "integer", "Number of results (1-10)", required=False, default=5),
@@ -182,6 +183,7 @@ def get_tools() -> List[Tool]:
             name="web_fetch",
             description="Fetch and extract readable text from a URL.",
             category="web",
+            thread_safe=True,
             params=[
                 ToolParam("url", "string", "URL to fetch"),
                 ToolParam("max_chars", "integer", "Max characters to return", required=False, default=30000),
@@ -97,16 +97,18 @@ class TwitterOperations:
         """Save tweets to disk."""
         try:
             # Save pending tweets with next_id
+            pending = json.dumps({
+                "tweets": self._pending_tweets,
+                "next_id": self._next_id,
+                "updated_at": datetime.utcnow().isoformat()
+            }, indent=2)
             with open(self.PENDING_FILE, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "tweets": self._pending_tweets,
-                    "next_id": self._next_id,
-                    "updated_at": datetime.utcnow().isoformat()
-                }, f, indent=2)
+                f.write(pending)
 
             # Save posted tweets
+            posted = json.dumps(self._posted_tweets, indent=2)
             with open(self.POSTED_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self._posted_tweets, f, indent=2)
+                f.write(posted)
 
             logger.debug("Tweets saved to disk")
 
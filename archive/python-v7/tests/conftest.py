@@ -6,11 +6,23 @@ import json
 import pytest
 from pathlib import Path
 
+from agent.metrics_tracker import MetricsTracker
 from agent.tool_registry import Tool, ToolParam, ToolRegistry
 from agent.governance.proposals import ProposalManager
 from agent.governance.treasury import TreasuryManager
 
 
+# ---------------------------------------------------------------------------
+# Keep test runs out of the real data/ directory
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def _isolated_metrics_log(tmp_path, monkeypatch):
+    """Point MetricsTracker at a per-test directory instead of <repo>/data."""
+    monkeypatch.setattr(MetricsTracker, "DATA_DIR", tmp_path / "metrics")
+    monkeypatch.setattr(MetricsTracker, "DAILY_LOG_FILE", tmp_path / "metrics" / "daily_metrics.json")
+
+
 # ---------------------------------------------------------------------------
 # Tool Registry fixtures
 # ---------------------------------------------------------------------------
@@ -0,0 +1,127 @@
+"""
+Tests for agent.autonomy_loop (AutonomyLoop engagement + constitution helpers).
+"""
+
+import asyncio
+import json
+import pytest
+
+from agent.autonomy_loop import AutonomyLoop, ARTICLES_TOTAL
+
+
+class _FakeMoltbook:
+    def __init__(self, comments):
+        self.comments = comments
+        self.posted = []
+
+    def is_connected(self):
+        return True
+
+    def get_post_with_comments(self, post_id):
+        return {"id": post_id, "comments": self.comments}
+
+    def get_feed(self, sort, limit):
+        return []
+
+    def create_comment(self, post_id, content, parent_id=None):
+        self.posted.append((post_id, content, parent_id))
+        return {"success": True}
+
+
+class _FakeAgent:
+    def __init__(self, comments=()):
+        self.moltbook = _FakeMoltbook(list(comments))
+
+    def think(self, prompt, max_tokens):
+        return "Thanks for the thoughtful comment! What would you change?"
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run AutonomyLoop against relative data/ and constitution/ dirs in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+# ===================================================================
+# Classifiers
+# ===================================================================
+
+class TestClassifiers:
+    def test_trivial_reply_rejected(self):
+        assert AutonomyLoop._substantive("  thanks  ") is False
+
+    def test_short_reply_rejected(self):
+        assert AutonomyLoop._substantive("ok sure") is False
+
+    def test_substantive_reply_accepted(self):
+        assert AutonomyLoop._substantive("How would voting quorums work here?") is True
+
+    def test_aligned_substring_case_insensitive(self):
+        assert AutonomyLoop._aligned_text("Decentralized DAOs", "") is True
+
+    def test_not_aligned(self):
+        assert AutonomyLoop._aligned_text("Cat pictures", "cute") is False
+
+
+# ===================================================================
+# Processed-comment persistence
+# ===================================================================
+
+class TestProcessedComments:
+    def test_lazy_load(self, workdir):
+        loop = AutonomyLoop(_FakeAgent())
+        assert "_processed_comments" not in loop.__dict__
+        assert loop._processed_comments == set()
+
+    def test_engagement_appends_jsonl(self, workdir):
+        comments = [{"id": 1, "content": "What does Article 7 mean for agents?", "author": "bob"},
+                    {"id": 2, "content": "agree"}]
+        agent = _FakeAgent(comments)
+        loop = AutonomyLoop(agent)
+        loop.register_post("p1", "Draft")
+        stats = asyncio.run(loop._do_engagement())
+        assert stats["new_comments"] == 2
+        assert stats["responses"] == 1
+        assert agent.moltbook.posted[0][2] == "1"
+
+        lines = (workdir / "data" / "processed_comments.jsonl").read_text().splitlines()
+        assert sorted(json.loads(l) for l in lines) == ["1", "2"]
+
+        # A fresh instance sees them as processed
+        again = AutonomyLoop(agent)
+        assert asyncio.run(again._do_engagement())["new_comments"] == 0
+
+    def test_legacy_json_migrated(self, workdir):
+        data = workdir / "data"
+        data.mkdir()
+        (data / "processed_comments.json").write_text(json.dumps({"ids": ["a", "b"], "count": 2}))
+        loop = AutonomyLoop(_FakeAgent())
+        assert loop._processed_comments == {"a", "b"}
+        assert (data / "processed_comments.jsonl").exists()
+
+    def test_torn_line_ignored(self, workdir):
+        data = workdir / "data"
+        data.mkdir()
+        (data / "processed_comments.jsonl").write_text('"a"\n"b"\n"c')
+        assert AutonomyLoop(_FakeAgent())._processed_comments == {"a", "b"}
+
+
+# ===================================================================
+# Constitution queue
+# ===================================================================
+
+class TestPendingArticles:
+    def test_existing_file_skipped(self, workdir):
+        d = workdir / "constitution" / "02_TITLE_II_RIGHTS_DUTIES"
+        d.mkdir(parents=True)
+        (d / "ARTICLE_07.md").write_text("# Article 7")
+        loop = AutonomyLoop(_FakeAgent())
+        assert loop._next_article().startswith("Article 8")
+        assert loop.get_status()["constitution_progress"] == f"1/{ARTICLES_TOTAL}"
+
+    def test_progress_marks_done(self, workdir):
+        loop = AutonomyLoop(_FakeAgent())
+        first = loop._next_article()
+        loop._constitution_progress["articles_written"].append(first)
+        assert loop._next_article() != first
@@ -0,0 +1,108 @@
+"""
+Tests for agent.batch_queue (BatchQueue).
+"""
+
+from types import SimpleNamespace as NS
+
+from agent.batch_queue import BatchQueue
+
+
+class _FakeBatches:
+    def __init__(self):
+        self.created = []
+        self.status = "in_progress"
+
+    def create(self, requests):
+        self.created.append(requests)
+        return NS(id=f"batch-{len(self.created)}")
+
+    def retrieve(self, batch_id):
+        return NS(id=batch_id, processing_status=self.status)
+
+    def results(self, batch_id):
+        reqs = self.created[int(batch_id.split("-")[1]) - 1]
+        out = []
+        for i, r in enumerate(reqs):
+            if i == 0:
+                msg = NS(content=[NS(text=f"answer to {r['params']['messages'][0]['content']}")])
+                out.append(NS(custom_id=r["custom_id"], result=NS(type="succeeded", message=msg)))
+            else:
+                out.append(NS(custom_id=r["custom_id"], result=NS(type="errored")))
+        return out
+
+
+def _client():
+    return NS(messages=NS(batches=_FakeBatches()))
+
+
+def _params(prompt):
+    return {"model": "m", "max_tokens": 10, "messages": [{"role": "user", "content": prompt}]}
+
+
+class TestBatchQueue:
+    def test_not_due_until_threshold(self):
+        q = BatchQueue(_client(), max_items=2, max_wait_seconds=3600)
+        q.add(_params("a"), lambda t: None)
+        assert q.due() is False
+        q.add(_params("b"), lambda t: None)
+        assert q.due() is True
+
+    def test_age_threshold(self):
+        q = BatchQueue(_client(), max_items=100, max_wait_seconds=0)
+        q.add(_params("a"), lambda t: None)
+        assert q.due() is True
+
+    def test_pump_submits_then_dispatches(self):
+        client = _client()
+        submitted = []
+        got = {}
+        q = BatchQueue(client, max_items=2, on_submit=submitted.append)
+        q.add(_params("a"), lambda t: got.setdefault("a", t))
+        q.add(_params("b"), lambda t: got.setdefault("b", t))
+
+        r = q.pump()
+        assert r["submitted"] == "batch-1"
+        assert r["results"] == 0  # still processing
+        assert submitted == [2]
+        assert len(client.messages.batches.created[0]) == 2
+
+        client.messages.batches.status = "ended"
+        r = q.pump()
+        assert r["results"] == 2
+        assert got["a"] == "answer to a"
+        assert got["b"].startswith("Error")
+        assert q.get_status()["in_flight_batches"] == 0
+
+    def test_submit_failure_reports_to_callbacks(self):
+        client = _client()
+
+        def boom(requests):
+            raise RuntimeError("down")
+        client.messages.batches.create = boom
+        got = []
+        q = BatchQueue(client, max_items=1)
+        q.add(_params("a"), got.append)
+        assert q.pump()["submitted"] is None
+        assert got and got[0].startswith("Error")
+
+    def test_empty_content_resolves_as_error(self):
+        client = _client()
+        batches = client.messages.batches
+
+        def results(batch_id):
+            reqs = batches.created[0]
+            empty = NS(content=[], stop_reason="refusal")
+            ok = NS(content=[NS(text="fine")])
+            return [NS(custom_id=reqs[0]["custom_id"], result=NS(type="succeeded", message=empty)),
+                    NS(custom_id=reqs[1]["custom_id"], result=NS(type="succeeded", message=ok))]
+        batches.results = results
+        got = {}
+        q = BatchQueue(client, max_items=2)
+        q.add(_params("a"), lambda t: got.setdefault("a", t))
+        q.add(_params("b"), lambda t: got.setdefault("b", t))
+        q.pump()
+        batches.status = "ended"
+        assert q.pump()["results"] == 2
+        assert got["a"].startswith("Error") and "refusal" in got["a"]
+        assert got["b"] == "fine"
+        assert q.get_status()["in_flight_batches"] == 0
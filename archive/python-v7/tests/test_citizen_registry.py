@@ -0,0 +1,103 @@
+"""
+Tests for agent.integrations.citizen_registry (CitizenRegistry).
+"""
+
+import sqlite3
+import threading
+
+from agent.integrations.citizen_registry import Citizen, CitizenRegistry
+
+
+class TestCitizenRegistry:
+    def test_register_and_get(self, tmp_path):
+        reg = CitizenRegistry(str(tmp_path / "r.db"))
+        citizen = Citizen("alice", "Alice", "human", platform_ids={"twitter": "@alice"},
+                          metadata={1: "a"})
+        assert reg.register_citizen(citizen)["status"] == "registered"
+        got = reg.get_citizen("alice")
+        assert got["platform_ids"] == {"twitter": "@alice"}
+        assert got["metadata"] == {"1": "a"}  # non-str keys are stored as strings
+        assert reg.get_citizen("nobody") is None
+
+    def test_platform_handles_keep_their_type(self, tmp_path):
+        reg = CitizenRegistry(str(tmp_path / "r.db"))
+        reg.register_citizen(Citizen("bot", "Bot", "agent", contribution_score=99.5,
+                                     platform_ids={"farcaster": 5, "twitter": "@bot"}))
+        assert reg.get_platforms("bot") == {"farcaster": 5, "twitter": "@bot"}
+        assert reg.get_citizen("bot")["platform_ids"] == {"farcaster": 5, "twitter": "@bot"}
+        listed = reg.list_citizens(citizen_type="agent", limit=1)
+        assert listed[0]["platform_ids"] is None
+        listed = reg.list_citizens(citizen_type="agent", limit=1, platforms=True)
+        assert listed[0]["platform_ids"] == {"farcaster": 5, "twitter": "@bot"}
+
+    def test_platform_handles_round_trip_any_json_value(self, tmp_path):
+        reg = CitizenRegistry(str(tmp_path / "r.db"))
+        handles = {"a": None, "b": True, "c": 1.5, "d": {"fid": 7, "tags": ["x"]}}
+        reg.register_citizen(Citizen("odd", "Odd", "agent", wallet_address="0xodd",
+                                     platform_ids=handles))
+        assert reg.get_platforms("odd") == handles
+        assert reg.find_citizen_by_wallet("0xodd")["platform_ids"] == handles
+        assert reg.get_platforms("nobody") == {}
+
+    def test_census_sees_other_process_writes(self, tmp_path):
+        db = tmp_path / "r.db"
+        reg = CitizenRegistry(str(db))
+        before = reg.get_census()["total_active"]
+        # A separate connection stands in for another process
+        other = sqlite3.connect(db)
+        with other:
+            other.execute("UPDATE citizens SET status = 'suspended' WHERE citizen_id = 'claude-opus'")
+        other.close()
+        assert reg.get_census()["total_active"] == before - 1
+
+    def test_lookup_sees_registration_from_other_thread(self, tmp_path):
+        db = str(tmp_path / "r.db")
+        reg = CitizenRegistry(db)
+        assert reg.get_citizen("bob") is None  # loads the known-id set
+
+        def register():
+            CitizenRegistry(db).register_citizen(Citizen("bob", "Bob", "human"))
+            found.append(CitizenRegistry(db).get_citizen("bob") is not None)
+
+        found = []
+        worker = threading.Thread(target=register)
+        worker.start()
+        worker.join()
+        assert found == [True]
+        assert reg.get_citizen("bob")["name"] == "Bob"
+
+    def test_concurrent_registrations_are_visible_to_their_writers(self, tmp_path):
+        db = str(tmp_path / "r.db")
+        CitizenRegistry(db)
+        missing = []
+
+        def register(n):
+            reg = CitizenRegistry(db)
+            for i in range(50):
+                citizen_id = f"c{n}-{i}"
+                reg.register_citizen(Citizen(citizen_id, citizen_id, "agent"), skip_event=True)
+                if reg.get_citizen(citizen_id) is None:
+                    missing.append(citizen_id)
+
+        workers = [threading.Thread(target=register, args=(n,)) for n in range(8)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        assert missing == []
+
+    def test_backfills_platforms_from_legacy_json(self, tmp_path):
+        db = tmp_path / "r.db"
+        legacy_schema = CitizenRegistry.DB_SCHEMA.split("CREATE TABLE IF NOT EXISTS citizen_events")[0]
+        conn = sqlite3.connect(db)
+        with conn:
+            conn.executescript(legacy_schema)
+            conn.execute(
+                """INSERT INTO citizens (citizen_id, name, citizen_type, platform_ids,
+                                         joined_at, last_active)
+                   VALUES ('old', 'Old', 'human', '{"twitter": "@old", "moltbook": 1, "x": true, "y": {"k": [1]}}',
+                           '2026-01-01T00:00:00Z', '2026-01-01T00:00:00Z')"""
+            )
+        conn.close()
+        reg = CitizenRegistry(str(db))
+        assert reg.get_platforms("old") == {"twitter": "@old", "moltbook": 1, "x": True, "y": {"k": [1]}}
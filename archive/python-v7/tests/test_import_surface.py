@@ -0,0 +1,53 @@
+"""
+Import-surface regression tests: constructing and initializing the Engine
+must not pull in the platform clients (Moltbook / GitHub / Twitter / Clawnch)
+until they are used.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("anthropic")
+pytest.importorskip("dotenv")
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import sys
+from agent.engine import Engine
+e = Engine()
+if INIT:
+    e.initialize()
+print(",".join(m for m in ("agent.moltbook_ops", "agent.github_ops",
+                           "agent.twitter_ops", "agent.profile_manager",
+                           "agent.integrations.clawnch")
+               if m in sys.modules))
+"""
+
+
+def _loaded_after_init(tmp_path, eager: bool, initialize: bool = False) -> str:
+    env = {"ANTHROPIC_API_KEY": "test", "PYTHONPATH": str(ROOT)}
+    if eager:
+        env["CONSTITUENT_EAGER_IMPORT"] = "1"
+    probe = f"INIT = {initialize}\n{PROBE}"
+    out = subprocess.run([sys.executable, "-c", probe], cwd=tmp_path, env=env,
+                         capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    return out.stdout.strip().splitlines()[-1] if out.stdout.strip() else ""
+
+
+def test_engine_init_is_lazy(tmp_path):
+    assert _loaded_after_init(tmp_path, eager=False) == ""
+
+
+def test_tool_registration_is_lazy(tmp_path):
+    assert _loaded_after_init(tmp_path, eager=False, initialize=True) == ""
+
+
+def test_eager_import_flag(tmp_path):
+    loaded = _loaded_after_init(tmp_path, eager=True)
+    assert "agent.moltbook_ops" in loaded
+    assert "agent.twitter_ops" in loaded
@@ -0,0 +1,52 @@
+"""
+Tests for agent.think_cache (ThinkCache).
+"""
+
+from agent.think_cache import ThinkCache
+
+
+class TestThinkCache:
+    def test_put_then_get(self, tmp_path):
+        cache = ThinkCache(db_path=str(tmp_path / "c.db"))
+        key = ThinkCache.make_key("m", 100, "sys", "prompt")
+        assert cache.get(key) is None
+        cache.put(key, "answer")
+        assert cache.get(key) == "answer"
+        assert cache.get_status()["hits"] == 1
+        assert cache.get_status()["misses"] == 1
+
+    def test_key_depends_on_every_field(self):
+        base = ThinkCache.make_key("m", 100, [{"type": "text", "text": "s"}], "p")
+        assert base == ThinkCache.make_key("m", 100, [{"type": "text", "text": "s"}], "p")
+        assert base != ThinkCache.make_key("m2", 100, [{"type": "text", "text": "s"}], "p")
+        assert base != ThinkCache.make_key("m", 200, [{"type": "text", "text": "s"}], "p")
+        assert base != ThinkCache.make_key("m", 100, [{"type": "text", "text": "t"}], "p")
+        assert base != ThinkCache.make_key("m", 100, [{"type": "text", "text": "s"}], "q")
+
+    def test_expired_entries_miss(self, tmp_path):
+        cache = ThinkCache(db_path=str(tmp_path / "c.db"), ttl_seconds=0)
+        cache.put("k", "answer")
+        assert cache.get("k") is None
+        assert cache.purge_expired() == 1
+
+    def test_reuses_one_connection_across_threads(self, tmp_path):
+        from threading import Thread
+
+        cache = ThinkCache(db_path=str(tmp_path / "c.db"))
+        cache.put("k", "answer")
+        conn = cache._connect()
+        worker = Thread(target=lambda: cache.put("k2", "other"))
+        worker.start()
+        worker.join()
+        assert cache._connect() is conn
+        assert cache.get("k2") == "other"
+        cache.close()
+        assert cache.get("k") == "answer"  # reopens after close
+
+    def test_put_purges_expired_entries_periodically(self, tmp_path):
+        cache = ThinkCache(db_path=str(tmp_path / "c.db"), ttl_seconds=0)
+        cache.PURGE_EVERY_PUTS = 3
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.put("c", "3")  # third put purges everything expired
+        assert cache.purge_expired() == 0
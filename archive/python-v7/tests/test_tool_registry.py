@@ -32,6 +32,10 @@ class TestToolParam:
 # ===================================================================
 
 class TestToolSchema:
+    def test_tools_are_serial_by_default(self, sample_tool):
+        """Only tools that opt in (read-only ones) may run concurrently."""
+        assert sample_tool.thread_safe is False
+
     def test_schema_structure(self, sample_tool):
         """to_schema returns an Anthropic-compatible dict with the expected keys."""
         schema = sample_tool.to_schema()
@@ -146,6 +150,22 @@ class TestToolRegistry:
         assert "dangerous_op" in names
         assert "echo" not in names
 
+    def test_get_tools_summary_cache_invalidated_on_register(self, registry):
+        """The summary is cached, but registering a tool refreshes it."""
+        assert registry.get_tools_summary() is registry.get_tools_summary()
+        registry.register(Tool(name="late", description="Late", handler=lambda: None))
+        assert "late()" in registry.get_tools_summary()
+
+    def test_get_tool_schemas_cache_invalidated_on_register(self, registry):
+        """Schemas are cached, but registering a tool refreshes them."""
+        first = registry.get_tool_schemas()
+        first.pop()  # callers get a copy; the cache is unaffected
+        assert len(registry.get_tool_schemas()) == len(first) + 1
+        version = registry.version
+        registry.register(Tool(name="late", description="Late", handler=lambda: None))
+        assert registry.version == version + 1
+        assert "late" in [s["name"] for s in registry.get_tool_schemas()]
+
     def test_get_tools_summary_contains_categories(self, registry):
         """get_tools_summary includes category headings and tool names."""
         summary = registry.get_tools_summary()
@@ -153,6 +173,16 @@ class TestToolRegistry:
         assert "[UTILITY]" in summary
         assert "echo" in summary
 
+    def test_classify_prefers_declared_tags(self):
+        """classify() uses Tool.platform/metric_type and guesses only what is missing."""
+        reg = ToolRegistry()
+        reg.register(Tool(name="moltbook_get_post", description="Read", metric_type="reflection"))
+        reg.register(Tool(name="farcaster_like", description="Like",
+                          platform="farcaster", metric_type="upvote"))
+        assert reg.classify("moltbook_get_post") == ("moltbook", "reflection")
+        assert reg.classify("farcaster_like") == ("farcaster", "upvote")
+        assert reg.classify("git_commit") == ("github", "commit")  # unregistered: name heuristic
+
 
 # ===================================================================
 # ToolRegistry.execute tests
@@ -0,0 +1,46 @@
+"""
+Tests for agent.tool_result_truncate (truncate_for_claude).
+"""
+
+import json
+
+from agent.tool_result_truncate import truncate_for_claude
+
+
+class TestTruncateForClaude:
+    def test_small_result_unchanged(self):
+        result = {"status": "ok", "result": "hello"}
+        assert truncate_for_claude(result, 100) == json.dumps(result, ensure_ascii=False)
+
+    def test_long_string_keeps_head_and_tail(self):
+        text = "HEAD" + "x" * 5000 + "TAIL"
+        out = truncate_for_claude({"status": "ok", "result": text}, 1000)
+        assert len(out) <= 1000
+        parsed = json.loads(out)
+        assert parsed["result"].startswith("HEAD")
+        assert parsed["result"].endswith("TAIL")
+        assert "chars truncated" in parsed["result"]
+
+    def test_long_list_keeps_ends_as_valid_json(self):
+        out = truncate_for_claude({"status": "ok", "result": list(range(1000))}, 300)
+        parsed = json.loads(out)
+        items = parsed["result"]
+        assert items[0] == 0 and items[-1] == 999
+        omitted = next(i for i in items if isinstance(i, dict))["_omitted"]
+        assert omitted + len(items) - 1 == 1000
+
+    def test_wide_dict_keeps_first_and_last_keys(self):
+        result = {f"key{i}": i for i in range(2000)}
+        out = truncate_for_claude(result, 500)
+        assert len(out) <= 500
+        parsed = json.loads(out)
+        assert parsed["key0"] == 0 and parsed["key1999"] == 1999
+        assert parsed["_omitted"] + len(parsed) - 1 == 2000
+
+    def test_deep_nesting_falls_back_to_text_cut(self):
+        result = "x"
+        for _ in range(300):
+            result = [result]
+        out = truncate_for_claude(result, 100)
+        assert len(out) < 200
+        assert out.startswith("[[[") and out.endswith("]]]")